@@ -2,9 +2,9 @@
 Display management component for handling visualization during painting.
 """
 
+import sys
 import numpy as np
-from typing import Optional
-from utils.pygame_display import PygameDisplayProcess
+from typing import Optional, Union
 from ..config import DisplayConfig
 
 
@@ -26,6 +26,8 @@ class DisplayManager:
         """Initialize display components based on configuration"""
         if self.config.show_pygame:
             try:
+                # pygame is only imported when a window is requested, so headless workers skip it
+                from utils.pygame_display import PygameDisplayProcess
                 self.pygame_display = PygameDisplayProcess(
                     self.canvas_height, 
                     self.canvas_width, 
@@ -36,16 +38,18 @@ class DisplayManager:
                     print(f"Warning: Failed to initialize pygame display: {e}")
                 self.pygame_display = None
     
-    def update_display(self, canvas: np.ndarray):
+    def update_display(self, canvas: np.ndarray, is_snapshot: bool = False):
         """
         Update the pygame display with current canvas state.
         
         Args:
             canvas: Current canvas RGBA array to display
+            is_snapshot: True if canvas is a copy that will not be modified again,
+                         so it can be sent to the display without copying
         """
         if self.pygame_display is not None:
             try:
-                self.pygame_display.update_display(canvas)
+                self.pygame_display.update_display(canvas, copy=not is_snapshot)
             except Exception as e:
                 print(f"Warning: Failed to update pygame display: {e}")
     
@@ -100,15 +104,33 @@ class DisplayManager:
             finally:
                 self.pygame_display = None
     
-    def print_progress(self, message: str):
+    def print_progress(self, message: Union[str, bytes]):
         """
         Print progress message if enabled.
         
         Args:
-            message: Progress message to print
+            message: Progress message to print, or an already encoded line ending in a newline
+                     which is written straight to the stdout buffer
         """
         if self.config.print_progress:
-            print(message)
+            if isinstance(message, bytes):
+                self._write_progress_bytes(message)
+            else:
+                print(message)
+    
+    def _write_progress_bytes(self, message: bytes):
+        """Write an encoded progress line to stdout, skipping str handling in print()"""
+        buffer = getattr(sys.stdout, 'buffer', None)
+        if buffer is None or not getattr(sys.stdout, 'line_buffering', False):
+            # Text-only consoles, and piped or redirected stdout, where later print() output can wait in the
+            # text layer and would end up behind bytes written to the buffer directly
+            print(message.decode(), end='')
+            return
+        # print() on a line buffered stdout has already flushed every full line, so this flush only
+        # writes out a partial line left by an earlier print(end=...) and is otherwise free
+        sys.stdout.flush()
+        buffer.write(message)
+        buffer.flush()
     
     def is_display_active(self) -> bool:
         """
@@ -10,7 +10,8 @@ from utils.rectangle import (
     get_mutated_rectangle_copy,
     get_score_avg_rgb_ymin_and_scanline_xintersect,
     update_canvas_with_best_rect,
-    draw_texture_on_canvas
+    draw_texture_on_canvas,
+    blend_texture_on_canvas
 )
 from utils.utilities import get_num_hill_climb_steps
 from utils.vector_field import VectorField
@@ -26,13 +27,17 @@ if False:
 class ShapeOptimizationResult:
     """Result of optimizing a single shape"""
     def __init__(self, best_rect_list: list, texture_key: int, rgb: np.ndarray, 
-                 score: float, iterations_performed: int, converged: bool):
+                 score: float, iterations_performed: int, converged: bool,
+                 y_min: Optional[int] = None, scanline_x_intersects: Optional[np.ndarray] = None):
         self.best_rect_list = best_rect_list
         self.texture_key = texture_key
         self.rgb = rgb
         self.score = score
         self.iterations_performed = iterations_performed
         self.converged = converged
+        # Scanline data of best_rect_list, reused when drawing the shape onto the canvas
+        self.y_min = y_min
+        self.scanline_x_intersects = scanline_x_intersects
 
 
 class HillClimber:
@@ -45,8 +50,12 @@ class HillClimber:
                  display_manager: Optional['DisplayManager'] = None,
                  output_manager: Optional['OutputManager'] = None,
                  visualization_fps: int = 30,
-                 gif_probability: float = 0.8):
+                 gif_probability: float = 0.8,
+                 rng: Optional[np.random.Generator] = None):
         self.config = config
+        # Per-instance generator: faster than the global np.random state, and seeded from OS
+        # entropy per process, so forked workers do not replay the parent's random stream
+        self.rng = rng if rng is not None else np.random.default_rng()
         self.multiprocessing_enabled = multiprocessing_enabled
         self.display_manager = display_manager
         self.output_manager = output_manager
@@ -60,7 +69,8 @@ class HillClimber:
     
     def optimize_shape(self, target: np.ndarray, texture_key: int, texture_data: Dict[str, Any],
                       canvas: np.ndarray, vector_field: Optional[VectorField], 
-                      shape_index: int) -> ShapeOptimizationResult:
+                      shape_index: int,
+                      scratch: Optional[Tuple[np.ndarray, np.ndarray]] = None) -> ShapeOptimizationResult:
         """
         Optimize placement and properties of a single shape using hill climbing.
         
@@ -71,6 +81,10 @@ class HillClimber:
             canvas: Current canvas state
             vector_field: Optional vector field for guidance
             shape_index: Index of current shape (for iteration scaling)
+            scratch: Optional pair of np.int32 (canvas_height, 2) scanline buffers owned by the caller.
+                     Candidates are scored into them alternately instead of allocating per iteration,
+                     so the result's scanline_x_intersects is a view that is only valid until the
+                     next optimize_shape call with the same scratch and must not be kept.
             
         Returns:
             ShapeOptimizationResult containing optimization results
@@ -86,13 +100,16 @@ class HillClimber:
         # Create initial random rectangle
         best_rect_list = create_random_rectangle(
             canvas_height, canvas_width, texture_height, texture_width,
-            vector_field, self.config.initial_texture_width
+            vector_field, self.config.initial_texture_width, rng=self.rng
         )
         
+        # Best and candidate scanlines live in separate buffers, swapped on every improvement
+        best_buffer, candidate_buffer = scratch if scratch is not None else (None, None)
+        
         # Score the initial rectangle
         highscore, rgb_of_best_rect, y_min_best, scanline_x_intersects_best = \
             get_score_avg_rgb_ymin_and_scanline_xintersect(
-                best_rect_list, target, texture_greyscale_alpha, canvas
+                best_rect_list, target, texture_greyscale_alpha, canvas, best_buffer
             )
         
         # Calculate number of iterations for this shape
@@ -103,9 +120,10 @@ class HillClimber:
         
         # Perform hill climbing optimization
         optimization_result = self._perform_hill_climbing(
-            best_rect_list, highscore, rgb_of_best_rect,
+            best_rect_list, highscore, rgb_of_best_rect, y_min_best, scanline_x_intersects_best,
             target, texture_greyscale_alpha, canvas, vector_field,
-            canvas_height, canvas_width, num_iterations
+            canvas_height, canvas_width, num_iterations,
+            best_buffer, candidate_buffer
         )
         
         return ShapeOptimizationResult(
@@ -114,22 +132,32 @@ class HillClimber:
             rgb=optimization_result['best_rgb'],
             score=optimization_result['best_score'],
             iterations_performed=optimization_result['iterations'],
-            converged=optimization_result['converged']
+            converged=optimization_result['converged'],
+            y_min=optimization_result['best_y_min'],
+            scanline_x_intersects=optimization_result['best_scanline_x_intersects']
         )
     
     def _perform_hill_climbing(self, initial_rect: list, initial_score: float, initial_rgb: np.ndarray,
+                              initial_y_min: int, initial_scanline_x_intersects: np.ndarray,
                               target: np.ndarray, texture_greyscale_alpha: np.ndarray, 
                               canvas: np.ndarray, vector_field: Optional[VectorField],
-                              canvas_height: int, canvas_width: int, max_iterations: int) -> Dict[str, Any]:
+                              canvas_height: int, canvas_width: int, max_iterations: int,
+                              best_buffer: Optional[np.ndarray] = None,
+                              candidate_buffer: Optional[np.ndarray] = None) -> Dict[str, Any]:
         """
         Perform the hill climbing optimization iterations.
         
+        best_buffer holds the initial scanlines; candidate_buffer receives each mutation's scanlines
+        and the two swap roles when a mutation is accepted. Both None allocates per iteration.
+        
         Returns:
             Dictionary containing optimization results
         """
         best_rect_list = initial_rect
         highscore = initial_score
         rgb_of_best_rect = initial_rgb
+        y_min_best = initial_y_min
+        scanline_x_intersects_best = initial_scanline_x_intersects
         fail_count = 0
         iterations_performed = 0
         
@@ -145,13 +173,13 @@ class HillClimber:
             # Mutate the rectangle
             mutated_rect_list = get_mutated_rectangle_copy(
                 best_rect_list, canvas_height, canvas_width, 
-                vector_field, self.config.allow_scaling
+                vector_field, self.config.allow_scaling, rng=self.rng
             )
             
             # Score the mutated rectangle
             new_score, rgb_of_mutated_rect, y_min_mutated, scanline_x_intersects_mutated = \
                 get_score_avg_rgb_ymin_and_scanline_xintersect(
-                    mutated_rect_list, target, texture_greyscale_alpha, canvas
+                    mutated_rect_list, target, texture_greyscale_alpha, canvas, candidate_buffer
                 )
             
             # Update if improvement found
@@ -159,6 +187,9 @@ class HillClimber:
                 highscore = new_score
                 best_rect_list = mutated_rect_list
                 rgb_of_best_rect = rgb_of_mutated_rect
+                y_min_best = y_min_mutated
+                scanline_x_intersects_best = scanline_x_intersects_mutated
+                best_buffer, candidate_buffer = candidate_buffer, best_buffer
                 fail_count = 0  # Reset fail count on improvement
                 
                 # Rate-limited intermediate visualization (configurable FPS for smooth updates)
@@ -167,28 +198,30 @@ class HillClimber:
                 
                 should_update_display = (current_time - self._last_intermediate_update_time) >= self.min_interval
                 
-                # Create intermediate canvas for visualization (if needed)
-                intermediate_canvas = None
-                if should_update_display and ((self.display_manager and self.display_manager.supports_improvements()) or self.output_manager):
+                # Decide who needs the intermediate canvas before paying for a full canvas copy.
+                # Frames that will not be recorded (no GIF, power law skipping, or a lost
+                # probability roll) and no improvement display mean no canvas at all.
+                show_intermediate = (should_update_display and self.display_manager is not None and
+                                     self.display_manager.supports_improvements())
+                record_intermediate = (should_update_display and self.output_manager is not None and
+                                       self.output_manager.should_record_intermediate_frame(self.gif_probability))
+                
+                if show_intermediate or (should_update_display and self.output_manager is not None):
+                    self._last_intermediate_update_time = current_time
+                
+                if show_intermediate or record_intermediate:
                     intermediate_canvas = self.create_intermediate_canvas(
                         canvas, mutated_rect_list, texture_greyscale_alpha, 
                         rgb_of_mutated_rect, y_min_mutated, scanline_x_intersects_mutated
                     )
-                    self._last_intermediate_update_time = current_time
-                
-                # Show intermediate optimization progress if enabled
-                if should_update_display and self.display_manager and self.display_manager.supports_improvements():
-                    self.display_manager.update_intermediate_display(intermediate_canvas)
-                
-                # Record intermediate frames for GIF with configurable probability
-                # Skip intermediate frame recording if power law frame skipping is active
-                should_record_intermediate = (should_update_display and 
-                                            self.output_manager and 
-                                            intermediate_canvas is not None and
-                                            not getattr(self.output_manager, '_skip_intermediate_frames', False))
-                
-                if should_record_intermediate:
-                    self.output_manager.record_intermediate_frame(intermediate_canvas, probability=self.gif_probability)
+                    
+                    # Show intermediate optimization progress if enabled
+                    if show_intermediate:
+                        self.display_manager.update_intermediate_display(intermediate_canvas)
+                    
+                    # Record intermediate frames for GIF, the intermediate canvas is a fresh copy so it is queued as is
+                    if record_intermediate:
+                        self.output_manager.record_frame(intermediate_canvas, is_snapshot=True)
             else:
                 fail_count += 1
         
@@ -196,6 +229,8 @@ class HillClimber:
             'best_rect': best_rect_list,
             'best_rgb': rgb_of_best_rect,
             'best_score': highscore,
+            'best_y_min': y_min_best,
+            'best_scanline_x_intersects': scanline_x_intersects_best,
             'iterations': iterations_performed,
             'converged': self.config.allow_early_termination and fail_count > self.config.fail_threshold
         }
@@ -215,6 +250,18 @@ class HillClimber:
         Returns:
             Updated canvas with shape applied
         """
+        if not np.isfinite(optimization_result.score):
+            # No candidate covered a pixel with the texture, so there is no colour to paint
+            return canvas
+        
+        if optimization_result.scanline_x_intersects is not None:
+            # Reuse the scanlines and average rgb computed while scoring the best rectangle
+            return blend_texture_on_canvas(
+                texture_greyscale_alpha, canvas, optimization_result.scanline_x_intersects,
+                optimization_result.y_min, optimization_result.rgb,
+                *optimization_result.best_rect_list
+            )
+        
         update_canvas_with_best_rect(
             optimization_result.best_rect_list,
             target,
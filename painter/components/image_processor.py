@@ -35,23 +35,24 @@ class ImageProcessor:
         except Exception as e:
             raise ValueError(f"Failed to load target image from {filepath}: {e}")
     
-    def create_canvas(self, target: np.ndarray) -> np.ndarray:
+    def create_canvas(self, target: np.ndarray, dtype: type = np.float32) -> np.ndarray:
         """
         Create a blank canvas with the same dimensions as target, 
         filled with the target's average color.
         
         Args:
             target: Target RGBA image array
+            dtype: Canvas dtype, float32 to match the painting kernels
             
         Returns:
             Canvas RGBA array initialized with target's average color
         """
-        # Create opaque canvas of same size as target
-        canvas = np.ones(target.shape, dtype=np.float32)
+        # Every channel is written below, so skip zero/one initialisation
+        canvas = np.empty(target.shape, dtype=dtype)
         
-        # Fill with average color of target
-        average_rgb = get_average_rgb_of_rgba_image(target)
-        canvas[:, :, 0:3] *= average_rgb
+        # Fill with average color of target, fully opaque
+        canvas[:, :, 0:3] = get_average_rgb_of_rgba_image(target)
+        canvas[:, :, 3] = 1.0
         
         return canvas
     
@@ -2,10 +2,12 @@
 Output management component for handling image and GIF generation.
 """
 
+import queue
+import random
+import threading
 import numpy as np
 from typing import Optional, Dict, Any
 from utils.create_painted_png import CreateOutputImage
-from utils.create_paint_progress_gif import CreateOutputGIF
 from utils.utilities import save_rgba_array_as_png
 from ..config import OutputConfig
 
@@ -22,6 +24,13 @@ class OutputManager:
         self.gif_creator = None
         self.image_creator = None
         self._initialized = False
+        
+        # Background frame recording (see start_background_recording)
+        self._io_queue = None
+        self._io_thread = None
+        
+        # Intermediate hill climb frames, disabled while power law frame skipping is active
+        self._is_intermediate_frames_enabled = True
     
     def setup_output_generators(self, texture_dict: Dict[int, Dict[str, Any]], 
                                canvas_height: int, canvas_width: int, 
@@ -42,6 +51,8 @@ class OutputManager:
                 not self.is_multiprocessing_worker and 
                 self.config.gif_name.strip()):
                 
+                # GIF writer libraries (imageio, cv2) are only imported when a GIF is recorded
+                from utils.create_paint_progress_gif import CreateOutputGIF
                 self.gif_creator = CreateOutputGIF(
                     fps=self.config.gif_fps,
                     is_create_gif=True,
@@ -66,12 +77,61 @@ class OutputManager:
         except Exception as e:
             raise RuntimeError(f"Failed to setup output generators: {e}")
     
-    def record_frame(self, canvas: np.ndarray):
+    def start_background_recording(self, max_pending_frames: int = 4):
+        """
+        Encode recorded GIF frames on a background thread so frame compression
+        overlaps with optimizing the next shape. Frames are copied when queued and
+        encoded in order; the bounded queue blocks the painter if encoding falls behind.
+        
+        Args:
+            max_pending_frames: Maximum number of frames waiting to be encoded
+        """
+        if self.gif_creator is None or self._io_thread is not None:
+            return
+        
+        self._io_queue = queue.Queue(maxsize=max_pending_frames)
+        self._io_thread = threading.Thread(target=self._io_worker, daemon=True)
+        self._io_thread.start()
+    
+    def _io_worker(self):
+        """Encode queued frames until the None sentinel arrives"""
+        while True:
+            canvas = self._io_queue.get()
+            if canvas is None:
+                break
+            self._record_frame_now(canvas)
+    
+    def _stop_background_recording(self):
+        """Wait for queued frames to be encoded and stop the background thread"""
+        if self._io_thread is None:
+            return
+        
+        self._io_queue.put(None)
+        self._io_thread.join()
+        self._io_thread = None
+        self._io_queue = None
+    
+    def record_frame(self, canvas: np.ndarray, is_snapshot: bool = False):
         """
         Record current canvas state for progress GIF.
         
         Args:
             canvas: Current canvas RGBA array
+            is_snapshot: True if canvas is a copy that will not be modified again,
+                         so it can be queued without copying
+        """
+        if self._io_queue is not None:
+            # Canvas keeps being painted in place, so queue a snapshot
+            self._io_queue.put(canvas if is_snapshot else canvas.copy())
+        else:
+            self._record_frame_now(canvas)
+    
+    def _record_frame_now(self, canvas: np.ndarray):
+        """
+        Compress and enqueue a frame to the GIF creator.
+        
+        Args:
+            canvas: Canvas RGBA array to record
         """
         if self.gif_creator is not None:
             try:
@@ -80,6 +140,31 @@ class OutputManager:
                 if not self.is_multiprocessing_worker:
                     print(f"Warning: Failed to record GIF frame: {e}")
     
+    def set_intermediate_frames_enabled(self, enabled: bool):
+        """
+        Enable or disable recording of intermediate hill climb frames.
+        
+        Args:
+            enabled: False to skip every intermediate frame (power law frame skipping)
+        """
+        self._is_intermediate_frames_enabled = enabled
+    
+    def should_record_intermediate_frame(self, probability: float = 0.25) -> bool:
+        """
+        Decide whether the next intermediate frame should be recorded, so callers can
+        skip building intermediate canvases that would be dropped.
+        
+        Args:
+            probability: Probability of recording this frame (0.0 to 1.0)
+            
+        Returns:
+            True if a GIF is being recorded, intermediate frames are not skipped
+            (power law frame skipping) and the probability roll succeeds
+        """
+        if self.gif_creator is None or not self._is_intermediate_frames_enabled:
+            return False
+        return random.random() < probability
+    
     def record_intermediate_frame(self, canvas: np.ndarray, probability: float = 0.25):
         """
         Record intermediate frame with given probability to avoid GIF bloat.
@@ -89,7 +174,6 @@ class OutputManager:
             probability: Probability of recording this frame (0.0 to 1.0)
         """
         if self.gif_creator is not None:
-            import random
             if random.random() < probability:
                 self.record_frame(canvas)
     
@@ -105,20 +189,32 @@ class OutputManager:
         """
         if not self._initialized or self.image_creator is None:
             return False
+        # A shape that covered no textured pixel has no colour (see apply_shape_to_canvas)
+        if not np.isfinite(optimization_result.score):
+            return False
         
         try:
-            job = {
-                "best_rect_list": optimization_result.best_rect_list,
-                "texture_key": optimization_result.texture_key,
-                "rgb": optimization_result.rgb
-            }
-            self.image_creator.enqueue(job)
+            self.image_creator.enqueue_shape(
+                optimization_result.best_rect_list,
+                optimization_result.texture_key,
+                optimization_result.rgb
+            )
             return True
         except Exception as e:
             if not self.is_multiprocessing_worker:
                 print(f"Warning: Failed to enqueue shape for output: {e}")
             return False
     
+    def reserve_shapes(self, num_shapes: int):
+        """
+        Preallocate storage for the shapes of the high-resolution output image.
+        
+        Args:
+            num_shapes: Number of shapes that will be enqueued
+        """
+        if self.image_creator is not None:
+            self.image_creator.reserve(num_shapes)
+    
     def finalize_and_save(self, output_folder: str, filename: str) -> bool:
         """
         Finalize all output generation and save results.
@@ -133,6 +229,9 @@ class OutputManager:
         success = True
         
         try:
+            # Make sure every recorded frame reached the GIF creator
+            self._stop_background_recording()
+            
             # Finalize and save high-resolution image
             if self.image_creator is not None:
                 output_rgba = self.image_creator.finish()
@@ -160,6 +259,8 @@ class OutputManager:
     def cleanup(self):
         """Clean up all output generators and resources"""
         try:
+            self._stop_background_recording()
+            
             if self.gif_creator is not None:
                 self.gif_creator.end_process()
                 self.gif_creator = None
@@ -13,7 +13,8 @@ class VectorFieldFactory:
     Handles the complexity of vector field creation and equation parsing.
     """
     
-    def create_from_config(self, config: VectorFieldConfig, canvas_height: int, canvas_width: int) -> Optional[VectorField]:
+    def create_from_config(self, config: VectorFieldConfig, canvas_height: int, canvas_width: int,
+                           compiled_function=None) -> Optional[VectorField]:
         """
         Create a VectorField object from configuration.
         
@@ -21,6 +22,8 @@ class VectorFieldFactory:
             config: Vector field configuration
             canvas_height: Height of the canvas
             canvas_width: Width of the canvas
+            compiled_function: Optional result of precompile() for the config's
+                equations; skips parsing the equation strings when provided
             
         Returns:
             VectorField object if enabled, None otherwise
@@ -31,10 +34,12 @@ class VectorFieldFactory:
         if not config.enabled:
             return None
         
-        # Create vector field function from string equations
-        vector_field_function = self._create_function_from_equations(
-            config.f_equation, config.g_equation
-        )
+        # Create vector field function from string equations unless already compiled
+        vector_field_function = compiled_function
+        if vector_field_function is None:
+            vector_field_function = self._create_function_from_equations(
+                config.f_equation, config.g_equation
+            )
         
         if vector_field_function is None:
             raise ValueError(f"Invalid vector field equations: f='{config.f_equation}', g='{config.g_equation}'")
@@ -69,6 +74,20 @@ class VectorFieldFactory:
             print(f"Warning: Failed to create vector field function: {e}")
             return None
     
+    def precompile(self, f_equation: str, g_equation: str):
+        """
+        Parse and compile vector field equations once so the result can be shared
+        by every frame of a batch (and pickled to worker processes).
+        
+        Args:
+            f_equation: String equation for f(x,y) component
+            g_equation: String equation for g(x,y) component
+            
+        Returns:
+            Picklable vector field function, or None if the equations are invalid
+        """
+        return self._create_function_from_equations(f_equation, g_equation)
+    
     def validate_equations(self, f_equation: str, g_equation: str) -> bool:
         """
         Validate vector field equations without creating the function.
@@ -3,6 +3,7 @@ Configuration management for the painting algorithm.
 Provides structured configuration objects that replace global variables.
 """
 
+import pickle
 from dataclasses import dataclass
 from typing import Optional, List, Dict, Any, Tuple
 
@@ -72,6 +73,14 @@ class VectorFieldConfig:
             return float(coords[0]), float(coords[1])
         return self.center_x, self.center_y
     
+    def set_frame_origin(self, coords: List[float]):
+        """Pin the vector field origin to a single frame's coordinates"""
+        self.all_frame_coordinates = [coords]
+        if len(coords) >= 2:
+            self.center_x, self.center_y = float(coords[0]), float(coords[1])
+        else:
+            self.center_x, self.center_y = 0.0, 0.0
+    
     def validate(self) -> List[str]:
         """Validate vector field configuration"""
         errors = []
@@ -348,4 +357,20 @@ class PaintingConfig:
             image_config, hill_climb_config, vector_field_config,
             display_config, output_config, multiprocessing_config,
             visualization_fps, gif_probability
-        ) 
\ No newline at end of file
+        )
+    
+    def to_pickle_bytes(self) -> bytes:
+        """
+        Serialize configuration to pickle bytes for multiprocessing transport.
+        Uses the highest pickle protocol, which is considerably faster than
+        round-tripping through to_serializable_dict().
+        """
+        return pickle.dumps(self, protocol=pickle.HIGHEST_PROTOCOL)
+    
+    @staticmethod
+    def from_pickle_bytes(buf: bytes) -> 'PaintingConfig':
+        """Recreate PaintingConfig from bytes produced by to_pickle_bytes()"""
+        config = pickle.loads(buf)
+        if not isinstance(config, PaintingConfig):
+            raise ValueError(f"Expected pickled PaintingConfig, got {type(config).__name__}")
+        return config
@@ -214,7 +214,7 @@ def demo_factory_and_orchestrator():
     print("\n2. PaintingOrchestrator:")
     
     # Test input validation
-    errors = PaintingOrchestrator.validate_inputs(
+    errors = PaintingOrchestrator.validate_inputs_errors_only(
         default_ui_dict, "test.png", ["texture1.png"], "output", "test_output"
     )
     print(f"  - Orchestrator input validation: {len(errors)} errors")
@@ -2,7 +2,9 @@
 Factory for creating painting engines with proper dependency injection.
 """
 
+from typing import List, Optional, Tuple, Union
 from .config import PaintingConfig
+from .ui_schema import validate_ui_schema
 from .painting_engine import PaintingEngine
 from .components.hill_climber import HillClimber
 
@@ -14,20 +16,31 @@ class PaintingEngineFactory:
     """
     
     @staticmethod
-    def create_from_config(config: PaintingConfig, is_multiprocessing_worker: bool = False) -> PaintingEngine:
+    def create_from_config(config: PaintingConfig, is_multiprocessing_worker: bool = False,
+                           ui_dict: Optional[dict] = None) -> PaintingEngine:
         """
-        Create a PaintingEngine from configuration.
+        Create a PaintingEngine from an already-built configuration.
         
         Args:
             config: Complete painting configuration
             is_multiprocessing_worker: Whether this engine runs in a worker process
+            ui_dict: Optional UI dictionary the config was built from (frame skipping parameters)
             
         Returns:
             Configured PaintingEngine instance
         """
-        # Create hill climber
-        hill_climber = HillClimber(config.hill_climb, config.multiprocessing.enabled)
-        return PaintingEngine(config, is_multiprocessing_worker, hill_climber)
+        # Create hill climber with frame skipping awareness
+        hill_climber = HillClimber(
+            config.hill_climb, 
+            config.multiprocessing.enabled,
+            visualization_fps=config.visualization_fps,
+            gif_probability=config.gif_probability
+        )
+        engine = PaintingEngine(config, is_multiprocessing_worker, hill_climber=hill_climber)
+        if ui_dict is not None:
+            # Store ui_dict for parameter access
+            engine.ui_dict = ui_dict
+        return engine
     
     @staticmethod
     def create_from_ui_dict(ui_dict: dict, is_gif_target: bool = False, 
@@ -47,30 +60,31 @@ class PaintingEngineFactory:
             ValueError: If configuration validation fails
         """
         config = PaintingConfig.from_ui_dict(ui_dict, is_gif_target)
-        # Create hill climber with frame skipping awareness
-        hill_climber = HillClimber(
-            config.hill_climb, 
-            config.multiprocessing.enabled,
-            visualization_fps=config.visualization_fps,
-            gif_probability=config.gif_probability
+        return PaintingEngineFactory.create_from_config(
+            config, is_multiprocessing_worker, ui_dict=ui_dict
         )
-        engine = PaintingEngine(config, is_multiprocessing_worker, hill_climber=hill_climber)
-        # Store ui_dict for parameter access
-        engine.ui_dict = ui_dict
-        return engine
     
     @staticmethod
-    def create_worker_engine(config_dict: dict) -> PaintingEngine:
+    def create_worker_engine(config_payload: Union[dict, bytes], ui_dict: Optional[dict] = None) -> PaintingEngine:
         """
         Create a PaintingEngine for multiprocessing worker from serialized config.
         
         Args:
-            config_dict: Serialized configuration dictionary
+            config_payload: Serialized configuration, either pickle bytes from
+                PaintingConfig.to_pickle_bytes() or a dictionary from
+                PaintingConfig.to_serializable_dict()
+            ui_dict: UI dictionary for the worker (defaults to the 'ui_dict'
+                entry of a serialized configuration dictionary)
             
         Returns:
             PaintingEngine configured for worker process
         """
-        config = PaintingConfig.from_serializable_dict(config_dict)
+        if isinstance(config_payload, bytes):
+            config = PaintingConfig.from_pickle_bytes(config_payload)
+        else:
+            config = PaintingConfig.from_serializable_dict(config_payload)
+            if ui_dict is None:
+                ui_dict = config_payload.get('ui_dict', {})
         # Create hill climber for worker
         hill_climber = HillClimber(
             config.hill_climb, 
@@ -80,7 +94,7 @@ class PaintingEngineFactory:
         )
         engine = PaintingEngine(config, is_multiprocessing_worker=True, hill_climber=hill_climber)
         # Reconstruct ui_dict for worker (frame skipping parameters included)
-        engine.ui_dict = config_dict.get('ui_dict', {})
+        engine.ui_dict = ui_dict if ui_dict is not None else {}
         return engine
     
     @staticmethod
@@ -115,19 +129,42 @@ class PaintingEngineFactory:
         return PaintingEngineFactory.create_from_ui_dict(default_ui_dict)
     
     @staticmethod
-    def validate_ui_dict(ui_dict: dict, is_gif_target: bool = False) -> list:
+    def build_config(ui_dict: dict, is_gif_target: bool = False) -> Tuple[Optional[PaintingConfig], List[str]]:
         """
-        Validate UI dictionary without creating an engine.
+        Build and validate a PaintingConfig from a UI dictionary in one pass.
         
         Args:
             ui_dict: UI parameter dictionary to validate
             is_gif_target: Whether target is a GIF file
             
         Returns:
-            List of validation error messages (empty if valid)
+            Tuple of (config, errors). config is None if validation failed.
         """
+        # Cheap key/type/range check first so malformed dicts never reach the config builders
+        schema_errors = validate_ui_schema(ui_dict)
+        if schema_errors:
+            return None, schema_errors
+        
         try:
-            PaintingConfig.from_ui_dict(ui_dict, is_gif_target)
-            return []
+            return PaintingConfig.from_ui_dict(ui_dict, is_gif_target), []
         except ValueError as e:
-            return [str(e)] 
\ No newline at end of file
+            return None, [str(e)]
+    
+    @staticmethod
+    def validate_ui_dict(ui_dict: dict, is_gif_target: bool = False, full_check: bool = True) -> list:
+        """
+        Validate UI dictionary without creating an engine.
+        
+        Args:
+            ui_dict: UI parameter dictionary to validate
+            is_gif_target: Whether target is a GIF file
+            full_check: Whether to also build a PaintingConfig for cross-field checks
+                once the schema check passes. When False only the schema is checked.
+            
+        Returns:
+            List of validation error messages (empty if valid)
+        """
+        if not full_check:
+            return validate_ui_schema(ui_dict)
+        _, errors = PaintingEngineFactory.build_config(ui_dict, is_gif_target)
+        return errors 
\ No newline at end of file
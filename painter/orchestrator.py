@@ -2,8 +2,15 @@
 Main orchestrator for the painting system - lightweight entry point.
 """
 
-from typing import List, Dict, Any
+import atexit
+import itertools
+import multiprocessing
+import pickle
+import threading
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+from .config import PaintingConfig
 from .factory import PaintingEngineFactory
+from .components.vector_field_factory import VectorFieldFactory
 
 
 class PaintingOrchestrator:
@@ -12,6 +19,13 @@ class PaintingOrchestrator:
     Provides a simple interface that handles all the complexity internally.
     """
     
+    # Worker pool reused across paint_batch_frames calls (created lazily by _get_pool)
+    _pool = None
+    _pool_size = 0
+    _pool_lock = threading.Lock()
+    _atexit_registered = False
+    _batch_ids = itertools.count()
+    
     @staticmethod
     def paint_from_ui_params(ui_dict: Dict[str, Any], target_path: str, 
                            texture_paths: List[str], output_folder: str, 
@@ -32,17 +46,17 @@ class PaintingOrchestrator:
             True if painting completed successfully, False otherwise
         """
         try:
-            # Validate inputs
-            errors = PaintingOrchestrator.validate_inputs(
-                ui_dict, target_path, texture_paths, output_folder, filename
+            # Validate inputs (the config built during validation is reused below)
+            config, errors = PaintingOrchestrator.validate_inputs(
+                ui_dict, target_path, texture_paths, output_folder, filename, is_gif_target
             )
             if errors:
                 print(f"❌ Validation errors: {'; '.join(errors)}")
                 return False
             
             # Create engine and execute painting
-            engine = PaintingEngineFactory.create_from_ui_dict(
-                ui_dict, is_gif_target, is_multiprocessing_worker=False
+            engine = PaintingEngineFactory.create_from_config(
+                config, is_multiprocessing_worker=False, ui_dict=ui_dict
             )
             
             # Print configuration summary
@@ -75,18 +89,26 @@ class PaintingOrchestrator:
         Returns:
             True if all frames painted successfully, False otherwise
         """
+        # Equations are identical for every frame, so compile them once per batch
+        compiled_vector_field = None
+        if ui_dict.get("enable_vector_field", False):
+            compiled_vector_field = VectorFieldFactory().precompile(
+                ui_dict.get("vector_field_f", ""), ui_dict.get("vector_field_g", "")
+            )
+        
         if use_multiprocessing:
             return PaintingOrchestrator._paint_batch_parallel(
-                frame_paths, texture_paths, output_folder, ui_dict
+                frame_paths, texture_paths, output_folder, ui_dict, compiled_vector_field
             )
         else:
             return PaintingOrchestrator._paint_batch_sequential(
-                frame_paths, texture_paths, output_folder, ui_dict
+                frame_paths, texture_paths, output_folder, ui_dict, compiled_vector_field
             )
     
     @staticmethod
     def _paint_batch_sequential(frame_paths: List[str], texture_paths: List[str],
-                               output_folder: str, ui_dict: Dict[str, Any]) -> bool:
+                               output_folder: str, ui_dict: Dict[str, Any],
+                               compiled_vector_field=None) -> bool:
         """Paint frames sequentially with per-frame vector field support"""
         try:
             print(f"🔄 Painting {len(frame_paths)} frames sequentially...")
@@ -98,26 +120,37 @@ class PaintingOrchestrator:
             if has_per_frame_coords and ui_dict.get("enable_vector_field", False):
                 print(f"📍 Using per-frame vector field coordinates ({len(coordinates)} coordinates available)")
             
+            filenames = [f"frame_{i:04d}" for i in range(len(frame_paths))]
+            num_frame_coords = len(coordinates) if has_per_frame_coords else 0
+            
+            # Engines are only rebuilt when the frame's origin differs from the previous frame's
+            engine = None
+            last_coord = None
+            
             for i, frame_path in enumerate(frame_paths):
-                # Create frame-specific ui_dict with updated vector field coordinates
-                frame_ui_dict = ui_dict.copy()
-                
-                # Extract frame-specific coordinates if available
-                if has_per_frame_coords and i < len(coordinates):
-                    frame_ui_dict["vector_field_origin_shift"] = [coordinates[i]]
-                    coord_info = f"coords=({coordinates[i][0]}, {coordinates[i][1]})" if len(coordinates[i]) >= 2 else "coords=default"
+                # Extract frame-specific coordinates if available (None means batch-wide settings)
+                frame_coord = coordinates[i] if i < num_frame_coords else None
+                if frame_coord is not None and len(frame_coord) >= 2:
+                    coord_info = f"coords=({frame_coord[0]}, {frame_coord[1]})"
                 else:
                     coord_info = "coords=default"
                 
-                # Create engine for this frame with frame-specific config
-                engine = PaintingEngineFactory.create_from_ui_dict(
-                    frame_ui_dict, is_gif_target=True, is_multiprocessing_worker=False
-                )
+                if engine is None or frame_coord != last_coord:
+                    # Create frame-specific ui_dict with updated vector field coordinates
+                    frame_ui_dict = ui_dict.copy()
+                    if frame_coord is not None:
+                        frame_ui_dict["vector_field_origin_shift"] = [frame_coord]
+                    
+                    # Create engine for this frame with frame-specific config
+                    engine = PaintingEngineFactory.create_from_ui_dict(
+                        frame_ui_dict, is_gif_target=True, is_multiprocessing_worker=False
+                    )
+                    engine.set_compiled_vector_field(compiled_vector_field)
+                    last_coord = frame_coord
                 
-                filename = f"frame_{i:04d}"
                 print(f"  Processing frame {i+1}/{len(frame_paths)}: {coord_info}")
                 
-                success = engine.paint_image(frame_path, texture_paths, output_folder, filename)
+                success = engine.paint_image(frame_path, texture_paths, output_folder, filenames[i])
                 if not success:
                     print(f"❌ Failed to paint frame {i}: {frame_path}")
                     return False
@@ -134,54 +167,50 @@ class PaintingOrchestrator:
     
     @staticmethod
     def _paint_batch_parallel(frame_paths: List[str], texture_paths: List[str],
-                             output_folder: str, ui_dict: Dict[str, Any]) -> bool:
+                             output_folder: str, ui_dict: Dict[str, Any],
+                             compiled_vector_field=None) -> bool:
         """Paint frames using multiprocessing with per-frame vector field support"""
         try:
-            import multiprocessing
-            from .config import PaintingConfig
-
             coordinates = ui_dict.get("vector_field_origin_shift", [[0, 0]])
             has_per_frame_coords = len(coordinates) > 1
             
             if has_per_frame_coords and ui_dict.get("enable_vector_field", False):
                 print(f"📍 Using per-frame vector field coordinates ({len(coordinates)} coordinates available)")
             
-            # Prepare work items with frame-specific coordinates
-            work_items = []
-            for i, frame_path in enumerate(frame_paths):
-                # Create frame-specific ui_dict
-                frame_ui_dict = ui_dict.copy()
-                if has_per_frame_coords and i < len(coordinates):
-                    frame_ui_dict["vector_field_origin_shift"] = [coordinates[i]]
-                
-                # Create frame-specific config
-                config = PaintingConfig.from_ui_dict(frame_ui_dict, is_gif_target=True)
-                config_dict = config.to_serializable_dict()
-                config_dict['ui_dict'] = frame_ui_dict
-                
-                work_items.append({
-                    'frame_path': frame_path,
-                    'texture_paths': texture_paths,
-                    'output_folder': output_folder,
-                    'filename': f"frame_{i:04d}",
-                    'config_dict': config_dict,
-                    'frame_index': i  # Include frame index for debugging
-                })
-
-            # Determine worker count
-            cpu_percentage = work_items[0]['config_dict']['multiprocessing']['cpu_usage_percentage']
-            num_workers = max(1, int(multiprocessing.cpu_count() * cpu_percentage))
-            num_workers = min(num_workers, len(work_items))
+            # Build and validate the shared config once; workers only receive per-frame deltas
+            base_config = PaintingConfig.from_ui_dict(ui_dict, is_gif_target=True)
+            
+            # Determine worker count (the pool itself is sized by CPU budget so it can be reused)
+            cpu_percentage = base_config.multiprocessing.cpu_usage_percentage
+            pool_size = max(1, int(multiprocessing.cpu_count() * cpu_percentage))
+            num_workers = min(pool_size, len(frame_paths))
+            
+            filenames = [f"frame_{i:04d}" for i in range(len(frame_paths))]
+            chunksize = max(1, len(frame_paths) // (num_workers * 4))
             
             print(f"🔄 Painting {len(frame_paths)} frames using {num_workers} workers...")
             
-            # Execute in parallel
-            with multiprocessing.Pool(processes=num_workers) as pool:
-                results = pool.map(_paint_worker_function, work_items)
+            # Batch-wide state is pickled once here and memoized once per task chunk
+            batch_id = next(PaintingOrchestrator._batch_ids)
+            batch_state = pickle.dumps(
+                (base_config.to_pickle_bytes(), ui_dict, texture_paths, output_folder, compiled_vector_field),
+                protocol=pickle.HIGHEST_PROTOCOL
+            )
+            
+            # Execute in parallel on the persistent pool
+            pool = PaintingOrchestrator._get_pool(pool_size)
+            try:
+                # Work items are produced lazily so workers start on the first frame immediately
+                work_items = _iter_work_items(batch_id, batch_state, frame_paths, filenames,
+                                              coordinates, has_per_frame_coords)
+                successful = sum(pool.imap_unordered(_paint_worker_function, work_items, chunksize=chunksize))
+            except BaseException:
+                # Never hand a pool in an unknown state to the next batch
+                PaintingOrchestrator.shutdown(terminate=True)
+                raise
             
             # Check results
-            successful = sum(results)
-            total = len(results)
+            total = len(frame_paths)
             
             if successful == total:
                 if has_per_frame_coords:
@@ -197,35 +226,97 @@ class PaintingOrchestrator:
             print(f"❌ Batch parallel painting failed: {e}")
             return False
     
+    @staticmethod
+    def _get_pool(pool_size: int):
+        """
+        Get the persistent worker pool, creating it on first use.
+        The pool is recreated only if the requested size changes.
+        
+        Args:
+            pool_size: Number of worker processes
+            
+        Returns:
+            multiprocessing.Pool shared by successive batches
+        """
+        with PaintingOrchestrator._pool_lock:
+            if PaintingOrchestrator._pool is not None and PaintingOrchestrator._pool_size != pool_size:
+                PaintingOrchestrator._close_pool(terminate=False)
+            
+            if PaintingOrchestrator._pool is None:
+                PaintingOrchestrator._pool = multiprocessing.Pool(processes=pool_size)
+                PaintingOrchestrator._pool_size = pool_size
+                if not PaintingOrchestrator._atexit_registered:
+                    atexit.register(PaintingOrchestrator.shutdown)
+                    PaintingOrchestrator._atexit_registered = True
+            
+            return PaintingOrchestrator._pool
+    
+    @staticmethod
+    def _close_pool(terminate: bool):
+        """Close the persistent pool. Caller must hold _pool_lock."""
+        pool = PaintingOrchestrator._pool
+        PaintingOrchestrator._pool = None
+        PaintingOrchestrator._pool_size = 0
+        if pool is not None:
+            if terminate:
+                pool.terminate()
+            else:
+                pool.close()
+            pool.join()
+    
+    @staticmethod
+    def shutdown(terminate: bool = False):
+        """
+        Shut down the persistent worker pool used for parallel batch painting.
+        Registered with atexit when the pool is first created.
+        
+        Args:
+            terminate: Stop workers immediately instead of letting queued work finish
+        """
+        with PaintingOrchestrator._pool_lock:
+            PaintingOrchestrator._close_pool(terminate)
+    
     @staticmethod
     def validate_inputs(ui_dict: Dict[str, Any], target_path: str, 
                        texture_paths: List[str], output_folder: str, 
-                       filename: str) -> List[str]:
+                       filename: str, is_gif_target: bool = False) -> Tuple[Optional[PaintingConfig], List[str]]:
         """
         Validate all inputs for painting operation.
         
+        The cheap path checks run first; the UI dictionary (which builds a full
+        PaintingConfig) is only validated once they all pass.
+        
         Returns:
-            List of validation error messages (empty if valid)
+            Tuple of (config, errors). config is the PaintingConfig built while
+            validating the UI dictionary, or None if any validation failed.
         """
-        errors = []
-        
-        # Validate UI dictionary
-        ui_errors = PaintingEngineFactory.validate_ui_dict(ui_dict)
-        errors.extend(ui_errors)
-        
         # Validate file paths
-        if not target_path or not target_path.strip():
-            errors.append("Target path cannot be empty")
+        path_checks = (
+            (target_path and target_path.strip(), "Target path cannot be empty"),
+            (texture_paths, "At least one texture path must be provided"),
+            (output_folder and output_folder.strip(), "Output folder cannot be empty"),
+            (filename and filename.strip(), "Filename cannot be empty"),
+        )
+        errors = [message for is_valid, message in path_checks if not is_valid]
+        if errors:
+            return None, errors
         
-        if not texture_paths or len(texture_paths) == 0:
-            errors.append("At least one texture path must be provided")
-        
-        if not output_folder or not output_folder.strip():
-            errors.append("Output folder cannot be empty")
-        
-        if not filename or not filename.strip():
-            errors.append("Filename cannot be empty")
+        # Validate UI dictionary
+        return PaintingEngineFactory.build_config(ui_dict, is_gif_target)
+    
+    @staticmethod
+    def validate_inputs_errors_only(ui_dict: Dict[str, Any], target_path: str, 
+                                    texture_paths: List[str], output_folder: str, 
+                                    filename: str, is_gif_target: bool = False) -> List[str]:
+        """
+        Validate all inputs for painting operation, discarding the built config.
         
+        Returns:
+            List of validation error messages (empty if valid)
+        """
+        _, errors = PaintingOrchestrator.validate_inputs(
+            ui_dict, target_path, texture_paths, output_folder, filename, is_gif_target
+        )
         return errors
     
     @staticmethod
@@ -258,31 +349,79 @@ class PaintingOrchestrator:
         }
 
 
-def _paint_worker_function(work_item: Dict[str, Any]) -> bool:
+# Batch-wide state cached by each worker process, keyed by 'batch_id' (see _load_batch_state)
+_worker_state: Dict[str, Any] = {}
+
+
+def _load_batch_state(batch_id: int, batch_state: bytes) -> Dict[str, Any]:
+    """
+    Unpickle the batch-wide painting state once per batch in each worker process.
+    The persistent pool outlives a single batch, so the state travels with the
+    work items (pickled once per chunk) instead of through a pool initializer.
+    """
+    if _worker_state.get('batch_id') != batch_id:
+        config_bytes, ui_dict, texture_paths, output_folder, compiled_vector_field = pickle.loads(batch_state)
+        _worker_state.clear()
+        _worker_state.update(
+            batch_id=batch_id,
+            config_bytes=config_bytes,
+            ui_dict=ui_dict,
+            texture_paths=texture_paths,
+            output_folder=output_folder,
+            compiled_vector_field=compiled_vector_field
+        )
+    return _worker_state
+
+
+def _iter_work_items(batch_id: int, batch_state: bytes, frame_paths: List[str], filenames: List[str],
+                     coordinates: List[List[float]], has_per_frame_coords: bool) -> Iterator[tuple]:
+    """
+    Lazily yield one minimal work item per frame for the worker pool.
+    
+    Yields:
+        Tuple of (batch_id, batch_state, frame_path, filename, coord) where coord is
+        the frame-specific vector field origin, or None to use the batch-wide configuration
+    """
+    num_frame_coords = len(coordinates) if has_per_frame_coords else 0
+    for i, frame_path in enumerate(frame_paths):
+        yield batch_id, batch_state, frame_path, filenames[i], (coordinates[i] if i < num_frame_coords else None)
+
+
+def _paint_worker_function(work_item: tuple) -> bool:
     """
     Worker function for multiprocessing.
     Must be at module level for Windows compatibility.
     
     Args:
-        work_item: Dictionary containing work parameters
+        work_item: Tuple of (batch_id, batch_state, frame_path, filename, coord)
+            from _iter_work_items()
         
     Returns:
         True if painting succeeded, False otherwise
     """
+    batch_id, batch_state, frame_path, filename, coord = work_item
     try:
-        # Extract work parameters
-        frame_path = work_item['frame_path']
-        texture_paths = work_item['texture_paths']
-        output_folder = work_item['output_folder']
-        filename = work_item['filename']
-        config_dict = work_item['config_dict']
+        state = _load_batch_state(batch_id, batch_state)
+        
+        # Unpickle a fresh config per frame so origin changes never leak between frames
+        config = PaintingConfig.from_pickle_bytes(state['config_bytes'])
+        frame_ui_dict = state['ui_dict']
+        
+        if coord is not None:
+            config.vector_field.set_frame_origin(coord)
+            frame_ui_dict = {**frame_ui_dict, 'vector_field_origin_shift': [coord]}
         
         # Create worker engine
-        engine = PaintingEngineFactory.create_worker_engine(config_dict)
+        engine = PaintingEngineFactory.create_from_config(
+            config, is_multiprocessing_worker=True, ui_dict=frame_ui_dict
+        )
+        engine.set_compiled_vector_field(state['compiled_vector_field'])
         
         # Execute painting
-        return engine.paint_image(frame_path, texture_paths, output_folder, filename)
+        return engine.paint_image(
+            frame_path, state['texture_paths'], state['output_folder'], filename
+        )
         
     except Exception as e:
-        print(f"❌ Worker failed for {work_item.get('frame_path', 'unknown')}: {e}")
-        return False 
\ No newline at end of file
+        print(f"❌ Worker failed for {frame_path}: {e}")
+        return False
@@ -10,14 +10,35 @@ from .components.image_processor import ImageProcessor
 from .components.texture_manager import TextureManager
 from .components.vector_field_factory import VectorFieldFactory
 from .components.hill_climber import HillClimber
-from .components.display_manager import DisplayManager
-from .components.output_manager import OutputManager
+
+
+# Numba kernels only need compiling once per process
+_kernels_warmed_up = False
+
+
+def _warmup_kernels():
+    """Compile painting kernels up front so JIT cost is not paid inside the painting loop"""
+    global _kernels_warmed_up
+    if not _kernels_warmed_up:
+        from utils.numba_warmup import warmup_painting_kernels
+        warmup_painting_kernels()
+        _kernels_warmed_up = True
+
+
+def _format_progress_bytes(shape_index: int, total_shapes: int, num_iterations: int) -> bytes:
+    """Progress line for the painting loop, encoded once for DisplayManager.print_progress"""
+    return (f"Shape {shape_index + 1}/{total_shapes} "
+            f"({(shape_index + 1) / total_shapes:.1%}): "
+            f"{num_iterations} iterations planned\n").encode()
 
 
 class PaintingEngine:
     """
     Main painting engine that coordinates all components to execute the painting algorithm.
     Provides a clean interface for painting single images or batch processing.
+    
+    Target, canvas and texture arrays are C-contiguous float32 throughout, which is
+    the type the Numba kernels in utils.rectangle are compiled for.
     """
     
     def __init__(self, config: PaintingConfig, is_multiprocessing_worker: bool = False, hill_climber: Optional['HillClimber'] = None):
@@ -44,8 +65,27 @@ class PaintingEngine:
         # UI parameters for configuration access (set by factory)
         self.ui_dict = None
         
-        # Pre-computed frame positions for power law method
-        self._power_law_frame_positions = None
+        _warmup_kernels()
+        
+        # UI flags read once per paint (see _cache_ui_flags)
+        self._cache_ui_flags()
+        
+        # Frame recording plan, resolved once per paint (see _configure_frame_recording)
+        self._record_all = True
+        self._frame_mask = None
+        
+        # Vector field function compiled once per batch (see set_compiled_vector_field)
+        self._compiled_vector_field_function = None
+    
+    def set_compiled_vector_field(self, compiled_function):
+        """
+        Provide a vector field function precompiled by VectorFieldFactory.precompile()
+        so painting skips parsing the equation strings.
+        
+        Args:
+            compiled_function: Compiled function for this engine's f/g equations, or None
+        """
+        self._compiled_vector_field_function = compiled_function
     
     def paint_image(self, target_path: str, texture_paths: List[str], 
                    output_folder: str, filename: str) -> bool:
@@ -62,6 +102,8 @@ class PaintingEngine:
             True if painting completed successfully, False otherwise
         """
         try:
+            self._cache_ui_flags()
+            
             # 1. Load and setup data
             print(f"🎨 Starting painting process for: {target_path}")
             target, canvas, texture_dict, vector_field = self._setup_painting_data(
@@ -72,6 +114,9 @@ class PaintingEngine:
                 return False
             
             # 2. Setup display and output managers
+            from .components.display_manager import DisplayManager
+            from .components.output_manager import OutputManager
+            
             canvas_height, canvas_width = self.image_processor.get_canvas_dimensions(target)
             
             with DisplayManager(self.config.display, canvas_height, canvas_width, self.multiprocessing_enabled) as display_mgr, \
@@ -90,16 +135,18 @@ class PaintingEngine:
                     self.config.image.output_image_size
                 )
                 
+                output_mgr.reserve_shapes(self.config.hill_climb.num_textures)
+                
+                # Encode GIF frames off the painting thread
+                output_mgr.start_background_recording()
+                
                 # Configure intermediate frame skipping for power law method
-                if (self.ui_dict and 
-                    self.ui_dict.get("is_enable_smaller_gif_export_size", False) and 
-                    self.ui_dict.get("create_gif_of_painting_progress", False) and 
-                    not self.ui_dict.get("display_placement_progress", True)):
+                self._configure_frame_recording(self.config.hill_climb.num_textures)
+                if not self._record_all:
                     # Disable intermediate frame recording when power law skipping is active
-                    output_mgr._skip_intermediate_frames = True
-                    frame_cap = self.ui_dict.get("enable_smaller_gif_frame_cap", 40)
-                    extra_frames = self.ui_dict.get("enable_smaller_gif_number_of_extra_frames_at_end", 0)
-                    print(f"🎯 Power law frame skipping enabled - targeting {frame_cap} frames + {extra_frames} extra end frames, intermediate frames disabled")
+                    output_mgr.set_intermediate_frames_enabled(False)
+                    print(f"🎯 Power law frame skipping enabled - targeting {self._flag_frame_cap} frames + "
+                          f"{self._flag_extra_end} extra end frames, intermediate frames disabled")
                 
                 # 3. Execute main painting loop
                 success = self._execute_painting_loop(
@@ -113,12 +160,14 @@ class PaintingEngine:
                 
                 return success
                 
-        except Exception as e:
+        except (OSError, ValueError, RuntimeError) as e:
+            # Expected failures (unreadable files, bad parameters, output setup) report and return False.
+            # Anything else is a bug and propagates to the orchestrator, which reports it per frame.
             if not self.multiprocessing_enabled:
                 print(f"❌ Painting failed: {e}")
             return False
         finally:
-            # Cleanup is handled by context managers
+            # Cleanup is handled by context managers; drop manager references even when an error propagates
             self.display_manager = None
             self.output_manager = None
     
@@ -134,16 +183,23 @@ class PaintingEngine:
         """
         try:
             # Load target image
-            target = self.image_processor.load_target(target_path, self.config.image)
+            target = np.ascontiguousarray(
+                self.image_processor.load_target(target_path, self.config.image), dtype=np.float32
+            )
             if not self.multiprocessing_enabled:
                 print(f"✓ Loaded target image: {target.shape}")
             
             # Create canvas
-            canvas = self.image_processor.create_canvas(target)
+            canvas = self.image_processor.create_canvas(target, dtype=np.float32)
             print(f"✓ Created canvas: {canvas.shape}")
             
             # Load textures
             texture_dict = self.texture_manager.load_textures(texture_paths, self.config.image)
+            for texture_data in texture_dict.values():
+                # No-op for textures already loaded as contiguous float32
+                texture_data['texture_greyscale_alpha'] = np.ascontiguousarray(
+                    texture_data['texture_greyscale_alpha'], dtype=np.float32
+                )
             print(f"✓ Loaded {self.texture_manager.get_num_textures()} textures")
             
             # Create vector field if enabled
@@ -151,7 +207,8 @@ class PaintingEngine:
             if self.config.vector_field.enabled:
                 canvas_height, canvas_width = self.image_processor.get_canvas_dimensions(target)
                 vector_field = self.vector_field_factory.create_from_config(
-                    self.config.vector_field, canvas_height, canvas_width
+                    self.config.vector_field, canvas_height, canvas_width,
+                    compiled_function=self._compiled_vector_field_function
                 )
                 if vector_field:
                     print(f"✓ Created vector field: f='{self.config.vector_field.f_equation}', "
@@ -183,47 +240,86 @@ class PaintingEngine:
             total_shapes = self.config.hill_climb.num_textures
             print(f"🔄 Starting painting loop: {total_shapes} shapes to paint")
             
+            # Bind loop invariants to locals once instead of resolving attributes per shape
+            display_mgr = self.display_manager
+            output_mgr = self.output_manager
+            multiprocessing_enabled = self.multiprocessing_enabled
+            # Parallel sequences of texture keys, data dicts and greyscale-alpha arrays,
+            # so picking a texture is one random index instead of dict lookups per shape
+            texture_keys = list(texture_dict.keys())
+            texture_data_list = [texture_dict[key] for key in texture_keys]
+            texture_arrays = [texture_data['texture_greyscale_alpha'] for texture_data in texture_data_list]
+            num_textures = len(texture_keys)
+            if num_textures == 0:
+                raise RuntimeError("No textures loaded")
+            random_integers = self.hill_climber.rng.integers
+            # Scanline scratch owned by this loop and reused by every optimize_shape call.
+            # Results reference it, so each shape is applied before the next one is optimized.
+            scanline_scratch = (np.empty((canvas.shape[0], 2), dtype=np.int32),
+                                np.empty((canvas.shape[0], 2), dtype=np.int32))
+            optimize_shape = self.hill_climber.optimize_shape
+            apply_shape_to_canvas = self.hill_climber.apply_shape_to_canvas
+            get_progress_info = self.hill_climber.get_progress_info
+            should_record_frame = self._should_record_frame
+            # Only a live pygame window can be closed; it is polled every 16 shapes because reading
+            # the shared closed flag takes a lock, so stopping may lag a user close by up to 16 shapes
+            was_closed = display_mgr.was_closed if display_mgr and display_mgr.is_display_active() else None
+            update_display = display_mgr.update_display if display_mgr and display_mgr.is_display_active() else None
+            print_progress = (display_mgr.print_progress
+                              if display_mgr and not multiprocessing_enabled and display_mgr.config.print_progress
+                              else None)
+            record_frame = output_mgr.record_frame if output_mgr and output_mgr.gif_creator is not None else None
+            enqueue_shape_for_output = output_mgr.enqueue_shape_for_output if output_mgr else None
+            # Report progress about 200 times per run rather than for every shape
+            progress_stride = max(1, total_shapes // 200)
+            
             for shape_index in range(total_shapes):
                 # Check if user closed display window
-                if self.display_manager and self.display_manager.was_closed():
-                    if not self.multiprocessing_enabled:
+                if was_closed and shape_index & 15 == 0 and was_closed():
+                    if not multiprocessing_enabled:
                         print("🛑 User closed display window. Stopping painting.")
                     return True  # Consider this a successful early termination
                 
                 # Get random texture
-                texture_key, texture_data = self.texture_manager.get_random_texture()
+                texture_index = int(random_integers(num_textures))
+                texture_key = texture_keys[texture_index]
+                texture_data = texture_data_list[texture_index]
+                texture_greyscale_alpha = texture_arrays[texture_index]
                 
                 # Print progress
-                if self.display_manager and not self.multiprocessing_enabled:
-                    progress = self.hill_climber.get_progress_info(shape_index)
-                    self.display_manager.print_progress(
-                        f"Shape {shape_index + 1}/{total_shapes} "
-                        f"({progress['progress_percentage']:.1%}): "
-                        f"{progress['num_iterations']} iterations planned"
-                    )
+                if print_progress and (shape_index % progress_stride == 0 or shape_index == total_shapes - 1):
+                    progress = get_progress_info(shape_index)
+                    print_progress(_format_progress_bytes(shape_index, total_shapes, progress['num_iterations']))
                 
                 # Optimize shape placement
-                optimization_result = self.hill_climber.optimize_shape(
-                    target, texture_key, texture_data, canvas, vector_field, shape_index
+                optimization_result = optimize_shape(
+                    target, texture_key, texture_data, canvas, vector_field, shape_index,
+                    scratch=scanline_scratch
                 )
                 
                 # Apply shape to canvas
-                self.hill_climber.apply_shape_to_canvas(
-                    canvas, target, optimization_result, 
-                    texture_data['texture_greyscale_alpha']
-                )
+                apply_shape_to_canvas(canvas, target, optimization_result, texture_greyscale_alpha)
                 
-                # Update displays and outputs
-                if self.display_manager:
-                    self.display_manager.update_display(canvas)
+                # Update displays and outputs.
+                # Use conditional frame recording based on configuration.
+                # Dropped frames never reach the output manager, so no canvas is copied for them.
+                is_record_frame = record_frame is not None and should_record_frame(shape_index, total_shapes)
+                if update_display and is_record_frame:
+                    # Display and GIF would each copy the canvas, so share one snapshot
+                    snapshot = canvas.copy()
+                    update_display(snapshot, is_snapshot=True)
+                    record_frame(snapshot, is_snapshot=True)
+                elif update_display:
+                    update_display(canvas)
+                elif is_record_frame:
+                    record_frame(canvas)
                 
-                if self.output_manager:
-                    # Use conditional frame recording based on configuration
-                    if self._should_record_frame(shape_index, total_shapes):
-                        self.output_manager.record_frame(canvas)
-                    self.output_manager.enqueue_shape_for_output(optimization_result)
+                if output_mgr:
+                    # Every shape is drawn on the high-resolution output image, independent of
+                    # which frames the progress GIF keeps, so shapes are always enqueued
+                    enqueue_shape_for_output(optimization_result)
             
-            if not self.multiprocessing_enabled:
+            if not multiprocessing_enabled:
                 print(f"✅ Painting loop completed: {total_shapes} shapes painted")
             return True
             
@@ -261,7 +357,7 @@ class PaintingEngine:
         
         return errors
     
-    def _compute_power_law_frame_positions(self, total_shapes: int, target_frames: int, power: float = 2.5) -> set:
+    def _compute_power_law_frame_positions(self, total_shapes: int, target_frames: int, power: float = 2.5) -> np.ndarray:
         """
         Pre-compute frame positions using power law distribution.
         
@@ -271,57 +367,47 @@ class PaintingEngine:
             power: Power law exponent (higher = more frames at start)
             
         Returns:
-            Set of shape indices where frames should be recorded
+            Sorted array of unique shape indices where frames should be recorded
         """
-        positions = set()
-        for i in range(target_frames):
-            normalized = i / (target_frames - 1) if target_frames > 1 else 0
-            powered = normalized ** power
-            position = int(powered * (total_shapes - 1))
-            positions.add(position)
-        return positions
+        if target_frames <= 1:
+            # A single frame sits at the start, no frames means no positions
+            return np.array([0] if target_frames == 1 else [], dtype=np.intp)
+        normalized = np.arange(target_frames) / (target_frames - 1)
+        return np.unique((normalized ** power * (total_shapes - 1)).astype(np.intp))
     
-    def _should_record_frame_power_law(self, shape_index: int, total_shapes: int) -> bool:
-        """
-        Determine if current shape should be recorded using power law method.
-        
-        Args:
-            shape_index: Current shape index (0-based)
-            total_shapes: Total number of shapes
-            
-        Returns:
-            True if frame should be recorded
-        """
-        # Lazy initialization of frame positions
-        if self._power_law_frame_positions is None:
-            target_frames = self.ui_dict.get("enable_smaller_gif_frame_cap", 40)
-            self._power_law_frame_positions = self._compute_power_law_frame_positions(total_shapes, target_frames)
-        
-        return shape_index in self._power_law_frame_positions
+    def _cache_ui_flags(self) -> None:
+        """Read the UI flags used while painting once, so the painting loop never touches ui_dict"""
+        ui_dict = self.ui_dict or {}
+        self._flag_gif_skip = bool(ui_dict.get("is_enable_smaller_gif_export_size", False))
+        self._flag_create_gif = bool(ui_dict.get("create_gif_of_painting_progress", False))
+        self._flag_display_progress = bool(ui_dict.get("display_placement_progress", True))
+        self._flag_frame_cap = ui_dict.get("enable_smaller_gif_frame_cap", 40)
+        self._flag_extra_end = ui_dict.get("enable_smaller_gif_number_of_extra_frames_at_end", 0)
     
-    def _should_record_frame_power_law_with_extra_end_frames(self, shape_index: int, total_shapes: int) -> bool:
+    def _configure_frame_recording(self, total_shapes: int) -> None:
         """
-        Determine if current shape should be recorded using power law method with extra end frames.
+        Resolve which shapes record a GIF frame, once per paint.
+        
+        When smaller GIF export is active, builds a boolean mask over shape indices holding the
+        power law positions plus the extra frames at the end, so the painting loop only indexes it.
         
         Args:
-            shape_index: Current shape index (0-based)
             total_shapes: Total number of shapes
-            
-        Returns:
-            True if frame should be recorded
         """
-        # First check if it's a normal power law frame
-        is_power_law_frame = self._should_record_frame_power_law(shape_index, total_shapes)
+        self._record_all = not (self._flag_gif_skip and self._flag_create_gif and not self._flag_display_progress)
+        if self._record_all or total_shapes <= 0:
+            self._frame_mask = None
+            return
         
-        # Check if we should add extra frames at the end
-        extra_frames_count = self.ui_dict.get("enable_smaller_gif_number_of_extra_frames_at_end", 0)
+        target_frames = self._flag_frame_cap
+        extra_frames_count = self._flag_extra_end
         
+        frame_mask = np.zeros(total_shapes, dtype=np.bool_)
+        frame_mask[self._compute_power_law_frame_positions(total_shapes, target_frames)] = True
         if extra_frames_count > 0:
             # Record extra frames at the very end to prolong the final state
-            is_in_final_frames = shape_index >= (total_shapes - extra_frames_count)
-            return is_power_law_frame or is_in_final_frames
-        
-        return is_power_law_frame
+            frame_mask[max(total_shapes - extra_frames_count, 0):] = True
+        self._frame_mask = frame_mask
     
     def _should_record_frame(self, shape_index: int, total_shapes: int) -> bool:
         """
@@ -334,17 +420,7 @@ class PaintingEngine:
         Returns:
             True if frame should be recorded
         """
-        # Check conditions for smaller gif export
-        if (self.ui_dict and 
-            self.ui_dict.get("is_enable_smaller_gif_export_size", False) and 
-            self.ui_dict.get("create_gif_of_painting_progress", False) and 
-            not self.ui_dict.get("display_placement_progress", True)):
-            
-            # Use power law method with extra frames at end
-            return self._should_record_frame_power_law_with_extra_end_frames(shape_index, total_shapes)
-        
-        # Default behavior: record all frames when gif creation is enabled
-        return True
+        return self._record_all or bool(self._frame_mask[shape_index])
     
     def get_config_summary(self) -> dict:
         """
@@ -0,0 +1,94 @@
+"""
+Lightweight schema for UI parameter dictionaries.
+Checks key presence, value types and numeric ranges using plain dict lookups,
+without constructing any configuration objects.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class UIFieldSpec:
+    """Expected shape of a single UI parameter"""
+    key: str
+    types: Tuple[type, ...]
+    required: bool = True
+    required_if: Optional[str] = None  # Key of a boolean flag that makes this field required
+    min_value: Optional[float] = None
+    max_value: Optional[float] = None
+
+
+_NUMBER = (int, float)
+_FLAG = (bool, int)
+
+UI_SCHEMA: Tuple[UIFieldSpec, ...] = (
+    # Image parameters
+    UIFieldSpec("computation_size", _NUMBER, min_value=11),
+    UIFieldSpec("texture_opacity", _NUMBER, min_value=1, max_value=100),
+    UIFieldSpec("output_image_size", _NUMBER, required=False, min_value=1),
+
+    # Hill climbing parameters
+    UIFieldSpec("num_textures", _NUMBER, min_value=1),
+    UIFieldSpec("hill_climb_min_iterations", _NUMBER, min_value=1),
+    UIFieldSpec("hill_climb_max_iterations", _NUMBER, min_value=1),
+    UIFieldSpec("initial_texture_width", _NUMBER, min_value=1),
+    UIFieldSpec("uniform_texture_size", _FLAG),
+    UIFieldSpec("failed_iterations_threshold", _NUMBER, min_value=0),
+    UIFieldSpec("allow_early_termination", _FLAG, required=False),
+
+    # Vector field parameters
+    UIFieldSpec("enable_vector_field", _FLAG),
+    UIFieldSpec("vector_field_f", (str,), required=False, required_if="enable_vector_field"),
+    UIFieldSpec("vector_field_g", (str,), required=False, required_if="enable_vector_field"),
+    UIFieldSpec("vector_field_origin_shift", (list, tuple), required=False),
+
+    # Display parameters
+    UIFieldSpec("display_painting_progress", _FLAG, required=False),
+    UIFieldSpec("display_placement_progress", _FLAG, required=False),
+    UIFieldSpec("display_final_image", _FLAG, required=False),
+
+    # Output parameters
+    UIFieldSpec("output_image_name", (str,), required=False),
+    UIFieldSpec("create_gif_of_painting_progress", _FLAG, required=False),
+    UIFieldSpec("painting_progress_gif_name", (str,), required=False),
+    UIFieldSpec("painted_gif_name", (str,), required=False),
+    UIFieldSpec("enable_multiprocessing", _FLAG, required=False),
+)
+
+
+def validate_ui_schema(ui_dict: Dict[str, Any], schema: Tuple[UIFieldSpec, ...] = UI_SCHEMA) -> List[str]:
+    """
+    Check a UI dictionary against the schema.
+
+    Args:
+        ui_dict: UI parameter dictionary to check
+        schema: Field specifications to check against
+
+    Returns:
+        List of validation error messages (empty if the dictionary matches)
+    """
+    errors = []
+    for spec in schema:
+        value = ui_dict.get(spec.key)
+        is_required = spec.required or (spec.required_if is not None and bool(ui_dict.get(spec.required_if)))
+
+        if value is None:
+            if is_required:
+                errors.append(f"Missing required parameter '{spec.key}'")
+            continue
+
+        # bool is a subclass of int, so reject it explicitly for numeric fields
+        if not isinstance(value, spec.types) or (isinstance(value, bool) and bool not in spec.types):
+            expected = " or ".join(t.__name__ for t in spec.types)
+            errors.append(f"Parameter '{spec.key}' must be {expected}, got {type(value).__name__}")
+            continue
+
+        if spec.min_value is not None and value < spec.min_value:
+            errors.append(f"Parameter '{spec.key}' must be >= {spec.min_value}, got {value}")
+        elif spec.max_value is not None and value > spec.max_value:
+            errors.append(f"Parameter '{spec.key}' must be <= {spec.max_value}, got {value}")
+        elif is_required and isinstance(value, str) and not value.strip():
+            errors.append(f"Parameter '{spec.key}' cannot be empty")
+
+    return errors
@@ -1,8 +1,13 @@
 import tkinter.ttk as ttk
 import tkinter as tk
 
+import functools
 import os
+import re
 import warnings
+import weakref
+
+from PIL import Image
 
 try:
     from utils.file_operations import clear_folder_contents
@@ -14,35 +19,48 @@ except ImportError:
 
 
 try:
-    from .select_coordinate_ui import *
+    from .tkinter_components import (VisibilityManager, CustomToggleVisibilityCheckbox, RangeSlider, SingleSlider,
+                                      CustomCheckbox, CustomTextInput, Padding, sanitize_filename)
 except ImportError:
-    from select_coordinate_ui import *
+    from tkinter_components import (VisibilityManager, CustomToggleVisibilityCheckbox, RangeSlider, SingleSlider,
+                                    CustomCheckbox, CustomTextInput, Padding, sanitize_filename)
 
 try:
-    from .tkinter_components import *
+    from .vector_field_equation_ui import VectorFieldVisualizer, create_vector_field_visualizer
 except ImportError:
-    from tkinter_components import *
+    from vector_field_equation_ui import VectorFieldVisualizer, create_vector_field_visualizer
+
 
 try:
-    from .vector_field_equation_ui import *
+    from .read_write_parameter_json import read_parameter_json, write_parameter_json
 except ImportError:
-    from vector_field_equation_ui import *
+    from read_write_parameter_json import read_parameter_json, write_parameter_json
 
+# Print traces of the vector field and shift origin dialogs
+IS_PRINT_DEBUG_INFO = False
 
-try:
-    from .read_write_parameter_json import *
-except ImportError:
-    from read_write_parameter_json import *
+# Brackets and commas of a "(f(x,y), g(x,y))" string, used to find the comma between f and g
+VECTOR_FIELD_DELIMITER_PATTERN = re.compile(r"[(),]")
+
+# Extensions of single-frame targets
+STATIC_IMAGE_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg'})
+SUPPORTED_TARGET_EXTENSIONS = STATIC_IMAGE_EXTENSIONS | {'.gif'}
 
 def count_frames_in_gif(filepath):
     """
     Returns the number of frames in a GIF file.
+    The count is memoized per file and recomputed only when the file's modification time or size changes.
     Args:
         filepath (str): Full path to the GIF file.
     Returns:
         int: Number of frames in the GIF.
     """
-    from PIL import Image
+    stat = os.stat(filepath)
+    return _count_frames_in_gif_cached(os.path.abspath(filepath), stat.st_mtime_ns, stat.st_size)
+
+@functools.lru_cache(maxsize=8)
+def _count_frames_in_gif_cached(filepath, mtime_ns, size):
+    """Seek through the GIF to count its frames. mtime_ns and size only key the cache."""
     with Image.open(filepath) as img:
         count = 0
         try:
@@ -69,26 +87,88 @@ def get_image_dimensions(image_path):
         Exception: For other image processing errors
     """
     
-    # Check if file exists
-    if not os.path.exists(image_path):
-        raise FileNotFoundError(f"Image file not found: {image_path}")
-    
     # Get file extension
     _, ext = os.path.splitext(image_path.lower())
-    supported_formats = ['.jpg', '.jpeg', '.png', '.gif']
-    
-    if ext not in supported_formats:
-        raise ValueError(f"Unsupported format: {ext}. Supported formats: {supported_formats}")
+    if ext not in SUPPORTED_TARGET_EXTENSIONS:
+        raise ValueError(f"Unsupported format: {ext}. Supported formats: {sorted(SUPPORTED_TARGET_EXTENSIONS)}")
     
+    # Let Image.open report a missing file instead of checking for it first
     try:
         with Image.open(image_path) as img:
             width, height = img.size
             return width, height
             
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Image file not found: {image_path}") from None
     except Exception as e:
         raise Exception(f"Error processing image: {str(e)}")
 
+def split_vector_field_string(function_string):
+    """
+    Split a "(f(x,y), g(x,y))" string into its f and g expressions.
+    Only the comma outside of any brackets separates f from g, so "(Max(x, y), y)" gives ("Max(x, y)", "y").
+
+    Args:
+        function_string (str): Vector field string returned by the vector field visualizer
+
+    Returns:
+        tuple: (f_string, g_string)
+    """
+    expr = function_string.strip()
+    if expr.startswith("(") and expr.endswith(")"):
+        expr = expr[1:-1]  # Remove the outer parentheses
+    depth = 0
+    for match in VECTOR_FIELD_DELIMITER_PATTERN.finditer(expr):
+        delimiter = match.group()
+        if delimiter == "(":
+            depth += 1
+        elif delimiter == ")":
+            depth -= 1
+        elif depth == 0:
+            return expr[:match.start()].strip(), expr[match.end():].strip()
+    raise ValueError(f"Vector field string {function_string!r} has no comma separating f and g")
+
+
 class ParameterUI:
+    # Presets and grid sizes offered by the vector field editor, the visualizer only reads them
+    _VECTOR_FIELD_PRESETS = {
+        "Radial Sink": ("-x", "-y"),
+        "Radial Source": ("x", "y"),
+        "Spiral Sink Clockwise": ("-x + y", "-y - x"),
+        "Spiral Sink Anticlockwise": ("-x - y", "x - y"),
+        "Spiral Source Clockwise": ("x - y", "y + x"),
+        "Spiral Source Anticlockwise": ("x + y", "-x + y"),
+        "Rotation Clockwise": ("y", "-x"),
+        "Rotation Anticlockwise": ("-y", "x")
+    }
+    _VECTOR_FIELD_GRID_SIZES = [10, 20, 30]
+    # (parameter key, name of the widget attribute whose get() returns it), read by get_parameters
+    _TAB_1_WIDGET_PARAMETERS = (
+        ('computation_size', 'computation_size_slider'),
+        ('num_textures', 'num_shapes_slider'),
+        ('texture_opacity', 'texture_opacity_slider'),
+        ('initial_texture_width', 'rect_width_slider'),
+        ('uniform_texture_size', 'scaling_chk'),
+        ('allow_early_termination', 'premature_chk'),
+        ('failed_iterations_threshold', 'fail_threshold_slider'),
+        ('enable_vector_field', 'vector_field_chk'),
+    )
+    _TAB_1_STATIC_IMAGE_WIDGET_PARAMETERS = (
+        ('display_painting_progress', 'show_pygame_chk'),
+        ('display_placement_progress', 'rect_improve_chk'),
+        ('display_final_image', 'display_final_chk'),
+    )
+    _TAB_2_STATIC_IMAGE_WIDGET_PARAMETERS = (
+        ('output_image_size', 'output_size_slider'),
+        ('output_image_name', 'image_name_input'),
+        ('create_gif_of_painting_progress', 'create_gif_chk'),
+    )
+    _TAB_2_GIF_WIDGET_PARAMETERS = (
+        ('num_frames_to_paint', 'frames_in_gif_slider'),
+        ('painted_gif_name', 'painted_gif_name_input'),
+        ('enable_multiprocessing', 'multiprocessing_chk'),
+    )
+
     def __init__(self, target_filepath, gif_frames_full_filepath_list = None):
         """
         Initialize the Parameter UI with an optional target file path.
@@ -100,10 +180,14 @@ class ParameterUI:
         self.gif_frames_full_filepath_list = gif_frames_full_filepath_list # will be provided if the target is gif
 
         self.file_ext = os.path.splitext(self.target_filepath)[1].lower() if self.target_filepath else None # Gets the file extention
-        if self.file_ext == ".gif":
-            self.num_frames_in_original_gif = count_frames_in_gif(self.target_filepath)
+        # Target kind, checked once here instead of comparing extension strings in every branch
+        self.is_gif = self.file_ext == '.gif'
+        self.is_static_image = self.file_ext in STATIC_IMAGE_EXTENSIONS
+        if self.is_gif:
             if gif_frames_full_filepath_list is None:
                 raise AssertionError("Extention is gif but no gif frames are provided for ParameterUI")
+            # Every frame of the target gif is extracted beforehand, so the frame count is known without decoding the gif
+            self.num_frames_in_original_gif = len(gif_frames_full_filepath_list) if gif_frames_full_filepath_list else count_frames_in_gif(self.target_filepath)
         # Abstracted dimensions for first tab components
         self.PARAM_COMPONENT_WIDTH = 530
         self.PARAM_SLIDER_HEIGHT = 100
@@ -111,24 +195,25 @@ class ParameterUI:
         self.PARAM_CHECKBOX_HEIGHT = 25
         self.PARAM_TEXT_INPUT_HEIGHT = 100
         self.PAD_BETWEEN_ALL_COMPONENTS = 1
+        # Pack options shared by every registered component, VisibilityManager only reads them
+        self.COMPONENT_PACK_INFO = {'fill': 'x', 'pady': self.PAD_BETWEEN_ALL_COMPONENTS}
+        self.INDENTED_COMPONENT_PACK_INFO = {'fill': 'x', 'padx': (20, 0), 'pady': self.PAD_BETWEEN_ALL_COMPONENTS}
+        self.PADDING_PACK_INFO = {'fill': 'x'}
         self.CUSTOM_PADDING_HEIGHT = 20
+        # First component of a numbered section, its top pady is the gap to the previous section
+        self.SECTION_PACK_INFO = {'fill': 'x', 'pady': (self.CUSTOM_PADDING_HEIGHT + self.PAD_BETWEEN_ALL_COMPONENTS, self.PAD_BETWEEN_ALL_COMPONENTS)}
         self.CUSTOM_PADDING_BG = "white"
+        self.PARAM_COMPONENT_BG = "#FFFFFF"
+        self.OUTPUT_TAB_INDEX = 1  # Notebook index of the lazily built Output Settings tab
         
-        # Define a palette of visually distinct pastel colors
-        self.PASTEL_COLORS = [
-            '#FFB3BA',  # light red
-            '#BAE1FF',  # light blue
-            '#BAFFC9',  # light green
-            '#FFFFBA',  # light yellow
-            '#FFDFBA',  # light orange
-            '#E2BAFF',  # light purple
-        ]
-        self.PASTEL_COLORS = [
-            '#FFFFFF'  # light red
-
-        ]
-        self.widget_color_idx = 0
-        self.prev_color_idx = None
+        # ttk style of this window's root, created once by _get_style
+        self.style = None
+        # Exit confirmation dialog, built once by _get_or_create_exit_dialog
+        self._exit_dialog = None
+        # Shift vector origin button label and selected state, queued by _set_shift_origin_btn and applied when Tk is idle
+        self._pending_shift_origin_btn = None
+        self._applied_shift_origin_btn = (None, None)
+        self._is_shift_origin_btn_flush_scheduled = False
         
 
         # Initialize the param dict to be returned
@@ -245,11 +330,11 @@ class ParameterUI:
         # If the target image dimensions match the previous dimensions and has the same extention
         if self.is_same_target_ext_and_dimension:
             # Check if the list of coordinates is still valid
-            if self.file_ext == ".gif" and len(self.i_vector_field_origin_shift_list_of_coords) != self.num_frames_in_original_gif:
+            if self.is_gif and len(self.i_vector_field_origin_shift_list_of_coords) != self.num_frames_in_original_gif:
                 print("Number of coordinates do not match number of frames in the original gif, resetting the list of coordinates for shifting vector field origin")
                 self.list_of_coord_for_shifting_vector_field_origin = [[]]  # Reset to empty list
                 self.is_shift_origin_coord_selected = False
-            elif self.file_ext != ".gif" and len(self.i_vector_field_origin_shift_list_of_coords) != 1:
+            elif not self.is_gif and len(self.i_vector_field_origin_shift_list_of_coords) != 1:
                 print("Target is not gif but the list of coordinates for shifting vector field origin has more than one coordinate, resetting the list of coordinates for shifting vector field origin")
                 self.list_of_coord_for_shifting_vector_field_origin = [[]]  # Reset to empty list
                 self.is_shift_origin_coord_selected = False
@@ -266,9 +351,9 @@ class ParameterUI:
 
         if self.is_shift_origin_coord_selected:
             self.initial_choose_vector_eqn_btn_label = \
-                f"Shift origin to {str(tuple(self.list_of_coord_for_shifting_vector_field_origin[0]))}" if self.file_ext != ".gif" else f"Shift origin to {str(tuple(self.list_of_coord_for_shifting_vector_field_origin[0]))}, {str(tuple(self.list_of_coord_for_shifting_vector_field_origin[1]))}, ..."
+                f"Shift origin to {tuple(self.list_of_coord_for_shifting_vector_field_origin[0])}" if not self.is_gif else f"Shift origin to {tuple(self.list_of_coord_for_shifting_vector_field_origin[0])}, {tuple(self.list_of_coord_for_shifting_vector_field_origin[1])}, ..."
         else:
-            self.initial_choose_vector_eqn_btn_label = "Shift origin to (?, ?)" if self.file_ext != ".gif" else "Shift origin to (?, ?), (?, ?), ..."
+            self.initial_choose_vector_eqn_btn_label = "Shift origin to (?, ?)" if not self.is_gif else "Shift origin to (?, ?), (?, ?), ..."
 
         # Output tab initial parameters
         # 1) Output image size
@@ -290,11 +375,18 @@ class ParameterUI:
         # B) Multiprocessing checkbox
         self.i_enable_multiprocessing_bool = get_value("enable_multiprocessing", assert_type=bool)
 
+    def _get_style(self):
+        """Return the ttk style of this window, switching to the clam theme only the first time"""
+        if self.style is None:
+            self.style = ttk.Style(self.root)
+            # Switching theme, even to the current one, makes Tk restyle every widget
+            if self.style.theme_use() != 'clam':
+                self.style.theme_use('clam')
+        return self.style
+
     def apply_modern_notebook_style(self):
         """Apply modern styling to the ttk.Notebook and remove dotted focus line from tabs"""
-        # Set the clam theme
-        style = ttk.Style()
-        style.theme_use('clam')
+        style = self._get_style()
 
         # Configure notebook style
         style.configure('TNotebook', 
@@ -311,18 +403,27 @@ class ParameterUI:
                        relief='flat',
                        font = ('Segoe UI', 12))
         
-        # Configure selected tab
+        # Configure selected tab. Padding and relief already match the base tab style, so they are not mapped.
+        # The notebook uses the default TNotebook style, so it needs no style option of its own.
         style.map('TNotebook.Tab',
-                    padding=[('selected', [20, 8]), ('active', [20, 8])],
                   background=[('selected', 'white'), ('active', "#4792d3")],
-                  foreground=[('selected', 'black'), ('active', 'white')],
-                  relief=[('selected', 'flat'), ('active', 'flat')])
-        
-
-        # Apply the custom style to the notebook
-        self.notebook.configure(style="TNotebook")
+                  foreground=[('selected', 'black'), ('active', 'white')])
 
     class ScrollableFrame(tk.Frame):
+        # Live frames and the Tk roots whose "all" tag carries the shared wheel handler
+        _instances = weakref.WeakSet()
+        _bound_roots = weakref.WeakSet()
+        # x position of the inner frame, the frame window is the canvas' only item
+        _FRAME_OFFSET_X = 5
+        # Tcl global naming the canvas under the cursor. The wheel bindings are plain Tcl scripts that
+        # scroll it directly, so Python only runs when the cursor enters or leaves a frame, not per wheel tick.
+        _WHEEL_CANVAS_VAR = "scrollable_frame_wheel_canvas"
+        _WHEEL_SCRIPTS = {
+            "<MouseWheel>": "if {[info exists ::%s] && $::%s ne {}} {catch {$::%s yview scroll [expr {int(-%%D / 120.0)}] units}}",
+            "<Button-4>": "if {[info exists ::%s] && $::%s ne {}} {catch {$::%s yview scroll -1 units}}",
+            "<Button-5>": "if {[info exists ::%s] && $::%s ne {}} {catch {$::%s yview scroll 1 units}}",
+        }
+        
         def __init__(self, master, **kwargs):
             super().__init__(master, **kwargs)
             canvas = tk.Canvas(self, borderwidth=0, background="white", highlightthickness=0)
@@ -331,115 +432,122 @@ class ParameterUI:
             canvas.configure(yscrollcommand=vsb.set)
             canvas.pack(side="left", fill="both", expand=True)
             vsb.pack(side="right", fill="y")
-            canvas.create_window((5, 0), window=self.frame, anchor="nw")
+            canvas.create_window((self._FRAME_OFFSET_X, 0), window=self.frame, anchor="nw")
             
-            self.frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
             self.canvas = canvas
-            self.cursor_inside = False
-            
-            # Store the after ID for cursor tracking
-            self.cursor_check_id = None
+            # Scrolling moves the inner frame, which fires <Configure> on every scroll step.
+            # Only a change in content size needs a new scroll region.
+            self._content_size = None
+            # A reflow of many children fires a burst of <Configure> events, update the scroll region once per burst
+            self._is_scrollregion_update_pending = False
+            self.frame.bind("<Configure>", self._on_frame_configure)
             
             self._setup_cursor_tracking()
             self._setup_global_scrolling()
         
+        def _on_frame_configure(self, event):
+            if (event.width, event.height) == self._content_size:
+                return
+            self._content_size = (event.width, event.height)
+            if not self._is_scrollregion_update_pending:
+                self._is_scrollregion_update_pending = True
+                self.after_idle(self._update_scrollregion)
+        
+        def _update_scrollregion(self):
+            self._is_scrollregion_update_pending = False
+            # The frame window is the only canvas item, so its size from <Configure> is the bbox of "all"
+            width, height = self._content_size
+            try:
+                self.canvas.configure(scrollregion=(self._FRAME_OFFSET_X, 0, self._FRAME_OFFSET_X + width, height))
+            except tk.TclError:
+                pass  # Frame was destroyed before the idle callback ran
+        
+        def _is_point_inside(self, x, y):
+            widget_x = self.winfo_rootx()
+            widget_y = self.winfo_rooty()
+            return (widget_x <= x <= widget_x + self.winfo_width() and 
+                    widget_y <= y <= widget_y + self.winfo_height())
+        
+        def _set_wheel_target(self, is_active):
+            """Point the Tcl wheel handler at this frame's canvas, or clear it if it still points here"""
+            name = self._WHEEL_CANVAS_VAR
+            if is_active:
+                self.tk.globalsetvar(name, str(self.canvas))
+            elif self.tk.call('info', 'exists', name) and str(self.tk.globalgetvar(name)) == str(self.canvas):
+                self.tk.globalsetvar(name, '')
+        
         def _setup_cursor_tracking(self):
-            """Set up cursor tracking using continuous position monitoring"""
-            def check_cursor_position():
+            """Track whether the cursor is over this frame with <Enter>/<Leave> events"""
+            def on_enter(event):
+                self._set_wheel_target(True)
+            
+            def on_leave(event):
+                # <Leave> also fires when the cursor moves onto a child widget, so check where it went
                 try:
-                    x, y = self.winfo_pointerxy()
-                    widget_x = self.winfo_rootx()
-                    widget_y = self.winfo_rooty()
-                    widget_width = self.winfo_width()
-                    widget_height = self.winfo_height()
-                    was_inside = self.cursor_inside
-                    self.cursor_inside = (widget_x <= x <= widget_x + widget_width and 
-                                        widget_y <= y <= widget_y + widget_height)
-                    # Schedule next check and store the after ID
-                    self.cursor_check_id = self.after(50, check_cursor_position)
+                    if not self._is_point_inside(event.x_root, event.y_root):
+                        self._set_wheel_target(False)
                 except tk.TclError:
-                    # Widget might be destroyed
-                    return
+                    pass  # Widget is being destroyed
+            
+            def on_unmap(event):
+                # Frames on hidden notebook tabs must never scroll
+                if event.widget is self:
+                    self._set_wheel_target(False)
             
-            # Start cursor position monitoring
-            self.after_idle(check_cursor_position)
+            self.bind("<Enter>", on_enter)
+            self.bind("<Leave>", on_leave)
+            self.bind("<Unmap>", on_unmap)
         
         def _setup_global_scrolling(self):
-            """Set up global mouse wheel event handling"""
-            def on_mousewheel(event):
-                if not self.cursor_inside:
-                    return
-                if not self.canvas.winfo_exists():
-                    return
-                scroll_region = self.canvas.cget("scrollregion")
-                if not scroll_region:
-                    return
-                region_coords = scroll_region.split()
-                if len(region_coords) != 4:
-                    return
-                content_height = float(region_coords[3])
-                canvas_height = self.canvas.winfo_height()
-                if content_height <= canvas_height:
-                    return
-                if hasattr(event, 'delta') and event.delta:
-                    delta = -1 * (event.delta / 120)
-                else:
-                    if hasattr(event, 'num'):
-                        delta = -1 if event.num == 4 else 1
-                    else:
-                        return
-                self.canvas.yview_scroll(int(delta), "units")
+            """Register for mouse wheel events, binding one shared handler per Tk interpreter"""
+            ParameterUI.ScrollableFrame._instances.add(self)
             
             def setup_global_binding():
-                root = self.winfo_toplevel()
-                root.bind_all("<MouseWheel>", on_mousewheel, add=True)
-                root.bind_all("<Button-4>", on_mousewheel, add=True)
-                root.bind_all("<Button-5>", on_mousewheel, add=True)
+                root = self._root()
+                if root in ParameterUI.ScrollableFrame._bound_roots:
+                    return
+                ParameterUI.ScrollableFrame._bound_roots.add(root)
+                name = ParameterUI.ScrollableFrame._WHEEL_CANVAS_VAR
+                for sequence, script in ParameterUI.ScrollableFrame._WHEEL_SCRIPTS.items():
+                    root.bind_all(sequence, script % (name, name, name))
             
             self.after_idle(setup_global_binding)
         
         def destroy(self):
-            """Clean up global bindings and cancel after callbacks when widget is destroyed"""
-            # Cancel the cursor tracking after callback
-            if self.cursor_check_id is not None:
+            """Clean up global bindings when widget is destroyed"""
+            try:
+                self._set_wheel_target(False)
+            except tk.TclError:
+                pass  # Interpreter is already gone
+            
+            # Unbind the shared wheel handler once no other ScrollableFrame of this interpreter needs it
+            instances = ParameterUI.ScrollableFrame._instances
+            instances.discard(self)
+            root = self._root()
+            if root in ParameterUI.ScrollableFrame._bound_roots and \
+                    not any(instance._root() is root for instance in instances):
+                ParameterUI.ScrollableFrame._bound_roots.discard(root)
                 try:
-                    self.after_cancel(self.cursor_check_id)
+                    root.unbind_all("<MouseWheel>")
+                    root.unbind_all("<Button-4>")
+                    root.unbind_all("<Button-5>")
                 except tk.TclError as e:
                     print(e)
-                    pass  # Ignore if the callback is already invalid
-                self.cursor_check_id = None
-            
-            # Optionally unbind global mouse wheel events
-            try:
-                root = self.winfo_toplevel()
-                root.unbind_all("<MouseWheel>")
-                root.unbind_all("<Button-4>")
-                root.unbind_all("<Button-5>")
-            except tk.TclError as e:
-                print(e)
-                pass  # Ignore if the root window is already destroyed
+                    pass  # Ignore if the root window is already destroyed
             
             super().destroy()
 
     def add_section_pad(self, frame):
         tk.Frame(frame, height=20, bg='white').pack(fill='x')
     
-    def get_next_color(self, idx, prev_idx=None):
-        # Ensure no two adjacent widgets have the same color
-        color_idx = idx % len(self.PASTEL_COLORS)
-        if prev_idx is not None and color_idx == prev_idx:
-            color_idx = (color_idx + 1) % len(self.PASTEL_COLORS)
-        return self.PASTEL_COLORS[color_idx], color_idx
-    
-    def add_between_padding(self, frame, vis_manager):
-        between_padding = Padding(frame, height=self.CUSTOM_PADDING_HEIGHT, bg_color=self.CUSTOM_PADDING_BG)
-        between_padding.pack(fill='x')
-        vis_manager.register_widget(between_padding, {'fill': 'x'})
+    def add_bottom_padding(self, frame, vis_manager):
+        # Gaps between sections come from SECTION_PACK_INFO, only the space below the last section needs a widget
+        bottom_padding = Padding(frame, height=self.CUSTOM_PADDING_HEIGHT, bg_color=self.CUSTOM_PADDING_BG)
+        vis_manager.register_widget(bottom_padding, self.PADDING_PACK_INFO)
 
     def setup_button_style(self):
         """Apply the exact style from TargetTextureSelectorUI for TButton."""
-        self.style = ttk.Style()
-        self.style.theme_use('clam')
+        self._get_style()
 
         # Button 1
         self.style.configure(
@@ -464,8 +572,6 @@ class ParameterUI:
             focuscolor='none'
         )
         self.style.map("button2.TButton", background=[("active", "#1b5e20")]) # Darker green when active
-        self.button1.configure(style="button1.TButton")
-        self.button2.configure(style="button2.TButton")
 
         self.style.configure(
             'button_edit_vector_field.TButton',
@@ -489,19 +595,38 @@ class ParameterUI:
             padding=(0, 8),  # (horizontal_padding, vertical_padding)
             relief='default',
             background='#ffffff',  # white background
-            foreground='black' if self.is_shift_origin_coord_selected else 'red',     # red text
+            foreground='red',     # red text until the button is in the 'selected' state
             focuscolor='none',
             borderwidth=2
         )
+        # Selecting origin(s) flips the button's own 'selected' state instead of reconfiguring the shared style
         self.style.map(
             "button_shift_vector_field.TButton",
             background=[('selected', 'white'), ('active', "#dcefff")],
             foreground=[('selected', 'black'), ('active', 'black')],
         )
 
+        # Exit confirmation dialog buttons
+        self.style.configure(
+            "Modern.TButton",
+            font=("Segoe UI", 12),
+            padding=10,
+            background="#ffffff",
+            foreground="#333333",
+            borderwidth=0,
+            focuscolor="none"
+        )
+        self.style.map(
+            "Modern.TButton",
+            background=[('selected', 'white'), ('active', "#4792d3")],
+            foreground=[('selected', 'black'), ('active', 'white')],
+        )
+
     def _create_ui(self):
         """Create the main UI elements"""
         self.root = tk.Tk()
+        # Keep the window unmapped until every widget is packed, so it first appears with its final layout
+        self.root.withdraw()
         self.root.title("Select parameters")
 
 
@@ -543,6 +668,8 @@ class ParameterUI:
 
         self.notebook = ttk.Notebook(self.parent_frame)
         self.apply_modern_notebook_style()
+        # Configure button styles before any button exists, so each is created with its final look
+        self.setup_button_style()
         self.notebook.pack(fill='both', expand=True)
 
         # Tab 1: Parameters
@@ -555,35 +682,59 @@ class ParameterUI:
         self.output_scroll = self.ScrollableFrame(self.notebook)
         self.output_frame = self.output_scroll.frame
         self.output_vis_manager = VisibilityManager()  # Separate VisibilityManager for Tab 2
-        self._create_parameter_widgets_tab_2()
+        # Tab 2 widgets are built the first time the tab is opened
+        self._pending_tab_builders = {self.OUTPUT_TAB_INDEX: self._create_parameter_widgets_tab_2}
 
         self.notebook.add(self.param_scroll, text="Parameters")
         self.notebook.add(self.output_scroll, text="Output Settings")
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
 
         self.dual_button_frame = tk.Frame(self.parent_frame, bg="white", height = 50)
         self.dual_button_frame.pack(fill="x")
 
         # Bind button1 to on_select_target_texture
         padx,pady=1,0
-        self.button1 = ttk.Button(self.dual_button_frame, text="Select target and texture", command=self.on_select_target_texture) 
+        self.button1 = ttk.Button(self.dual_button_frame, text="Select target and texture", style="button1.TButton",
+                                  command=self.on_select_target_texture) 
         self.button1.grid(row=0, column=0, sticky="nsew", padx=padx, pady=pady)
-        self.button2 = ttk.Button(self.dual_button_frame, text="Submit", command=self.on_submit_button_press, 
-                                  state="normal" if self.is_shift_origin_coord_selected else "disabled")
-        if not self.i_enable_vector_field_bool:
-            self.button2.configure(state="normal")
+        is_submit_enabled = self.is_shift_origin_coord_selected or not self.i_enable_vector_field_bool
+        self.button2 = ttk.Button(self.dual_button_frame, text="Submit", style="button2.TButton", command=self.on_submit_button_press, 
+                                  state="normal" if is_submit_enabled else "disabled")
         self.button2.grid(row=0, column=1, sticky="nsew", padx=padx, pady=pady)
 
-        self.setup_button_style()
-
         self.dual_button_frame.grid_columnconfigure(0, weight=1, uniform="group1")
         self.dual_button_frame.grid_columnconfigure(1, weight=1, uniform="group1")
 
+        # Compute the geometry of all packed widgets in one pass, then show the window
+        self.root.update_idletasks()
+        self.root.deiconify()
+
     def on_closing(self):
         """Handle the window close event with a modern confirmation dialog"""
+        dialog = self._get_or_create_exit_dialog()
+        dialog.deiconify()
+        dialog.lift()
+        # Ensure dialog grabs focus
+        dialog.grab_set()
+
+    def _get_or_create_exit_dialog(self):
+        """
+        Build the exit confirmation dialog the first time it is needed and reuse it afterwards.
+        
+        Returns:
+            tk.Toplevel: The (withdrawn) confirmation dialog
+        """
+        if self._exit_dialog is not None:
+            return self._exit_dialog
+
         dialog = tk.Toplevel(self.root)
+        # Stay hidden until on_closing shows it
+        dialog.withdraw()
         dialog.title("Confirm Exit")
         dialog.resizable(False, False)
         dialog.attributes('-topmost', True)
+        # Closing the dialog itself answers "No"
+        dialog.protocol("WM_DELETE_WINDOW", self._hide_exit_dialog)
         
         # Modern styling
         dialog.configure(bg="#f0f2f5")
@@ -619,23 +770,6 @@ class ParameterUI:
         button_frame.grid_columnconfigure(0, weight=1)
         button_frame.grid_columnconfigure(1, weight=1)
         
-        # Modern button style
-        style = ttk.Style()
-        style.configure(
-            "Modern.TButton",
-            font=("Segoe UI", 12),
-            padding=10,
-            background="#ffffff",
-            foreground="#333333",
-            borderwidth=0,
-            focuscolor="none"
-        )
-        style.map(
-            "Modern.TButton",
-            background=[('selected', 'white'), ('active', "#4792d3")],
-            foreground=[('selected', 'black'), ('active', 'white')],
-        )
-
         # Yes button
         yes_button = ttk.Button(
             button_frame,
@@ -650,12 +784,11 @@ class ParameterUI:
             button_frame,
             text="No",
             style="Modern.TButton",
-            command=dialog.destroy
+            command=self._hide_exit_dialog
         )
         no_button.grid(row=0, column=1, padx=(5, 0), pady=5, ipadx=20, ipady=5, sticky="ew")
         
         # Add subtle shadow effect to dialog
-        dialog.update_idletasks()
         dialog.configure(
             borderwidth=1,
             relief="flat",
@@ -664,9 +797,15 @@ class ParameterUI:
             highlightthickness=1
         )
         
-        # Ensure dialog stays on top and grabs focus
-        dialog.grab_set()
+        # Ensure dialog stays on top of the parameter window
         dialog.transient(self.root)
+        self._exit_dialog = dialog
+        return dialog
+
+    def _hide_exit_dialog(self):
+        """Release the grab and hide the exit dialog so it can be shown again"""
+        self._exit_dialog.grab_release()
+        self._exit_dialog.withdraw()
 
     def confirm_exit(self, dialog):
         """Set result for window close and destroy the dialog and root"""
@@ -687,7 +826,7 @@ class ParameterUI:
     def on_submit_button_press(self):
         """Handle 'Submit' button press"""
         # Clear painted_gif_frames folder if input is a GIF
-        if self.file_ext == ".gif":
+        if self.is_gif:
             try:
                 clear_folder_contents("painted_gif_frames")
                 print("Cleared painted_gif_frames folder")
@@ -699,372 +838,269 @@ class ParameterUI:
         self.save_parameters()
         self.root.quit()  # Exit mainloop
         self.root.destroy()  # Destroy window
+    def _add_widget(self, frame, vis_manager, widget_cls, controller=None, pack_info=None, **kwargs):
+        """
+        Create a full-width widget in frame, then pack it and register it with vis_manager.
+        
+        Args:
+            frame: Tab frame that holds the widget
+            vis_manager (VisibilityManager): Visibility manager of the tab
+            widget_cls: Custom widget class (SingleSlider, RangeSlider, CustomCheckbox, ...)
+            controller: Checkbox that shows or hides the widget, if any
+            pack_info (dict): Pack options, defaults to COMPONENT_PACK_INFO
+            **kwargs: Widget specific options
+            
+        Returns:
+            The created widget
+        """
+        widget = widget_cls(frame, width=self.PARAM_COMPONENT_WIDTH, is_set_width_to_parent=True,
+                            bg_color=self.PARAM_COMPONENT_BG, **kwargs)
+        vis_manager.register_widget(widget, pack_info or self.COMPONENT_PACK_INFO, controller=controller)
+        return widget
+
     # Tab 1
+    def _add_param_widget(self, widget_cls, **kwargs):
+        """Create a full-width widget on the Parameters tab, see _add_widget"""
+        return self._add_widget(self.param_frame, self.param_vis_manager, widget_cls, **kwargs)
+
     def _create_parameter_widgets_tab_1(self):
+        """Create all parameter widgets for the first tab"""
         # Check file extension
         if not self.target_filepath:
             return
-        file_ext = self.file_ext
 
-        """Create all parameter widgets for the first tab"""
         # 1) Computation size
-        self.add_between_padding(self.param_frame, self.param_vis_manager)
-        color, self.widget_color_idx = self.get_next_color(self.widget_color_idx, self.prev_color_idx)
-        self.prev_color_idx = self.widget_color_idx
-        self.computation_size_slider = SingleSlider(self.param_frame, 
+        self.computation_size_slider = self._add_param_widget(SingleSlider,
+            pack_info=self.SECTION_PACK_INFO,
             min_val=self.i_computation_size_min_value, 
             max_val=self.i_computation_size_max_value, 
             init_val=self.i_computation_size, 
-            width=self.PARAM_COMPONENT_WIDTH, 
             title="1) Computation size: <current_value> pixels", 
             subtitle="- Increase to capture more image detail, decrease for speed\n- Slider movement resets existing selection of vector field origin translation coordinates", 
-            is_set_width_to_parent=True, 
-            bg_color=color, 
-            command=self.on_computation_size_slider_change
+            command=self.on_computation_size_slider_change,
+            command_delay_ms=100
         )
-        self.computation_size_slider.pack(fill='x', pady=self.PAD_BETWEEN_ALL_COMPONENTS)
-        self.param_vis_manager.register_widget(self.computation_size_slider, {'fill': 'x', 'pady': self.PAD_BETWEEN_ALL_COMPONENTS})
-        self.add_between_padding(self.param_frame, self.param_vis_manager)
         self.resize_shorter_side_of_target = self.computation_size_slider.get()
 
-
         # 2) Add how many textures
-        color, self.widget_color_idx = self.get_next_color(self.widget_color_idx+1, self.prev_color_idx)
-        self.prev_color_idx = self.widget_color_idx
-        self.num_shapes_slider = SingleSlider(self.param_frame, 
+        self.num_shapes_slider = self._add_param_widget(SingleSlider,
+            pack_info=self.SECTION_PACK_INFO,
             min_val=self.i_num_textures_min_value, 
             max_val=self.i_num_textures_max_value, 
             init_val=self.i_num_textures, 
-            width=self.PARAM_COMPONENT_WIDTH, 
             title="2) Add <current_value> textures", 
-            subtitle="- Increase to paint finer details, decrease for speed", 
-            is_set_width_to_parent=True, 
-            bg_color=color
+            subtitle="- Increase to paint finer details, decrease for speed"
         )
-        self.num_shapes_slider.pack(fill='x', pady=self.PAD_BETWEEN_ALL_COMPONENTS)
-        self.param_vis_manager.register_widget(self.num_shapes_slider, {'fill': 'x', 'pady': self.PAD_BETWEEN_ALL_COMPONENTS})
-        self.add_between_padding(self.param_frame, self.param_vis_manager)
-
 
         # 3) Number of hill climb iterations
-        color, self.widget_color_idx = self.get_next_color(self.widget_color_idx+1, self.prev_color_idx)
-        self.prev_color_idx = self.widget_color_idx
-        self.hill_climb_range = RangeSlider(self.param_frame, 
+        self.hill_climb_range = self._add_param_widget(RangeSlider,
+            pack_info=self.SECTION_PACK_INFO,
             min_val=self.i_num_hill_climb_iterations_min_value, 
             max_val=self.i_num_hill_climb_iterations_max_value, 
             init_min=self.i_num_hill_climb_iterations_current_lower_value, 
             init_max=self.i_num_hill_climb_iterations_current_upper_value,
-            width=self.PARAM_COMPONENT_WIDTH,
             title="3) Number of hill climb iterations: Min = <current_min_value>, Max = <current_max_value>", 
-            subtitle="- Number of iterations grows linearly as more textures are painted. \n- Higher iteraton improves texture placement but requires more computation", 
-            is_set_width_to_parent=True, 
-            bg_color=color
+            subtitle="- Number of iterations grows linearly as more textures are painted. \n- Higher iteraton improves texture placement but requires more computation"
         )
-        self.hill_climb_range.pack(fill='x', pady=self.PAD_BETWEEN_ALL_COMPONENTS)
-        self.param_vis_manager.register_widget(self.hill_climb_range, {'fill': 'x', 'pady': self.PAD_BETWEEN_ALL_COMPONENTS})
-        self.add_between_padding(self.param_frame, self.param_vis_manager)
-
 
         # 4) Texture opacity settings
-        color, self.widget_color_idx = self.get_next_color(self.widget_color_idx+1, self.prev_color_idx)
-        self.prev_color_idx = self.widget_color_idx
-        self.texture_opacity_slider = SingleSlider(self.param_frame, 
+        self.texture_opacity_slider = self._add_param_widget(SingleSlider,
+            pack_info=self.SECTION_PACK_INFO,
             min_val=self.i_texture_opacity_min_value, 
             max_val=self.i_texture_opacity_max_value, 
             init_val=self.i_texture_opacity, 
-            width=self.PARAM_COMPONENT_WIDTH,
             title="4) Texture opacity: <current_value>%", 
-            subtitle="- Give the texture a translucent effect by decreasing its opacity", 
-            is_set_width_to_parent=True, 
-            bg_color=color
+            subtitle="- Give the texture a translucent effect by decreasing its opacity"
         )
-        self.texture_opacity_slider.pack(fill='x', pady=self.PAD_BETWEEN_ALL_COMPONENTS)
-        self.param_vis_manager.register_widget(self.texture_opacity_slider, {'fill': 'x', 'pady': self.PAD_BETWEEN_ALL_COMPONENTS})
-        self.add_between_padding(self.param_frame, self.param_vis_manager)
-
 
         # 5) Initial texture width
-        color, self.widget_color_idx = self.get_next_color(self.widget_color_idx+1, self.prev_color_idx)
-        self.prev_color_idx = self.widget_color_idx
-        self.rect_width_slider = SingleSlider(self.param_frame, 
+        self.rect_width_slider = self._add_param_widget(SingleSlider,
+            pack_info=self.SECTION_PACK_INFO,
             min_val=self.i_initial_texture_width_min_value, 
             max_val=self.i_initial_texture_width_max_value, 
             init_val=self.i_initial_texture_width, 
-            width=self.PARAM_COMPONENT_WIDTH, 
             title="5) Initial texture size: <current_value> pixels", 
-            subtitle="- Influences size of texture when it is initially created", 
-            is_set_width_to_parent=True, 
-            bg_color=color)
-        self.rect_width_slider.pack(fill='x', pady=self.PAD_BETWEEN_ALL_COMPONENTS)
-        self.param_vis_manager.register_widget(self.rect_width_slider, {'fill': 'x', 'pady': self.PAD_BETWEEN_ALL_COMPONENTS})
-        self.add_between_padding(self.param_frame, self.param_vis_manager)
-
+            subtitle="- Influences size of texture when it is initially created"
+        )
 
         # 6) Fix size of texture
-        color, self.widget_color_idx = self.get_next_color(self.widget_color_idx+1, self.prev_color_idx)
-        self.prev_color_idx = self.widget_color_idx
-        self.scaling_chk = CustomCheckbox(self.param_frame, 
+        self.scaling_chk = self._add_param_widget(CustomCheckbox,
+            pack_info=self.SECTION_PACK_INFO,
             text="6) Constrain texture size to initial size", 
             checked=self.i_uniform_texture_size_bool, 
-            width=self.PARAM_COMPONENT_WIDTH, 
-            height=self.PARAM_CHECKBOX_HEIGHT, 
-            is_set_width_to_parent=True, 
-            bg_color=color)
-        self.scaling_chk.pack(fill='x', pady=self.PAD_BETWEEN_ALL_COMPONENTS)
-        self.param_vis_manager.register_widget(self.scaling_chk, {'fill': 'x', 'pady': self.PAD_BETWEEN_ALL_COMPONENTS})
-        self.add_between_padding(self.param_frame, self.param_vis_manager)
-
+            height=self.PARAM_CHECKBOX_HEIGHT
+        )
 
-        if file_ext in ['.png', '.jpg', '.jpeg']:
+        if self.is_static_image:
             # 7) Show painting progress as new textures are added
-            color, self.widget_color_idx = self.get_next_color(self.widget_color_idx+1, self.prev_color_idx)
-            self.prev_color_idx = self.widget_color_idx
-            self.show_pygame_chk = CustomToggleVisibilityCheckbox(self.param_frame, 
+            self.show_pygame_chk = self._add_param_widget(CustomToggleVisibilityCheckbox,
+                pack_info=self.SECTION_PACK_INFO,
                 text="7) Display painting progress", 
                 checked=self.i_display_painting_progress_bool, 
                 visibility_manager=self.param_vis_manager, 
-                width=self.PARAM_COMPONENT_WIDTH, 
-                height=self.PARAM_CHECKBOX_HEIGHT, 
-                is_set_width_to_parent=True, 
-                bg_color=color
+                height=self.PARAM_CHECKBOX_HEIGHT
             )
-            self.show_pygame_chk.pack(fill='x', pady=self.PAD_BETWEEN_ALL_COMPONENTS)
-            self.param_vis_manager.register_widget(self.show_pygame_chk, {'fill': 'x', 'pady': self.PAD_BETWEEN_ALL_COMPONENTS})
             # 7a) Show improvement of individual textures
-            color, self.widget_color_idx = self.get_next_color(self.widget_color_idx+1, self.prev_color_idx)
-            self.prev_color_idx = self.widget_color_idx
-            self.rect_improve_chk = CustomCheckbox(self.param_frame,
+            self.rect_improve_chk = self._add_param_widget(CustomCheckbox,
                 text="7a) Show improvement of individual textures", 
                 checked=self.i_display_placement_progress_bool, 
-                width=self.PARAM_COMPONENT_WIDTH, 
-                height=self.PARAM_CHECKBOX_HEIGHT, 
-                is_set_width_to_parent=True, 
-                bg_color=color
+                height=self.PARAM_CHECKBOX_HEIGHT
             )
-            self.rect_improve_chk.pack(fill='x', pady=self.PAD_BETWEEN_ALL_COMPONENTS)
-            self.param_vis_manager.register_widget(self.rect_improve_chk, {'fill': 'x', 'pady': self.PAD_BETWEEN_ALL_COMPONENTS})
-            # 7b) Display final image after painting (conditional)
-            display_final_chk = None
-            if file_ext in ['.png', '.jpg', '.jpeg']:
-                color, self.widget_color_idx = self.get_next_color(self.widget_color_idx+1, self.prev_color_idx)
-                self.prev_color_idx = self.widget_color_idx
-                self.display_final_chk = CustomCheckbox(self.param_frame, 
-                    text="7b) Display final image after painting", 
-                    checked=self.i_display_final_image_bool, 
-                    width=self.PARAM_COMPONENT_WIDTH, 
-                    height=self.PARAM_CHECKBOX_HEIGHT, 
-                    is_set_width_to_parent=True, 
-                    bg_color=color
-                )
-                self.display_final_chk.pack(fill='x', pady=self.PAD_BETWEEN_ALL_COMPONENTS)
-                self.param_vis_manager.register_widget(self.display_final_chk, {'fill': 'x', 'pady': self.PAD_BETWEEN_ALL_COMPONENTS})
-                display_final_chk = self.display_final_chk
-            # Set up dependency: both 7.i and 7.ii only show if show_pygame_chk is checked
-            controlled_widgets = [self.rect_improve_chk]
-            if display_final_chk is not None:
-                controlled_widgets.append(display_final_chk)
-            self.show_pygame_chk.set_controlled_widgets(controlled_widgets)
-            self.add_between_padding(self.param_frame, self.param_vis_manager)
-            
+            # 7b) Display final image after painting
+            self.display_final_chk = self._add_param_widget(CustomCheckbox,
+                text="7b) Display final image after painting", 
+                checked=self.i_display_final_image_bool, 
+                height=self.PARAM_CHECKBOX_HEIGHT
+            )
+            # Set up dependency: both 7a and 7b only show if show_pygame_chk is checked
+            self.show_pygame_chk.set_controlled_widgets([self.rect_improve_chk, self.display_final_chk])
 
         # 8) allow early termination of hill climb
-        color, self.widget_color_idx = self.get_next_color(self.widget_color_idx+1, self.prev_color_idx)
-        self.prev_color_idx = self.widget_color_idx
-        self.premature_chk = CustomToggleVisibilityCheckbox(self.param_frame,
+        self.premature_chk = self._add_param_widget(CustomToggleVisibilityCheckbox,
+            pack_info=self.SECTION_PACK_INFO,
             text="8) Allow early termination of hill climbing", 
             checked=self.i_allow_early_termination_bool, 
             visibility_manager=self.param_vis_manager, 
-            width=self.PARAM_COMPONENT_WIDTH, 
-            height=self.PARAM_CHECKBOX_HEIGHT, 
-            is_set_width_to_parent=True, 
-            bg_color=color
+            height=self.PARAM_CHECKBOX_HEIGHT
         )
-        self.premature_chk.pack(fill='x', pady=self.PAD_BETWEEN_ALL_COMPONENTS)
-        self.param_vis_manager.register_widget(self.premature_chk, {'fill': 'x', 'pady': self.PAD_BETWEEN_ALL_COMPONENTS})
         # 8a) Terminate after n iterations
-        color, self.widget_color_idx = self.get_next_color(self.widget_color_idx+1, self.prev_color_idx)
-        self.prev_color_idx = self.widget_color_idx
-        self.fail_threshold_slider = SingleSlider(self.param_frame, 
+        self.fail_threshold_slider = self._add_param_widget(SingleSlider,
             min_val=self.i_failed_iterations_threshold_min_value, 
             max_val=self.i_failed_iterations_threshold_max_value, 
             init_val=self.i_failed_iterations_threshold, 
-            width=self.PARAM_COMPONENT_WIDTH, 
             height=50, 
-            subtitle="- Terminate after <current_value> failed iterations where there is no improvement", 
-            is_set_width_to_parent=True, 
-            bg_color=color
+            subtitle="- Terminate after <current_value> failed iterations where there is no improvement"
         )
-        self.fail_threshold_slider.pack(fill='x', pady=self.PAD_BETWEEN_ALL_COMPONENTS)
-        self.param_vis_manager.register_widget(self.fail_threshold_slider, {'fill': 'x', 'pady': self.PAD_BETWEEN_ALL_COMPONENTS})
-        self.add_between_padding(self.param_frame, self.param_vis_manager)
         # Set up conditional logic: fail_threshold_slider only shows when premature_chk is checked
         self.premature_chk.set_controlled_widgets([self.fail_threshold_slider])
 
-
         # 9) Enable vector field
-        color, self.widget_color_idx = self.get_next_color(self.widget_color_idx+1, self.prev_color_idx)
-        self.prev_color_idx = self.widget_color_idx
-        self.vector_field_chk = CustomToggleVisibilityCheckbox(self.param_frame, 
+        self.vector_field_chk = self._add_param_widget(CustomToggleVisibilityCheckbox,
+            pack_info=self.SECTION_PACK_INFO,
             text="9) Enable vector field", 
             checked=self.i_enable_vector_field_bool, 
             visibility_manager=self.param_vis_manager, 
-            width=self.PARAM_COMPONENT_WIDTH, 
-            height=self.PARAM_CHECKBOX_HEIGHT, 
-            is_set_width_to_parent=True, 
-            bg_color=color,
+            height=self.PARAM_CHECKBOX_HEIGHT,
             command = self.on_vector_field_checkbox_change
         )
-        self.vector_field_chk.pack(fill='x', pady=self.PAD_BETWEEN_ALL_COMPONENTS)
-        self.param_vis_manager.register_widget(self.vector_field_chk, {'fill': 'x', 'pady': self.PAD_BETWEEN_ALL_COMPONENTS})
 
         # 9.i) Edit vector field
-        color, self.widget_color_idx = self.get_next_color(self.widget_color_idx+1, self.prev_color_idx)
-        self.prev_color_idx = self.widget_color_idx
         self.edit_vector_btn = ttk.Button(self.param_frame, text=f"(f(x,y), g(x,y)) = ({self.i_vector_field_f_string}, {self.i_vector_field_g_string})", 
                                          style="button_edit_vector_field.TButton",
                                          command=self.on_edit_vector_field)
-        self.edit_vector_btn.pack(fill='x', padx=(20, 0), pady=self.PAD_BETWEEN_ALL_COMPONENTS)
-        self.param_vis_manager.register_widget(self.edit_vector_btn, {'fill': 'x', 'pady': self.PAD_BETWEEN_ALL_COMPONENTS})
 
         # 9.ii) Shift vector field origin
-        color, self.widget_color_idx = self.get_next_color(self.widget_color_idx+1, self.prev_color_idx)
-        self.prev_color_idx = self.widget_color_idx
         self.shift_vector_origin_btn = ttk.Button(self.param_frame, text=self.initial_choose_vector_eqn_btn_label, 
                                                  style="button_shift_vector_field.TButton",
                                                  command=self.on_shift_vector_origin)
-        self.shift_vector_origin_btn.pack(fill='x', padx=(20,0), pady=self.PAD_BETWEEN_ALL_COMPONENTS)
-        self.param_vis_manager.register_widget(self.shift_vector_origin_btn, {'fill': 'x', 'pady': self.PAD_BETWEEN_ALL_COMPONENTS})
+        self.shift_vector_origin_btn.state(['selected' if self.is_shift_origin_coord_selected else '!selected'])
+        self._applied_shift_origin_btn = (self.initial_choose_vector_eqn_btn_label, self.is_shift_origin_coord_selected)
+        # Both buttons share their pack options, so they are packed together
+        self.param_vis_manager.register_widgets([self.edit_vector_btn, self.shift_vector_origin_btn], self.INDENTED_COMPONENT_PACK_INFO)
 
         # Set up dependency: 9.i, 9.ii only show if vector_field_chk is checked
         self.vector_field_chk.set_controlled_widgets([self.edit_vector_btn, self.shift_vector_origin_btn])
-        self.add_between_padding(self.param_frame, self.param_vis_manager)
+        self.add_bottom_padding(self.param_frame, self.param_vis_manager)
+
+    # Tab 2
+    def on_tab_changed(self, event=None):
+        """Build the widgets of the selected tab if it has not been opened before"""
+        tab_index = self.notebook.index(self.notebook.select())
+        if tab_index not in self._pending_tab_builders:
+            return
+        # Paint the tab switch with a placeholder first, so the click gets immediate feedback
+        placeholder = tk.Label(self.notebook.nametowidget(self.notebook.select()), text="Loading...",
+                               font=("Segoe UI", 12), bg="white", fg="#888888")
+        placeholder.place(relx=0.5, rely=0.5, anchor="center")
+        self.root.update_idletasks()
+        self._build_pending_tab(tab_index)
+        placeholder.destroy()
+
+    def _build_pending_tab(self, tab_index):
+        builder = self._pending_tab_builders.pop(tab_index, None)
+        if builder is not None:
+            builder()
 
     # Tab 2
+    def _add_output_widget(self, widget_cls, **kwargs):
+        """Create a full-width widget on the Output Settings tab, see _add_widget"""
+        return self._add_widget(self.output_frame, self.output_vis_manager, widget_cls, **kwargs)
+
     def _create_parameter_widgets_tab_2(self):
         """Create parameter widgets for the second tab (Output Settings) based on file extension"""
         # Check file extension
         if not self.target_filepath:
             return
-        file_ext = self.file_ext
 
         # Section 6: Image Output Settings (for .png, .jpg, .jpeg)
-        if file_ext in ['.png', '.jpg', '.jpeg']:
+        if self.is_static_image:
             # 1) Output image size
-            self.add_between_padding(self.output_frame, self.output_vis_manager)
-            color, self.widget_color_idx = self.get_next_color(self.widget_color_idx, self.prev_color_idx)
-            self.prev_color_idx = self.widget_color_idx
-            self.output_size_slider = SingleSlider(
-                self.output_frame, 
+            self.output_size_slider = self._add_output_widget(SingleSlider,
+                pack_info=self.SECTION_PACK_INFO,
                 min_val=self.i_output_image_size_min_value, 
                 max_val=self.i_output_image_size_max_value, 
                 init_val=self.i_output_image_size,
-                width=self.PARAM_COMPONENT_WIDTH,
-                title="1) Output image size: <current_value> px", subtitle="- Render the output in a higher resolution", 
-                is_set_width_to_parent=True,
-                bg_color=color
+                title="1) Output image size: <current_value> px", subtitle="- Render the output in a higher resolution"
             )
-            self.output_size_slider.pack(fill='x', pady=self.PAD_BETWEEN_ALL_COMPONENTS)
-            self.output_vis_manager.register_widget(self.output_size_slider, {'fill': 'x', 'pady': self.PAD_BETWEEN_ALL_COMPONENTS})
-            self.add_between_padding(self.output_frame, self.output_vis_manager)
 
 
             # 2) Output image name
-            color, self.widget_color_idx = self.get_next_color(self.widget_color_idx + 1, self.prev_color_idx)
-            self.prev_color_idx = self.widget_color_idx
-            self.image_name_input = CustomTextInput(self.output_frame, 
-                width=self.PARAM_COMPONENT_WIDTH,
+            self.image_name_input = self._add_output_widget(CustomTextInput,
+                pack_info=self.SECTION_PACK_INFO,
                 title="2) Name of output image", 
-                subtitle="- Image will be saved to output folder when algorithm terminates", 
-                is_set_width_to_parent=True, 
-                bg_color=color
+                subtitle="- Image will be saved to output folder when algorithm terminates"
             )
             self.image_name_input.set(self.i_output_image_name_string)
-            self.image_name_input.pack(fill='x', pady=self.PAD_BETWEEN_ALL_COMPONENTS)
-            self.output_vis_manager.register_widget(self.image_name_input, {'fill': 'x', 'pady': self.PAD_BETWEEN_ALL_COMPONENTS})
-            self.add_between_padding(self.output_frame, self.output_vis_manager)
 
             # 3) Create GIF progress Checkbox
-            color, self.widget_color_idx = self.get_next_color(self.widget_color_idx, self.prev_color_idx)
-            self.prev_color_idx = self.widget_color_idx
-            self.create_gif_chk = CustomToggleVisibilityCheckbox(self.output_frame, 
+            self.create_gif_chk = self._add_output_widget(CustomToggleVisibilityCheckbox,
+                pack_info=self.SECTION_PACK_INFO,
                 text="3) Create GIF of painting progress", 
                 checked=self.i_create_gif_of_painting_progress_bool,
-                width=self.PARAM_COMPONENT_WIDTH, 
                 height=self.PARAM_CHECKBOX_HEIGHT,
-                is_set_width_to_parent=True, 
-                bg_color=color,
                 visibility_manager=self.output_vis_manager
             )
-            self.create_gif_chk.pack(fill='x', pady=self.PAD_BETWEEN_ALL_COMPONENTS)
-            self.output_vis_manager.register_widget(self.create_gif_chk, {'fill': 'x', 'pady': self.PAD_BETWEEN_ALL_COMPONENTS})
             # 3i) Name of painting progress GIF
-            color, self.widget_color_idx = self.get_next_color(self.widget_color_idx + 1, self.prev_color_idx)
-            self.prev_color_idx = self.widget_color_idx
-            self.gif_name_input = CustomTextInput(
-                self.output_frame, 
-                width=self.PARAM_COMPONENT_WIDTH, 
+            self.gif_name_input = self._add_output_widget(CustomTextInput,
+                controller=self.create_gif_chk,
                 title="3a) Enter GIF filename", 
-                subtitle="- Gif will be saved to output folder when algorithm terminates", is_set_width_to_parent=True, bg_color=color
+                subtitle="- Gif will be saved to output folder when algorithm terminates"
             )
             self.gif_name_input.set(self.i_name_of_painting_progress_gif_string)
-            self.gif_name_input.pack(fill='x', pady=self.PAD_BETWEEN_ALL_COMPONENTS)
-            self.output_vis_manager.register_widget(self.gif_name_input, {'fill': 'x', 'pady': self.PAD_BETWEEN_ALL_COMPONENTS}, controller=self.create_gif_chk)
             # Set controlled widgets for the checkbox
             self.create_gif_chk.set_controlled_widgets([self.gif_name_input])
-            self.add_between_padding(self.output_frame, self.output_vis_manager)
+            self.add_bottom_padding(self.output_frame, self.output_vis_manager)
 
 
 
 
         # tab2 GIF Settings (for target with .gif)
-        elif file_ext == '.gif':
-            self.add_between_padding(self.output_frame, self.output_vis_manager)
+        elif self.is_gif:
             # 1) Limit number of frames painted in original GIF.
-            color, self.widget_color_idx = self.get_next_color(self.widget_color_idx + 1, self.prev_color_idx)
-            self.prev_color_idx = self.widget_color_idx
-            self.add_between_padding(self.param_frame, self.param_vis_manager)
-            self.frames_in_gif_slider = SingleSlider(
-                self.output_frame, min_val=2, max_val=self.num_frames_in_original_gif, init_val=self.num_frames_in_original_gif,
-                width=self.PARAM_COMPONENT_WIDTH,
+            self.frames_in_gif_slider = self._add_output_widget(SingleSlider,
+                pack_info=self.SECTION_PACK_INFO,
+                min_val=2, max_val=self.num_frames_in_original_gif, init_val=self.num_frames_in_original_gif,
                 title=f"1) Paint <current_value> out of {self.num_frames_in_original_gif} frames from target GIF", 
                 subtitle=f"- Optionally reduce number of frames painted to speed up computation. \
-                \n- FPS of frames will be adjusted accordingly to keep total duration unchanged", is_set_width_to_parent=True, bg_color=color
+                \n- FPS of frames will be adjusted accordingly to keep total duration unchanged"
             )
-            self.frames_in_gif_slider.pack(fill='x', pady=self.PAD_BETWEEN_ALL_COMPONENTS)
-            self.output_vis_manager.register_widget(self.frames_in_gif_slider, {'fill': 'x', 'pady': self.PAD_BETWEEN_ALL_COMPONENTS})
-            self.add_between_padding(self.output_frame, self.output_vis_manager)
 
             # A) Name of painted gif (a new gif where we paint all frames of target gif)
-            color, self.widget_color_idx = self.get_next_color(self.widget_color_idx + 1, self.prev_color_idx)
-            self.prev_color_idx = self.widget_color_idx
-            self.painted_gif_name_input = CustomTextInput(
-                self.output_frame, 
-                width=self.PARAM_COMPONENT_WIDTH,
+            self.painted_gif_name_input = self._add_output_widget(CustomTextInput,
+                pack_info=self.SECTION_PACK_INFO,
                 title="2) Painted GIF filename", 
-                subtitle=None, 
-                is_set_width_to_parent=True, 
-                bg_color=color
+                subtitle=None
             )
             self.painted_gif_name_input.set(self.i_painted_gif_name_string)
-            self.painted_gif_name_input.pack(fill='x', pady=self.PAD_BETWEEN_ALL_COMPONENTS)
-            self.output_vis_manager.register_widget(self.painted_gif_name_input, {'fill': 'x', 'pady': self.PAD_BETWEEN_ALL_COMPONENTS})
-            self.add_between_padding(self.output_frame, self.output_vis_manager)
 
             # B) Multiprocessing Checkbox
-            color, self.widget_color_idx = self.get_next_color(self.widget_color_idx + 1, self.prev_color_idx)
-            self.prev_color_idx = self.widget_color_idx
-            self.multiprocessing_chk = CustomCheckbox(
-                self.output_frame, 
+            self.multiprocessing_chk = self._add_output_widget(CustomCheckbox,
+                pack_info=self.SECTION_PACK_INFO,
                 text="3) Enable multiprocessing for batch frame processing", 
                 checked=self.i_enable_multiprocessing_bool,
-                width=self.PARAM_COMPONENT_WIDTH, 
-                height=self.PARAM_CHECKBOX_HEIGHT,
-                is_set_width_to_parent=True, 
-                bg_color=color
+                height=self.PARAM_CHECKBOX_HEIGHT
             )
-            self.multiprocessing_chk.pack(fill='x', pady=self.PAD_BETWEEN_ALL_COMPONENTS)
-            self.output_vis_manager.register_widget(self.multiprocessing_chk, {'fill': 'x', 'pady': self.PAD_BETWEEN_ALL_COMPONENTS})
-            self.add_between_padding(self.output_frame, self.output_vis_manager)
+            self.add_bottom_padding(self.output_frame, self.output_vis_manager)
     
     ################ Enable vector field checkbox #################
     def on_vector_field_checkbox_change(self, state=None):
@@ -1076,26 +1112,33 @@ class ParameterUI:
             # Check if shift origin coordinates are selected
             if not self.is_shift_origin_coord_selected:
                 self.button2.config(state="disabled")  # Disable the submit button if vector field is enabled and origin(s) not selected
-                self.style.configure("button_shift_vector_field.TButton", foreground="red")
+                # The button was hidden, so it may have missed resets from the computation size slider
+                self._show_shift_origin_unselected()
             
     ############### Vector field buttons #################
     def on_shift_vector_origin(self):
-        print("Opens the window to get list of (x,y) coordinates")
+        if IS_PRINT_DEBUG_INFO:
+            print("Opens the window to get list of (x,y) coordinates")
+        # The coordinate selector is only needed once this button is pressed, so it is not imported at startup
+        try:
+            from .select_coordinate_ui import create_coord_selector_UI
+        except ImportError:
+            from select_coordinate_ui import create_coord_selector_UI
         # prereq: either gif frames Or target image
         self.resize_shorter_side_of_target = self.computation_size_slider.get()
 
         for _ in range(1):
-            if self.file_ext != ".gif":  # Non GIF case
+            if not self.is_gif:  # Non GIF case
                 user_choosen_coords_list = create_coord_selector_UI(self.target_filepath, self.resize_shorter_side_of_target, master=self.root)
                 if user_choosen_coords_list is None:
                     break
-                label = "Shift origin to: " + str(tuple(user_choosen_coords_list[0]))
+                label = f"Shift origin to: {tuple(user_choosen_coords_list[0])}"
             
             else: # GIF case
                 user_choosen_coords_list = create_coord_selector_UI(self.gif_frames_full_filepath_list, self.resize_shorter_side_of_target, master=self.root)
                 if user_choosen_coords_list is None:
                     break
-                label = "Shift origin to: " + str(tuple(user_choosen_coords_list[0]))+", "+str(tuple(user_choosen_coords_list[1]))+"..."
+                label = f"Shift origin to: {tuple(user_choosen_coords_list[0])}, {tuple(user_choosen_coords_list[1])}..."
             
         # If UI returns coordinates
         if user_choosen_coords_list is not None:
@@ -1103,52 +1146,76 @@ class ParameterUI:
             self.list_of_coord_for_shifting_vector_field_origin = user_choosen_coords_list
             self.is_shift_origin_coord_selected = True
             # Update select vector shift origin button text and text color
-            self.shift_vector_origin_btn.config(text=label)
-            self.style.configure("button_shift_vector_field.TButton", foreground="black")
+            self._set_shift_origin_btn(label, True)
             # Enable submit button
             self.button2.config(state="normal")
             
 
     # Adjusting computation size slider will reset the selected vector field
     def on_computation_size_slider_change(self, sliderval=None):
+        # The slider's Debouncer already limits calls to one per 100 ms while dragging.
+        # Once the selection is reset, later calls of the same drag have nothing left to do.
+        if not self.is_shift_origin_coord_selected:
+            return
         # reset selected coordinates
         self.is_shift_origin_coord_selected = False
         self.list_of_coord_for_shifting_vector_field_origin = [[]]
-        # Make the shift vector origin button state that there are no selected coordinates
-        self.shift_vector_origin_btn.config(text="Shift origin to (?, ?)" if self.file_ext != ".gif" else "Shift origin to (?, ?), (?, ?), ...")
-        self.style.configure("button_shift_vector_field.TButton", foreground="red")
+        # Make the shift vector origin button state that there are no selected coordinates.
+        # While the vector field is disabled the button is hidden, enabling it updates the button instead.
+        if self.param_vis_manager.is_visible(self.shift_vector_origin_btn):
+            self._show_shift_origin_unselected()
         # If Enable vector field checkbox is True and there are no coordinates selected, disable submit button
         if self.vector_field_chk.get() == True and not self.is_shift_origin_coord_selected:
             self.button2.config(state="disabled")
 
+    def _show_shift_origin_unselected(self):
+        """Make the shift vector origin button show that no coordinates are selected"""
+        self._set_shift_origin_btn("Shift origin to (?, ?)" if not self.is_gif else "Shift origin to (?, ?), (?, ?), ...", False)
+
+    def _set_shift_origin_btn(self, text, is_selected):
+        """
+        Queue a new label and selected state for the shift vector origin button.
+        Changes made before Tk is idle are applied together by _flush_shift_origin_btn.
+        
+        Args:
+            text (str): Button label
+            is_selected (bool): Whether origin(s) are selected, which shows the label in black instead of red
+        """
+        self._pending_shift_origin_btn = (text, is_selected)
+        if not self._is_shift_origin_btn_flush_scheduled:
+            self._is_shift_origin_btn_flush_scheduled = True
+            self.root.after_idle(self._flush_shift_origin_btn)
+
+    def _flush_shift_origin_btn(self):
+        self._is_shift_origin_btn_flush_scheduled = False
+        text, is_selected = self._pending_shift_origin_btn
+        applied_text, applied_is_selected = self._applied_shift_origin_btn
+        if text != applied_text:
+            self.shift_vector_origin_btn.config(text=text)
+        if is_selected != applied_is_selected:
+            self.shift_vector_origin_btn.state(['selected' if is_selected else '!selected'])
+        self._applied_shift_origin_btn = (text, is_selected)
+
     # Opens the window for user to define vector field
     def on_edit_vector_field(self):
-        custom_presets = {
-            "Radial Sink": ("-x", "-y"),
-            "Radial Source": ("x", "y"),
-            "Spiral Sink Clockwise": ("-x + y", "-y - x"),
-            "Spiral Sink Anticlockwise": ("-x - y", "x - y"),
-            "Spiral Source Clockwise": ("x - y", "y + x"),
-            "Spiral Source Anticlockwise": ("x + y", "-x + y"),
-            "Rotation Clockwise": ("y", "-x"),
-            "Rotation Anticlockwise": ("-y", "x")
-        }
-        custom_grid_sizes = [10, 20, 30]
-        self.root.update()
-        print("f_string, g_string from param UI",self.f_string, self.g_string)
-        result = create_vector_field_visualizer(custom_presets, custom_grid_sizes, master=self.root, initial_f_string=self.f_string, initial_g_string=self.g_string)
+        # Flush pending redraws only, a full update() would also run queued events re-entrantly
+        self.root.update_idletasks()
+        if IS_PRINT_DEBUG_INFO:
+            print("f_string, g_string from param UI",self.f_string, self.g_string)
+        result = create_vector_field_visualizer(self._VECTOR_FIELD_PRESETS, self._VECTOR_FIELD_GRID_SIZES, master=self.root, initial_f_string=self.f_string, initial_g_string=self.g_string)
 
         if result is not None:
             function_string = result[0]
-            print("Function string returned from vector field visualizer:", function_string)
+            if IS_PRINT_DEBUG_INFO:
+                print("Function string returned from vector field visualizer:", function_string)
             # Update button text with the returned string
             self.edit_vector_btn.configure(text=f"(f(x,y), g(x,y)) = {function_string}")
             # Update the vector field function
             self.vector_field_function = result[1]
             # update the f_string and g_string
-            expr = function_string.strip("()")  # Remove the parentheses
-            self.f_string, self.g_string = [part.strip() for part in expr.split(",")]  # Split by comma and strip whitespace
-            print(self.f_string, self.g_string)
+            self.f_string, self.g_string = split_vector_field_string(function_string)
+            if IS_PRINT_DEBUG_INFO:
+                print(self.f_string, self.g_string)
 
     def get_parameters(self):
         """
@@ -1157,48 +1224,56 @@ class ParameterUI:
         Returns:
             dict: A dictionary with parameter names as keys and their values.
         """
-        parameters = {}
-
         # Tab 1: Parameters
-        parameters['computation_size'] = self.computation_size_slider.get()
-        parameters['num_textures'] = self.num_shapes_slider.get()
-        min_iter, max_iter = self.hill_climb_range.get()
-        parameters['hill_climb_min_iterations'] = min_iter
-        parameters['hill_climb_max_iterations'] = max_iter
-        parameters['texture_opacity'] = self.texture_opacity_slider.get()
-        parameters['initial_texture_width'] = self.rect_width_slider.get()
-        parameters['uniform_texture_size'] = self.scaling_chk.get()
-        parameters['allow_early_termination'] = self.premature_chk.get()
-        parameters['failed_iterations_threshold'] = self.fail_threshold_slider.get()
-        parameters['enable_vector_field'] = self.vector_field_chk.get()
+        parameters = {key: getattr(self, widget_name).get() for key, widget_name in self._TAB_1_WIDGET_PARAMETERS}
+        parameters['hill_climb_min_iterations'], parameters['hill_climb_max_iterations'] = self.hill_climb_range.get()
         parameters['vector_field_f'] = self.f_string
         parameters['vector_field_g'] = self.g_string
         parameters['vector_field_function'] = self.vector_field_function
         parameters['vector_field_origin_shift'] = self.list_of_coord_for_shifting_vector_field_origin
 
         # Conditional parameters for image files (.png, .jpg, .jpeg)
-        if self.file_ext in ['.png', '.jpg', '.jpeg']:
-            parameters['display_painting_progress'] = self.show_pygame_chk.get()
-            parameters['display_placement_progress'] = self.rect_improve_chk.get()
-            parameters['display_final_image'] = self.display_final_chk.get()
+        if self.is_static_image:
+            parameters.update((key, getattr(self, widget_name).get()) for key, widget_name in self._TAB_1_STATIC_IMAGE_WIDGET_PARAMETERS)
 
         # Tab 2: Output Settings
-        if self.file_ext in ['.png', '.jpg', '.jpeg']:
-            parameters['output_image_size'] = self.output_size_slider.get()
-            parameters['output_image_name'] = self.image_name_input.get()
-            parameters['create_gif_of_painting_progress'] = self.create_gif_chk.get()
-            parameters['painting_progress_gif_name'] = self.gif_name_input.get() if self.create_gif_chk.get() else ""
-        elif self.file_ext == '.gif':
-            parameters['num_frames_to_paint'] = self.frames_in_gif_slider.get()
-            parameters['painted_gif_name'] = self.painted_gif_name_input.get()
-            parameters['enable_multiprocessing'] = self.multiprocessing_chk.get()
+        if self.OUTPUT_TAB_INDEX in self._pending_tab_builders:
+            # Never opened, so its widgets were not built and still hold their initial values
+            parameters.update(self._get_initial_output_parameters())
+        elif self.is_static_image:
+            parameters.update((key, getattr(self, widget_name).get()) for key, widget_name in self._TAB_2_STATIC_IMAGE_WIDGET_PARAMETERS)
+            parameters['painting_progress_gif_name'] = self.gif_name_input.get() if parameters['create_gif_of_painting_progress'] else ""
+        elif self.is_gif:
+            parameters.update((key, getattr(self, widget_name).get()) for key, widget_name in self._TAB_2_GIF_WIDGET_PARAMETERS)
         
         # Handle conditional logic:
-        if self.file_ext != ".gif":
+        if not self.is_gif:
             parameters['enable_multiprocessing'] = False
 
         return parameters
 
+    def _get_initial_output_parameters(self):
+        """
+        Returns the Output Settings tab parameters as its widgets would report them right after being built.
+        
+        Returns:
+            dict: Output parameter names as keys and their initial values.
+        """
+        if self.is_static_image:
+            return {
+                'output_image_size': self.i_output_image_size,
+                'output_image_name': sanitize_filename(self.i_output_image_name_string),
+                'create_gif_of_painting_progress': self.i_create_gif_of_painting_progress_bool,
+                'painting_progress_gif_name': sanitize_filename(self.i_name_of_painting_progress_gif_string) if self.i_create_gif_of_painting_progress_bool else "",
+            }
+        if self.is_gif:
+            return {
+                'num_frames_to_paint': self.num_frames_in_original_gif,
+                'painted_gif_name': sanitize_filename(self.i_painted_gif_name_string),
+                'enable_multiprocessing': self.i_enable_multiprocessing_bool,
+            }
+        return {}
+
     def save_parameters(self):
         """
         Save the current parameters to a JSON file.
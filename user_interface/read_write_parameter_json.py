@@ -1,22 +1,40 @@
+import copy
 import json
 import os
 
+try:
+    import orjson  # Optional, faster parsing of parameters.json
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 # Get the directory of json
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 JSON_FILE = os.path.join(BASE_DIR, 'parameters.json')
 
+# Parsed parameters.json, keyed by the file's (mtime_ns, size) so outside edits invalidate it.
+# write_parameter_json refreshes it directly.
+_parameter_cache = {'key': None, 'data': None}
+
 def read_parameter_json():
     """
     Read parameters.json and return its content as python dictionary.
     Returns None if an error occurs.
+    Repeated reads of an unchanged file return a copy of the cached parse.
     """
     try:
-        with open(JSON_FILE, 'r', encoding='utf-8') as file:
-            return json.load(file)
+        stat = os.stat(JSON_FILE)
+        cache_key = (stat.st_mtime_ns, stat.st_size)
+        if _parameter_cache['key'] != cache_key:
+            with open(JSON_FILE, 'rb') as file:
+                _parameter_cache['data'] = _loads(file.read())
+            _parameter_cache['key'] = cache_key
+        # Callers edit the returned dictionary before writing it back, never hand out the cached one
+        return copy.deepcopy(_parameter_cache['data'])
     except FileNotFoundError:
         print(f"Error: {JSON_FILE} not found.")
         return None
-    except json.JSONDecodeError:
+    except (json.JSONDecodeError, UnicodeDecodeError):
         print(f"Error: {JSON_FILE} contains invalid JSON.")
         return None
     except PermissionError:
@@ -32,8 +50,14 @@ def write_parameter_json(dict_data):
     Returns True if successful, False otherwise.
     """
     try:
+        text = json.dumps(dict_data, indent=4)
         with open(JSON_FILE, 'w', encoding='utf-8') as file:
-            json.dump(dict_data, file, indent=4)
+            file.write(text)
+        # The file may keep its (mtime_ns, size) on coarse timestamps, so refresh the cache here
+        # with what was written instead of relying on the next read to notice the change
+        stat = os.stat(JSON_FILE)
+        _parameter_cache['data'] = _loads(text)
+        _parameter_cache['key'] = (stat.st_mtime_ns, stat.st_size)
         return True
     except PermissionError:
         print(f"Error: Permission denied when writing to {JSON_FILE}.")
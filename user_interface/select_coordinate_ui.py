@@ -3,7 +3,7 @@ from tkinter import ttk
 from PIL import Image, ImageTk
 import os
 import time
-from typing import Union, List, Tuple
+from typing import Union, List, Tuple, Optional
 from abc import ABC, abstractmethod
 
 def center_window(root, width, height):
@@ -332,6 +332,8 @@ class SingleSliderModified(tk.Canvas):
             value = self.min_val
         if value > self.max_val:
             value = self.max_val
+        if value == self.value:
+            return  # Motion within the same value, nothing to redraw or report
         self.value = value
         if self.variable:
             self.variable.set(self.value)
@@ -369,7 +371,7 @@ class CoordinateSelectorUI:
         
         # Initialize image reference holders to prevent garbage collection
         self.current_image_tk = None
-        self._replay_photo_img = None
+        self._replay_photo_imgs = []  # One PhotoImage per frame, built once per replay window
         
         self._validate_image_paths()
         self._load_and_resize_images()
@@ -423,21 +425,29 @@ class CoordinateSelectorUI:
         self.root.configure(bg="#f7f7fa")
 
     def _validate_image_paths(self):
+        # Existence is checked by Image.open in _load_and_resize_images, saving a stat per frame
         for path in self.image_paths:
-            if not os.path.exists(path):
-                raise FileNotFoundError(f"Image file not found: {path}")
             if not path.lower().endswith(('.png', '.jpg', '.jpeg')):
                 raise ValueError(f"File is not a PNG image: {path}")
 
     def _load_and_resize_images(self):
         self.images = []
         self.resized_images = []
+        # Frames of a GIF share one size, so the output size is computed once per distinct input size
+        resized_size_by_size = {}
         for path in self.image_paths:
             try:
-                image = Image.open(path)
+                try:
+                    image = Image.open(path)
+                except FileNotFoundError:
+                    raise FileNotFoundError(f"Image file not found: {path}") from None
                 self.images.append(image)
-                resized = self._resize_image(image, self.target_size)
+                if image.size not in resized_size_by_size:
+                    resized_size_by_size[image.size] = self._get_resized_size(image.size, self.target_size)
+                resized = self._resize_image(image, self.target_size, resized_size_by_size[image.size])
                 self.resized_images.append(resized)
+            except FileNotFoundError:
+                raise
             except Exception as e:
                 raise RuntimeError(f"Error loading image {path}: {str(e)}")
         
@@ -445,15 +455,21 @@ class CoordinateSelectorUI:
         self.max_width = max(img.width for img in self.resized_images)
         self.max_height = max(img.height for img in self.resized_images)
 
-    def _resize_image(self, image: Image.Image, target_shorter_side: int) -> Image.Image:
-        width, height = image.size
-        if height < width:
-            scale_factor = target_shorter_side / height
-        else:
-            scale_factor = target_shorter_side / width
-        new_width = int(width * scale_factor)
-        new_height = int(height * scale_factor)
-        return image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+    @staticmethod
+    def _get_resized_size(size: Tuple[int, int], target_shorter_side: int) -> Tuple[int, int]:
+        """Size that scales the shorter side of size to target_shorter_side, keeping the aspect ratio"""
+        width, height = size
+        # Same float formula as utils.utilities.resize_rgba, so the selector and the painter agree on canvas size
+        scale_factor = target_shorter_side / min(width, height)
+        return (int(width * scale_factor), int(height * scale_factor))
+
+    def _resize_image(self, image: Image.Image, target_shorter_side: int,
+                      new_size: Optional[Tuple[int, int]] = None) -> Image.Image:
+        if new_size is None:
+            new_size = self._get_resized_size(image.size, target_shorter_side)
+        if new_size == image.size:
+            return image
+        return image.resize(new_size, Image.Resampling.LANCZOS)
 
     def _setup_style(self):
         self.style = ttk.Style(self.root)
@@ -558,13 +574,13 @@ class CoordinateSelectorUI:
                 background="#f7f7fa"
             ).pack(side=tk.LEFT, padx=(0, 5))
             
-            self.delay_var = tk.DoubleVar(value=50)
+            # The value reaches the UI through command, no Tk variable needs to mirror it
             self.delay_slider = SingleSliderModified(
                 self.slider_frame,
                 min_val=20, max_val=500, init_val=50,
                 width=180, title=None, subtitle=None, show_value_labels=False,
                 bg_color='#f7f7fa', active_color='#4078c0', inactive_color='#d3d4d9',
-                active_thumb_color='#305080', variable=self.delay_var,
+                active_thumb_color='#305080',
                 command=self._update_long_hold_delay
             )
             self.delay_slider.pack(side=tk.LEFT, padx=5)
@@ -855,6 +871,14 @@ class CoordinateSelectorUI:
             bg='white'
         )
         self.replay_canvas.pack(pady=(0, WindowConfig.COMPONENT_SPACING))
+        # Convert every frame to a Tk image once, and create the canvas items once.
+        # Each replay tick then only swaps the image and moves the cross.
+        self._replay_photo_imgs = [ImageTk.PhotoImage(img) for img in self.resized_images]
+        self._replay_image_item = self.replay_canvas.create_image(0, 0, anchor=tk.NW)
+        self._replay_cross_items = (
+            self.replay_canvas.create_line(0, 0, 0, 0, fill="red", width=2, state=tk.HIDDEN),
+            self.replay_canvas.create_line(0, 0, 0, 0, fill="red", width=2, state=tk.HIDDEN),
+        )
         
         slider_frame = tk.Frame(replay_main_frame, bg="#f7f7fa")
         slider_frame.pack(pady=(0, WindowConfig.COMPONENT_SPACING))
@@ -866,13 +890,12 @@ class CoordinateSelectorUI:
             background="#f7f7fa"
         ).pack(side=tk.LEFT, padx=(0, 5))
         
-        self.replay_fps_var = tk.DoubleVar(value=self.replay_fps)
         self.replay_fps_slider = SingleSliderModified(
             slider_frame,
             min_val=0.5, max_val=100, init_val=self.replay_fps,
             width=180, title=None, subtitle=None, show_value_labels=False,
             bg_color='#f7f7fa', active_color='#4078c0', inactive_color='#d3d4d9',
-            active_thumb_color='#305080', variable=self.replay_fps_var,
+            active_thumb_color='#305080',
             command=self._on_replay_fps_change
         )
         self.replay_fps_slider.pack(side=tk.LEFT, padx=5)
@@ -920,20 +943,24 @@ class CoordinateSelectorUI:
     def _draw_replay_frame(self, idx):
         if self.replay_canvas is None:
             return
-        self.replay_canvas.delete("all")
         img = self.resized_images[idx]
-        photo_img = ImageTk.PhotoImage(img)
-        self._replay_photo_img = photo_img
         x_pos = (self.max_width - img.width) // 2
         y_pos = (self.max_height - img.height) // 2
-        self.replay_canvas.create_image(x_pos, y_pos, anchor=tk.NW, image=photo_img)
+        self.replay_canvas.itemconfig(self._replay_image_item, image=self._replay_photo_imgs[idx])
+        self.replay_canvas.coords(self._replay_image_item, x_pos, y_pos)
+        horizontal_line, vertical_line = self._replay_cross_items
         if idx < len(self.selected_coordinates):
             x, y = self.selected_coordinates[idx]
             rx = x + x_pos
             ry = y + y_pos
             cross_size = 10
-            self.replay_canvas.create_line(rx - cross_size, ry, rx + cross_size, ry, fill="red", width=2)
-            self.replay_canvas.create_line(rx, ry - cross_size, rx, ry + cross_size, fill="red", width=2)
+            self.replay_canvas.coords(horizontal_line, rx - cross_size, ry, rx + cross_size, ry)
+            self.replay_canvas.coords(vertical_line, rx, ry - cross_size, rx, ry + cross_size)
+            self.replay_canvas.itemconfig(horizontal_line, state=tk.NORMAL)
+            self.replay_canvas.itemconfig(vertical_line, state=tk.NORMAL)
+        else:
+            self.replay_canvas.itemconfig(horizontal_line, state=tk.HIDDEN)
+            self.replay_canvas.itemconfig(vertical_line, state=tk.HIDDEN)
 
     def _on_replay_confirm_all(self):
         self.replay_running = False
@@ -961,6 +988,7 @@ class CoordinateSelectorUI:
         self.replay_window = None
         self.replay_after_id = None
         self._replay_index = 0
+        self._replay_photo_imgs = []
         self._display_current_image()
         self._set_selection_window_state(True)
         self.right_click_press_time = 0
@@ -2,6 +2,9 @@ import tkinter as tk
 from tkinter import ttk
 from PIL import Image, ImageTk, ImageSequence
 import os
+import queue
+import threading
+from collections import OrderedDict
 import numpy as np
 from numba import jit
 
@@ -78,6 +81,7 @@ class TargetTextureSelectorUI(tk.Tk):
         self.selected_gif_pil_frames = None  # Store original PIL frames for color picking
         self.gif_frame_index = 0
         self.gif_animation_id = None
+        self._gif_display_text = None  # Hint text last set by _animate_gif, None forces a full configure
         self.selected_texture_paths = initial_selected_texture_paths or []
         self.selected_texture_images = []
         self.texture_grid_labels = []
@@ -85,6 +89,22 @@ class TargetTextureSelectorUI(tk.Tk):
         self.clicked_rgb_color = None
         self.displayed_image_scale = None
         self.displayed_image_offset = None
+        # Last thumbnail shown for a static target, keyed by the image object itself and (container size, resample filter).
+        # Holding the image keeps a new image from matching it, an id() could be reused once the old image is freed.
+        self._display_cache_image = None
+        self._display_cache_key = None
+        self._display_cache_photo = None
+        # Cheap BILINEAR previews while the window is being resized, LANCZOS once it settles
+        self._display_resample = Image.Resampling.LANCZOS
+        self._resize_settle_id = None
+        self._last_window_size = None
+        # Redraw requests made before Tk goes idle collapse into a single redraw
+        self._image_redraw_pending = False
+        self._texture_redraw_pending = False
+        # Decoded GIF frames, most recently used last, keyed by (path, mtime)
+        self._gif_frame_cache = OrderedDict()
+        self._gif_frame_cache_size = 4
+        self._gif_load_token = 0
         
         self.title("Target & Texture Selector")
         self.configure(bg="#f5f6fa")
@@ -94,6 +114,9 @@ class TargetTextureSelectorUI(tk.Tk):
         self._setup_style()
         self._build_ui()
         self.bind('<Configure>', self._on_resize)
+        # Stop animating the target GIF while the window is minimized
+        self.bind('<Unmap>', self._on_window_unmap)
+        self.bind('<Map>', self._on_window_map)
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
         
         # Load initial selections after UI is built
@@ -302,6 +325,7 @@ class TargetTextureSelectorUI(tk.Tk):
                 self.selected_image_or_gif_path = None
                 self.selected_image = None
                 self.selected_gif_frames = None
+                self._gif_load_token += 1  # Drop any GIF still being decoded
                 if self.gif_animation_id:
                     self.after_cancel(self.gif_animation_id)
                     self.gif_animation_id = None
@@ -473,11 +497,49 @@ class TargetTextureSelectorUI(tk.Tk):
         if self.gif_animation_id:
             self.after_cancel(self.gif_animation_id)
             self.gif_animation_id = None
+        if self._resize_settle_id:
+            self.after_cancel(self._resize_settle_id)
+            self._resize_settle_id = None
         self.result = None
         self.destroy()
 
     def _on_resize(self, event):
-        pass
+        # Bindings on the root window also fire for its children, only react to the window itself
+        if event.widget is not self or (event.width, event.height) == self._last_window_size:
+            return
+        self._last_window_size = (event.width, event.height)
+        if self.selected_image is None:
+            return
+        self._display_resample = Image.Resampling.BILINEAR
+        self._request_image_redraw()
+        if self._resize_settle_id:
+            self.after_cancel(self._resize_settle_id)
+        self._resize_settle_id = self.after(150, self._on_resize_settled)
+
+    def _on_resize_settled(self):
+        self._resize_settle_id = None
+        self._display_resample = Image.Resampling.LANCZOS
+        self._request_image_redraw()
+
+    def _request_image_redraw(self):
+        """Redraw the target preview once Tk is idle, however many times this is called before then."""
+        if not self._image_redraw_pending:
+            self._image_redraw_pending = True
+            self.after_idle(self._do_image_redraw)
+
+    def _do_image_redraw(self):
+        self._image_redraw_pending = False
+        self._update_image_display()
+
+    def _request_texture_redraw(self):
+        """Rebuild the texture grid once Tk is idle, however many times this is called before then."""
+        if not self._texture_redraw_pending:
+            self._texture_redraw_pending = True
+            self.after_idle(self._do_texture_redraw)
+
+    def _do_texture_redraw(self):
+        self._texture_redraw_pending = False
+        self._update_texture_display()
 
     def _on_image_click(self, event):
         """Handle left mouse click on the target image to pick color for textures"""
@@ -504,10 +566,11 @@ class TargetTextureSelectorUI(tk.Tk):
         label_width = self.image_display.winfo_width()
         label_height = self.image_display.winfo_height()
         
-        # Get the thumbnail size that was used for display
-        img_copy = current_image.copy()
-        img_copy.thumbnail((label_width, label_height - 50), Image.Resampling.LANCZOS)
-        display_width, display_height = img_copy.size
+        # Get the thumbnail size that was used for display, computed the same way as Image.thumbnail
+        # instead of resampling the image again on every click
+        scale = min(1.0, label_width / current_image.width, (label_height - 50) / current_image.height)
+        display_width = max(1, round(current_image.width * scale))
+        display_height = max(1, round(current_image.height * scale))
         
         # Calculate image position (centered in label)
         img_x_offset = (label_width - display_width) // 2
@@ -541,7 +604,7 @@ class TargetTextureSelectorUI(tk.Tk):
         print(f"Clicked at ({orig_x}, {orig_y}), RGB: {self.clicked_rgb_color}")
         
         # Update texture display with new color
-        self._update_texture_display()
+        self._request_texture_redraw()
 
     def _on_select_target(self):
         selector_single = FileSelectorUI(
@@ -565,7 +628,11 @@ class TargetTextureSelectorUI(tk.Tk):
         if self.gif_animation_id:
             self.after_cancel(self.gif_animation_id)
             self.gif_animation_id = None
+        self._gif_load_token += 1  # Drop any GIF still being decoded
         img = Image.open(path)
+        if img.format == 'JPEG':
+            # Let libjpeg decode at a reduced DCT scale, never below the screen size
+            img.draft('RGB', (self.winfo_screenwidth(), self.winfo_screenheight()))
         self.selected_image = img.copy()
         self.selected_gif_frames = None
         self.selected_gif_pil_frames = None
@@ -574,23 +641,117 @@ class TargetTextureSelectorUI(tk.Tk):
         if self.gif_animation_id:
             self.after_cancel(self.gif_animation_id)
             self.gif_animation_id = None
-        img = Image.open(path)
-        max_dim = 500
-        if img.width > max_dim or img.height > max_dim:
-            scale = min(max_dim / img.width, max_dim / img.height)
-            new_size = (int(img.width * scale), int(img.height * scale))
-            pil_frames = [frame.copy().resize(new_size, Image.Resampling.LANCZOS) for frame in ImageSequence.Iterator(img)]
-        else:
-            pil_frames = [frame.copy() for frame in ImageSequence.Iterator(img)]
+        self.selected_image = None
+        self.selected_gif_frames = None
+        self.selected_gif_pil_frames = None
+        self.gif_frame_index = 0
+        self._gif_load_token += 1
+        
+        cache_key = (path, os.path.getmtime(path))
+        if cache_key in self._gif_frame_cache:
+            # Reselecting a recent GIF skips decoding and resampling entirely
+            self._gif_frame_cache.move_to_end(cache_key)
+            self._show_loaded_gif(*self._gif_frame_cache[cache_key])
+            return
         
+        # Decode and resample on a worker thread so the window stays responsive. Frames are streamed
+        # through a queue and PhotoImage creation happens back on the Tk thread in _poll_gif_load,
+        # so playback starts as soon as the first frame is ready.
+        self.image_display.configure(image='', text='Loading GIF...')
+        results = queue.Queue()
+        token = self._gif_load_token
+        worker = threading.Thread(target=self._decode_gif_frames, args=(path, token, results), daemon=True)
+        worker.start()
+        self.after(16, self._poll_gif_load, token, cache_key, results, [], [])
+
+    def _decode_gif_frames(self, path, token, results):
+        """
+        Decode and downsize GIF frames one at a time. Runs on a worker thread and only touches PIL.
+        
+        Args:
+            path: Path of the GIF file
+            token: Load token at the time the load started, decoding stops once it is stale
+            results: Queue receiving ('frame', image) per frame, then ('done', None) or ('error', message)
+        """
+        try:
+            img = Image.open(path)
+            max_dim = 500
+            new_size = None
+            if img.width > max_dim or img.height > max_dim:
+                scale = min(max_dim / img.width, max_dim / img.height)
+                new_size = (int(img.width * scale), int(img.height * scale))
+            for frame in ImageSequence.Iterator(img):
+                if token != self._gif_load_token:
+                    return  # Another target was selected or the target was cleared
+                # Convert palette frames once, so resizing can use LANCZOS, color picking reads real RGB
+                # values and PhotoImage creation does not convert again. Opaque frames become RGB:
+                # resampling 3 bands skips RGBA's alpha premultiply round trip and the 4th band.
+                has_alpha = frame.mode in ('RGBA', 'LA', 'PA') or 'transparency' in frame.info
+                frame = frame.convert('RGBA' if has_alpha else 'RGB')
+                if new_size is not None:
+                    frame = frame.resize(new_size, Image.Resampling.LANCZOS)
+                results.put(('frame', frame))
+        except (OSError, ValueError) as e:
+            print(f"❌ Could not load GIF {path}: {e}")
+            results.put(('error', str(e)))
+            return
+        results.put(('done', None))
+
+    def _poll_gif_load(self, token, cache_key, results, pil_frames, tk_frames):
+        if token != self._gif_load_token:
+            # Another target was selected or the target was cleared while decoding
+            return
+        # Convert a bounded number of frames per tick so the event loop keeps running
+        for _ in range(8):
+            try:
+                kind, payload = results.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'frame':
+                pil_frames.append(payload)
+                tk_frames.append(ImageTk.PhotoImage(payload))
+                if len(tk_frames) == 1:
+                    # The animation reads these lists, so later frames join playback as they arrive
+                    self._show_loaded_gif(pil_frames, tk_frames)
+            elif kind == 'done':
+                self._gif_frame_cache[cache_key] = (pil_frames, tk_frames)
+                if len(self._gif_frame_cache) > self._gif_frame_cache_size:
+                    self._gif_frame_cache.popitem(last=False)
+                return
+            else:
+                if not tk_frames:
+                    self.image_display.configure(image='', text='Could not load GIF')
+                return
+        self.after(16, self._poll_gif_load, token, cache_key, results, pil_frames, tk_frames)
+
+    def _show_loaded_gif(self, pil_frames, tk_frames):
         # Store original PIL frames for color picking
         self.selected_gif_pil_frames = pil_frames
-        # Store PhotoImage frames for display
-        self.selected_gif_frames = [ImageTk.PhotoImage(frame.convert('RGBA')) for frame in pil_frames]
-        self.selected_image = None
+        self.selected_gif_frames = tk_frames
         self.gif_frame_index = 0
+        self._gif_display_text = None
         self._animate_gif()
 
+    def pause_gif_animation(self):
+        """Cancel the pending GIF frame callback, keeping the current frame index."""
+        if self.gif_animation_id:
+            self.after_cancel(self.gif_animation_id)
+            self.gif_animation_id = None
+
+    def resume_gif_animation(self):
+        """Restart the GIF animation from the current frame if it is paused."""
+        if self.gif_animation_id is None and self.selected_gif_frames:
+            self._animate_gif()
+
+    def _on_window_unmap(self, event):
+        # Bindings on the root window also fire for its children, only react to the window itself
+        if event.widget is self:
+            self.pause_gif_animation()
+
+    def _on_window_map(self, event):
+        if event.widget is self:
+            self.resume_gif_animation()
+
     def _animate_gif(self):
         if not self.selected_gif_frames:
             return
@@ -601,7 +762,12 @@ class TargetTextureSelectorUI(tk.Tk):
         if self.selected_texture_paths:
             display_text = 'Click on image to color textures'
         
-        self.image_display.configure(image=frame, text=display_text)
+        if display_text != self._gif_display_text:
+            self.image_display.configure(image=frame, text=display_text)
+            self._gif_display_text = display_text
+        else:
+            # Only the frame changes, leave the label's text option and its geometry alone
+            self.image_display.configure(image=frame)
         self.gif_frame_index = (self.gif_frame_index + 1) % len(self.selected_gif_frames)
         self.gif_animation_id = self.after(80, self._animate_gif)
 
@@ -617,9 +783,17 @@ class TargetTextureSelectorUI(tk.Tk):
             container_height = self.left_container.winfo_height() - 50
             if container_width < 10 or container_height < 10:
                 return
-            img = self.selected_image.copy()
-            img.thumbnail((container_width, container_height), Image.Resampling.LANCZOS)
-            tk_img = ImageTk.PhotoImage(img)
+            cache_key = (container_width, container_height, self._display_resample)
+            if self._display_cache_image is self.selected_image and cache_key == self._display_cache_key:
+                # Same image in the same space, reuse the last thumbnail
+                tk_img = self._display_cache_photo
+            else:
+                img = self.selected_image
+                if img.width > container_width or img.height > container_height:
+                    img = img.copy()
+                    img.thumbnail((container_width, container_height), self._display_resample)
+                tk_img = ImageTk.PhotoImage(img)
+                self._display_cache_image, self._display_cache_key, self._display_cache_photo = self.selected_image, cache_key, tk_img
             
             # Show color picking hint if textures are also selected
             display_text = ''
@@ -638,6 +812,9 @@ class TargetTextureSelectorUI(tk.Tk):
         if self.gif_animation_id:
             self.after_cancel(self.gif_animation_id)
             self.gif_animation_id = None
+        if self._resize_settle_id:
+            self.after_cancel(self._resize_settle_id)
+            self._resize_settle_id = None
         self.result = (self.selected_image_or_gif_path, list(self.selected_texture_paths))
         self.destroy()
 
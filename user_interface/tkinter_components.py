@@ -2,6 +2,7 @@ import tkinter as tk
 import re
 
 __all__ = [
+    'Debouncer',
     'VisibilityManager',
     'CustomToggleVisibilityCheckbox',
     'RangeSlider',
@@ -9,53 +10,144 @@ __all__ = [
     'CustomCheckbox',
     'CustomTextInput',
     'Padding',
+    'sanitize_filename',
 ]
 
 label_font = "Segoe UI Semibold"  # Default font for text in custom widgets
 subtitle_font = "Segoe UI"  # Default font for subtitles in custom widgets
 
+# Compiled once, CustomTextInput checks every keystroke against these
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^A-Za-z0-9_-]')
+_SAFE_FILENAME = re.compile(r'[A-Za-z0-9_-]{0,255}')
+
+
+def sanitize_filename(name):
+    """
+    Replace every character that is not a letter, digit, underscore or dash with an underscore.
+
+    Args:
+        name: Filename without extension
+
+    Returns:
+        The safe filename, at most 255 characters long
+    """
+    # Common case while typing: the name is already safe, a single C-level match confirms it
+    if _SAFE_FILENAME.fullmatch(name):
+        return name
+    # Remove unsafe characters (only allow letters, numbers, underscores, dashes)
+    name = _UNSAFE_FILENAME_CHARS.sub('_', name)
+    # Optional: Limit length to 255 characters
+    return name[:255]
+
+
+def _compile_label_template(text, placeholders):
+    """
+    Split a title/subtitle into lines, turning each placeholder into a positional format field,
+    so redraws fill in values with a single str.format call per line.
+
+    Args:
+        text: Title or subtitle text, may be None
+        placeholders: Placeholder strings, the i-th one becomes field {i}
+
+    Returns:
+        Tuple of format strings, one per line (empty if text is None)
+    """
+    if not text:
+        return ()
+    lines = []
+    for line in text.split('\n'):
+        line = line.replace('{', '{{').replace('}', '}}')
+        for i, placeholder in enumerate(placeholders):
+            line = line.replace(placeholder, '{%d}' % i)
+        lines.append(line)
+    return tuple(lines)
+
+
+class Debouncer:
+    """
+    Coalesces rapid calls (e.g. slider drags) into at most one call per delay_ms.
+    The first call schedules the callback on the Tk event loop, later calls only replace the arguments,
+    and flush() runs any pending call immediately.
+    """
+    def __init__(self, widget, delay_ms, callback):
+        self.widget = widget
+        self.delay_ms = delay_ms
+        self.callback = callback
+        self._pending_after_id = None
+        self._pending_args = None
+
+    def __call__(self, *args):
+        self._pending_args = args
+        if self._pending_after_id is None:
+            self._pending_after_id = self.widget.after(self.delay_ms, self.flush)
+
+    def flush(self):
+        if self._pending_after_id is None:
+            return
+        self.widget.after_cancel(self._pending_after_id)
+        self._pending_after_id = None
+        args, self._pending_args = self._pending_args, None
+        self.callback(*args)
+
 
 # --- VisibilityManager and CustomToggleVisibilityCheckbox for conditional UI logic ---
 class VisibilityManager:
     """Manages widget visibility while maintaining proper order"""
     def __init__(self):
-        self.controlled_widgets = {}  # {widget: {'pack_info': {}, 'controller': checkbox}}
+        self.controlled_widgets = {}  # {widget: {'pack_info': {}, 'controller': checkbox, 'visible': bool, 'order': int}}
         self.widget_order = []  # Maintains the original order of widgets
-    def register_widget(self, widget, pack_info, controller=None):
-        """Register a widget to be managed"""
+    def register_widget(self, widget, pack_info, controller=None, pack_now=True):
+        """Register a widget to be managed and, unless pack_now is False, pack it with pack_info"""
+        if pack_now:
+            widget.pack(**pack_info)
+        if widget not in self.controlled_widgets:
+            self.widget_order.append(widget)
+            order = len(self.widget_order) - 1
+        else:
+            order = self.controlled_widgets[widget]['order']
         self.controlled_widgets[widget] = {
             'pack_info': pack_info,
             'controller': controller,
-            'visible': True
+            'visible': pack_now,
+            'order': order
         }
-        if widget not in self.widget_order:
-            self.widget_order.append(widget)
+    def register_widgets(self, widgets, pack_info, controller=None, pack_now=True):
+        """Register several widgets sharing pack_info and, unless pack_now is False, pack them with one pack command"""
+        if pack_now and widgets:
+            # tkinter packs one widget per call, a single Tcl pack command takes them all in order
+            widgets[0].tk.call('pack', 'configure', *widgets, *widgets[0]._options(pack_info))
+        for widget in widgets:
+            self.register_widget(widget, pack_info, controller=controller, pack_now=False)
+            self.controlled_widgets[widget]['visible'] = pack_now
     def hide_widgets(self, widgets):
         """Hide specified widgets"""
         for widget in widgets:
-            if widget in self.controlled_widgets:
+            info = self.controlled_widgets.get(widget)
+            # Already hidden widgets are unmanaged, forgetting them again would only cost a Tcl call
+            if info is not None and info['visible']:
                 widget.pack_forget()
-                self.controlled_widgets[widget]['visible'] = False
+                info['visible'] = False
+    def is_visible(self, widget):
+        """Return True unless the widget is registered and currently hidden"""
+        info = self.controlled_widgets.get(widget)
+        return info is None or info['visible']
     def show_widgets(self, widgets):
         """Show specified widgets in proper order"""
-        # Mark widgets as should be visible
-        for widget in widgets:
-            if widget in self.controlled_widgets:
-                self.controlled_widgets[widget]['visible'] = True
-        # Repack all widgets in original order
-        self._repack_all_in_order()
-    def _repack_all_in_order(self):
-        """Repack all widgets in their original order"""
-        # First, forget all managed widgets
-        for widget in self.widget_order:
-            if widget in self.controlled_widgets:
-                widget.pack_forget()
-        # Then pack them back in order, but only if they should be visible
-        for widget in self.widget_order:
-            if (widget in self.controlled_widgets and 
-                self.controlled_widgets[widget]['visible']):
-                pack_info = self.controlled_widgets[widget]['pack_info']
-                widget.pack(**pack_info)
+        # Only hidden widgets need packing, each goes right back into its original slot
+        for widget in sorted((w for w in widgets if w in self.controlled_widgets and not self.controlled_widgets[w]['visible']),
+                             key=lambda w: self.controlled_widgets[w]['order']):
+            info = self.controlled_widgets[widget]
+            info['visible'] = True
+            widget.pack(**info['pack_info'], **self._pack_position(info['order']))
+    def _pack_position(self, order):
+        """Return pack options that place the widget at position order among the visible widgets"""
+        for neighbour in self.widget_order[order + 1:]:
+            if self.controlled_widgets[neighbour]['visible']:
+                return {'before': neighbour}
+        for neighbour in reversed(self.widget_order[:order]):
+            if self.controlled_widgets[neighbour]['visible']:
+                return {'after': neighbour}
+        return {}
 class CustomToggleVisibilityCheckbox(tk.Canvas):
     def __init__(self, master, text='', checked=False, command=None, 
                  visibility_manager=None, controlled_widgets=None,
@@ -111,6 +203,9 @@ class CustomToggleVisibilityCheckbox(tk.Canvas):
         self._update_widget_visibility()
 
     def _on_resize(self, event):
+        # <Configure> also fires when a repack only moves the widget, redraw only for a new width
+        if event.width == self.width:
+            return
         self.config(width=event.width)
         self.width = event.width
         self.height = self._user_height
@@ -275,7 +370,7 @@ class CustomToggleVisibilityCheckbox(tk.Canvas):
 
 
 class RangeSlider(tk.Canvas):
-    def __init__(self, master, min_val=0, max_val=100, init_min=None, init_max=None, width=300, height=None, command=None, title=None, subtitle=None, title_size=13, subtitle_size=10, bg_color='white', is_set_width_to_parent=False, show_value_labels=False, **kwargs):
+    def __init__(self, master, min_val=0, max_val=100, init_min=None, init_max=None, width=300, height=None, command=None, title=None, subtitle=None, title_size=13, subtitle_size=10, bg_color='white', is_set_width_to_parent=False, show_value_labels=False, command_delay_ms=0, **kwargs):
         self._line_spacing = 6  # px between lines in title/subtitle (moved to top to avoid AttributeError)
         # Auto-calculate height if not specified
         if height is None:
@@ -289,7 +384,8 @@ class RangeSlider(tk.Canvas):
             self.bind('<Configure>', self._on_resize)
         self.min_val = min_val
         self.max_val = max_val
-        self.command = command
+        # With command_delay_ms > 0, drags call command at most once per delay and once more on release
+        self.command = Debouncer(self, command_delay_ms, command) if command and command_delay_ms > 0 else command
         self.width = width
         self.height = height
         self.pad = 15  # Padding for thumbs
@@ -306,6 +402,9 @@ class RangeSlider(tk.Canvas):
         self.title_size = 13
         self.subtitle_size = subtitle_size
         self.show_value_labels = show_value_labels
+        range_placeholders = ('<current_min_value>', '<current_max_value>')
+        self._title_line_templates = _compile_label_template(title, range_placeholders)
+        self._subtitle_line_templates = _compile_label_template(subtitle, range_placeholders)
         # Draw initial
         self._draw_slider()
         self.bind('<Button-1>', self._on_click)
@@ -335,6 +434,9 @@ class RangeSlider(tk.Canvas):
             return slider_height
 
     def _on_resize(self, event):
+        # <Configure> also fires when a repack only moves the widget, redraw only for a new width
+        if event.width == self.width:
+            return
         # Set width to parent width
         self.config(width=event.width)
         self.width = event.width
@@ -350,8 +452,7 @@ class RangeSlider(tk.Canvas):
         
         # Draw title if present (multi-line support, with string replacement)
         if self.title:
-            title_str = self.title.replace('<current_min_value>', str(self.val_min)).replace('<current_max_value>', str(self.val_max))
-            title_lines = title_str.split('\n')
+            title_lines = [line.format(self.val_min, self.val_max) for line in self._title_line_templates]
             for i, line in enumerate(title_lines):
                 self.create_text(self.pad, y, text=line, fill='black', font=(label_font, self.title_size), anchor='nw')
                 y += self.title_size
@@ -364,8 +465,7 @@ class RangeSlider(tk.Canvas):
         
         # Draw subtitle if present (multi-line support, with string replacement)
         if self.subtitle:
-            subtitle_str = self.subtitle.replace('<current_min_value>', str(self.val_min)).replace('<current_max_value>', str(self.val_max))
-            subtitle_lines = subtitle_str.split('\n')
+            subtitle_lines = [line.format(self.val_min, self.val_max) for line in self._subtitle_line_templates]
             for i, line in enumerate(subtitle_lines):
                 self.create_text(self.pad, y, text=line, fill='black', font=(subtitle_font, self.subtitle_size), anchor='nw')
                 y += self.subtitle_size
@@ -465,10 +565,13 @@ class RangeSlider(tk.Canvas):
         x = min(max(event.x, self.pad), self.width - self.pad)
         value = self._pos_to_value(x)
         
+        previous = (self.val_min, self.val_max)
         if self.active_thumb == 'min':
             self.val_min = max(min(value, self.val_max), self.min_val)
         elif self.active_thumb == 'max':
             self.val_max = min(max(value, self.val_min), self.max_val)
+        if (self.val_min, self.val_max) == previous:
+            return  # Motion within the same integer value, nothing to redraw
         
         self._draw_slider()
         if self.command:
@@ -476,6 +579,8 @@ class RangeSlider(tk.Canvas):
 
     def _on_release(self, event):
         self.active_thumb = None
+        if isinstance(self.command, Debouncer):
+            self.command.flush()
 
     def get(self):
         return self.val_min, self.val_max
@@ -491,7 +596,7 @@ class RangeSlider(tk.Canvas):
         self.val_max = max_val
         self._draw_slider()
 class SingleSlider(tk.Canvas):
-    def __init__(self, master, min_val=0, max_val=100, init_val=None, width=300, height=None, command=None, title=None, subtitle=None, title_size=13, subtitle_size=10, bg_color='white', is_set_width_to_parent=False, show_value_labels=False, **kwargs):
+    def __init__(self, master, min_val=0, max_val=100, init_val=None, width=300, height=None, command=None, title=None, subtitle=None, title_size=13, subtitle_size=10, bg_color='white', is_set_width_to_parent=False, show_value_labels=False, command_delay_ms=0, **kwargs):
         self._line_spacing = 4  # px between lines in title/subtitle
         if height is None:
             height = self._calculate_height(title, subtitle, title_size, subtitle_size)
@@ -504,7 +609,8 @@ class SingleSlider(tk.Canvas):
             self.bind('<Configure>', self._on_resize)
         self.min_val = min_val
         self.max_val = max_val
-        self.command = command
+        # With command_delay_ms > 0, drags call command at most once per delay and once more on release
+        self.command = Debouncer(self, command_delay_ms, command) if command and command_delay_ms > 0 else command
         self.width = width
         self.height = height
         self.pad = 15
@@ -513,12 +619,16 @@ class SingleSlider(tk.Canvas):
         self.slider_line_y = height // 2
         self.slider_line_width = 4
         self.value_range = max_val - min_val
+        self._inv_value_range = 1.0 / self.value_range
+        self._update_geometry()
         self.value = init_val if init_val is not None else min_val
         self.title = title
         self.subtitle = subtitle
         self.title_size = title_size
         self.subtitle_size = subtitle_size
         self.show_value_labels = show_value_labels
+        self._title_line_templates = _compile_label_template(title, ('<current_value>',))
+        self._subtitle_line_templates = _compile_label_template(subtitle, ('<current_value>',))
         self._draw_slider()
         self.bind('<Button-1>', self._on_click)
         self.bind('<B1-Motion>', self._on_drag)
@@ -540,54 +650,79 @@ class SingleSlider(tk.Canvas):
             return slider_height
 
     def _on_resize(self, event):
+        # <Configure> also fires when a repack only moves the widget, redraw only for a new width
+        if event.width == self.width:
+            return
         self.config(width=event.width)
         self.width = event.width
         self.height = self._user_height
+        self._update_geometry()
         self._draw_slider()
 
+    def _update_geometry(self):
+        # Track width only changes on resize, so value <-> position factors are cached here
+        self._usable_width = self.width - 2 * self.pad
+        self._inv_usable_width = 1.0 / self._usable_width if self._usable_width > 0 else 0.0
+
     def _draw_slider(self):
         self.delete('all')
+        # Text items whose line contains <current_value>, the only text a value change has to touch
+        self._value_text_items = []
         x = self._value_to_pos(self.value)
         y = 0
         if self.title:
-            title_str = self.title.replace('<current_value>', str(self.value))
-            title_lines = title_str.split('\n')
-            for i, line in enumerate(title_lines):
-                self.create_text(self.pad, y, text=line, fill='black', font=(label_font, self.title_size), anchor='nw')
+            templates = self._title_line_templates
+            for i, template in enumerate(templates):
+                item = self.create_text(self.pad, y, text=template.format(self.value), fill='black', font=(label_font, self.title_size), anchor='nw')
+                if template.format(0) != template.format(1):
+                    self._value_text_items.append((item, template))
                 y += self.title_size
-                if i < len(title_lines) - 1:
+                if i < len(templates) - 1:
                     y += self._line_spacing
             if self.subtitle:
                 y += 7
             else:
                 y += 15
         if self.subtitle:
-            subtitle_str = self.subtitle.replace('<current_value>', str(self.value))
-            subtitle_lines = subtitle_str.split('\n')
-            for i, line in enumerate(subtitle_lines):
-                self.create_text(self.pad, y, text=line, fill='black', font=(subtitle_font, self.subtitle_size), anchor='nw')
+            templates = self._subtitle_line_templates
+            for i, template in enumerate(templates):
+                item = self.create_text(self.pad, y, text=template.format(self.value), fill='black', font=(subtitle_font, self.subtitle_size), anchor='nw')
+                if template.format(0) != template.format(1):
+                    self._value_text_items.append((item, template))
                 y += self.subtitle_size
-                if i < len(subtitle_lines) - 1:
+                if i < len(templates) - 1:
                     y += self._line_spacing
             y += 15
         slider_y = y + 12
+        self._slider_y = slider_y  # For hit testing
         self.create_line(self.pad, slider_y, self.width - self.pad, slider_y, width=self.slider_line_width, fill='#ccc')
-        self.create_line(self.pad, slider_y, x, slider_y, width=self.slider_line_width, fill='#007fff')
+        self._fill_line = self.create_line(self.pad, slider_y, x, slider_y, width=self.slider_line_width, fill='#007fff')
         rect_w, rect_h = 12, 24
         self.thumb = self.create_rectangle(x - rect_w//2, slider_y - rect_h//2,
                                           x + rect_w//2, slider_y + rect_h//2,
                                           fill='#007fff', outline='', tags='thumb')
+        self._value_label = None
         if self.show_value_labels:
-            self.create_text(x, slider_y + rect_h//2 + 6, text=str(self.value), fill='#007fff', font=(label_font, 10))
+            self._value_label = self.create_text(x, slider_y + rect_h//2 + 6, text=str(self.value), fill='#007fff', font=(label_font, 10))
+
+    def _update_value_items(self):
+        """Move the thumb and refresh value dependent text, leaving static labels and the track untouched"""
+        x = self._value_to_pos(self.value)
+        slider_y = self._slider_y
+        rect_w, rect_h = 12, 24
+        for item, template in self._value_text_items:
+            self.itemconfigure(item, text=template.format(self.value))
+        self.coords(self._fill_line, self.pad, slider_y, x, slider_y)
+        self.coords(self.thumb, x - rect_w//2, slider_y - rect_h//2, x + rect_w//2, slider_y + rect_h//2)
+        if self._value_label is not None:
+            self.coords(self._value_label, x, slider_y + rect_h//2 + 6)
+            self.itemconfigure(self._value_label, text=str(self.value))
 
     def _value_to_pos(self, value):
-        usable_width = self.width - 2 * self.pad
-        rel = (value - self.min_val) / self.value_range
-        return self.pad + rel * usable_width
+        return self.pad + (value - self.min_val) * self._inv_value_range * self._usable_width
 
     def _pos_to_value(self, x):
-        usable_width = self.width - 2 * self.pad
-        rel = (x - self.pad) / usable_width
+        rel = (x - self.pad) * self._inv_usable_width
         rel = min(max(rel, 0), 1)
         return round(self.min_val + rel * self.value_range)
 
@@ -595,16 +730,8 @@ class SingleSlider(tk.Canvas):
         x = event.x
         if x < self.pad or x > self.width - self.pad:
             return
-        y = 0
-        if self.title:
-            y += self.title_size
-            if self.subtitle:
-                y += 7
-            else:
-                y += 15
-        if self.subtitle:
-            y += self.subtitle_size + 15
-        slider_y = y + 12
+        # Track position recorded by the last _draw_slider, which also accounts for multi-line labels
+        slider_y = self._slider_y
         rect_w, rect_h = 12, 24
         thumb_x = self._value_to_pos(self.value)
         thumb_left = thumb_x - rect_w // 2
@@ -617,7 +744,7 @@ class SingleSlider(tk.Canvas):
             value = self._pos_to_value(x)
             self.value = max(self.min_val, min(self.max_val, value))
             self.active_thumb = True
-            self._draw_slider()
+            self._update_value_items()
             if self.command:
                 self.command(self.value)
 
@@ -630,20 +757,24 @@ class SingleSlider(tk.Canvas):
             value = self.min_val
         if value > self.max_val:
             value = self.max_val
+        if value == self.value:
+            return  # Motion within the same integer value, nothing to redraw
         self.value = value
-        self._draw_slider()
+        self._update_value_items()
         if self.command:
             self.command(self.value)
 
     def _on_release(self, event):
         self.active_thumb = False
+        if isinstance(self.command, Debouncer):
+            self.command.flush()
 
     def get(self):
         return self.value
 
     def set(self, value):
         self.value = value
-        self._draw_slider()
+        self._update_value_items()
 
 
 class CustomCheckbox(tk.Canvas):
@@ -684,6 +815,9 @@ class CustomCheckbox(tk.Canvas):
         self.bind('<Button-1>', self._on_click)
 
     def _on_resize(self, event):
+        # <Configure> also fires when a repack only moves the widget, redraw only for a new width
+        if event.width == self.width:
+            return
         self.config(width=event.width)
         self.width = event.width
         self.height = self._user_height
@@ -773,47 +907,50 @@ class CustomTextInput(tk.Frame):
         entry_pad_top = 4 if self.subtitle else 0
         self.entry_border = tk.Frame(self, bg='black', bd=0, highlightthickness=0)
         self.entry_border.pack(fill='x', padx=(x_pad, x_pad), pady=(entry_pad_top,0))
-        self.entry = tk.Entry(self.entry_border, font=(subtitle_font, 12), bg='white', relief='flat', highlightthickness=0, bd=0)
+        # Text goes through a StringVar so replacing it is a single Tcl call instead of delete + insert
+        self._text_var = tk.StringVar(self)
+        self.entry = tk.Entry(self.entry_border, textvariable=self._text_var, font=(subtitle_font, 12), bg='white', relief='flat', highlightthickness=0, bd=0)
         self.entry.pack(fill='x', padx=0, pady=0, ipady=2)
         self.entry_border.config(highlightbackground='black', highlightcolor='black', highlightthickness=2, bd=0)
         self.entry.bind('<KeyRelease>', self._on_text_change)
 
+        self._resized_width = None
         if is_set_width_to_parent:
             self.bind('<Configure>', self._on_resize)
 
     def _on_resize(self, event):
+        # <Configure> also fires when a repack only moves the widget, resize only for a new width
+        if event.width == self._resized_width:
+            return
+        self._resized_width = event.width
         self.config(width=event.width)
         self.entry_border.config(width=event.width)
         self.entry.config(width=event.width)
 
     def _on_text_change(self, event):
         # Validate and sanitize filename
-        current_text = self.entry.get()
+        current_text = self._text_var.get()
         safe_text = self._sanitize_filename(current_text)
         if current_text != safe_text:
-            self.entry.delete(0, tk.END)
-            self.entry.insert(0, safe_text)
+            self._text_var.set(safe_text)
         if self.on_text_change:
             self.on_text_change(safe_text)
 
     def _sanitize_filename(self, name):
-        # Remove unsafe characters (only allow letters, numbers, underscores, dashes)
-        name = re.sub(r'[^A-Za-z0-9_-]', '_', name)
-        # Optional: Limit length to 255 characters
-        return name[:255]
+        return sanitize_filename(name)
 
     def get(self):
-        return self.entry.get()
+        return self._text_var.get()
 
     def set(self, text):
         safe_text = self._sanitize_filename(text)
-        self.entry.delete(0, tk.END)
-        self.entry.insert(0, safe_text)
+        if safe_text != self._text_var.get():
+            self._text_var.set(safe_text)
 
 class Padding(tk.Frame):
+    # A childless frame keeps its configured height, so no pack_propagate(False) call is needed
     def __init__(self, master, height=20, bg_color='white', **kwargs):
         super().__init__(master, height=height, bg=bg_color, **kwargs)
-        self.pack_propagate(False)
 
 
 
@@ -1,7 +1,5 @@
 import tkinter as tk
 from tkinter import ttk
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import numpy as np
 import sympy as sp
 from sympy import sympify, lambdify
@@ -188,6 +186,8 @@ class VectorFieldVisualizer:
         
         # Sympy symbols
         self.x, self.y = sp.symbols('x y', real=True)
+        # Equation texts last checked by validate_expressions, keys that leave them unchanged skip parsing
+        self._last_validated_texts = None
         
         # Store initial strings
         self.initial_f_string = initial_f_string
@@ -350,6 +350,9 @@ class VectorFieldVisualizer:
         
     def create_plot(self, parent):
         """Create the matplotlib plot for vector field visualization"""
+        # Imported here so parsing equations (e.g. in painting worker processes) does not load matplotlib
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
         # Create figure and axis
         self.fig, self.ax = plt.subplots(figsize=(8, 6))
         self.fig.patch.set_facecolor('#f0f0f0')
@@ -369,6 +372,7 @@ class VectorFieldVisualizer:
         try:
             f_text = self.f_entry.get().strip()
             g_text = self.g_entry.get().strip()
+            self._last_validated_texts = (f_text, g_text)
             
             if not f_text or not g_text:
                 self.update_status("Invalid", "Empty expression", 'red')
@@ -525,6 +529,10 @@ class VectorFieldVisualizer:
     
     def on_entry_change(self, event=None):
         """Handle changes in entry fields"""
+        # Arrow keys, modifiers and selection changes also fire <KeyRelease>, only re-parse real edits
+        texts = (self.f_entry.get().strip(), self.g_entry.get().strip())
+        if texts == self._last_validated_texts:
+            return
         self.validate_expressions()
     
     def create_result_function(self):
@@ -597,6 +605,7 @@ class VectorFieldVisualizer:
         
         # Clean up matplotlib resources
         if hasattr(self, 'fig'):
+            import matplotlib.pyplot as plt
             plt.close(self.fig)
         
         # Clean up
@@ -616,6 +625,7 @@ class VectorFieldVisualizer:
         self.confirmed = False
         # Clean up matplotlib resources
         if hasattr(self, 'fig'):
+            import matplotlib.pyplot as plt
             plt.close(self.fig)
         self.root.quit()
         self.root.destroy()
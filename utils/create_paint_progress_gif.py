@@ -3,6 +3,8 @@ import time
 import numpy as np
 import imageio
 import multiprocessing as mp
+from multiprocessing import shared_memory
+from queue import Empty
 from typing import Optional
 
 # Try to import faster libraries
@@ -20,7 +22,8 @@ except ImportError:
 
 
 class CreateOutputGIF:
-    def __init__(self, fps: int, is_create_gif: bool, gif_file_name: str, use_fast_writer: bool = True):
+    def __init__(self, fps: int, is_create_gif: bool, gif_file_name: str, use_fast_writer: bool = True,
+                 use_shared_memory: bool = True, shared_memory_slots: int = 8):
         """
         Initialize the GIF creator with specified parameters.
         
@@ -29,22 +32,37 @@ class CreateOutputGIF:
             is_create_gif (bool): Whether to create GIF or not
             gif_file_name (str): Name of the output GIF file (without extension)
             use_fast_writer (bool): Use optimized PIL writer for better performance
+            use_shared_memory (bool): Pass frames to the writer process through a shared memory ring
+                                      of float32 slots instead of compressing and pickling each frame
+            shared_memory_slots (int): Number of frames that can be in flight in the shared memory ring
         """
         self.fps = fps
         self.is_create_gif = is_create_gif
         self.gif_file_name = gif_file_name
         self.use_fast_writer = use_fast_writer and PIL_AVAILABLE
+        self.use_shared_memory = use_shared_memory
+        self.shared_memory_slots = max(1, shared_memory_slots)
         
         # Initialize process and queue attributes
         self.process: Optional[mp.Process] = None
         self.queue: Optional[mp.Queue] = None
         
+        # Shared memory ring, allocated on the first frame once its shape is known.
+        # The writer process hands slot indices back through free_slot_queue after reading them.
+        self.free_slot_queue: Optional[mp.Queue] = None
+        self._shm: Optional[shared_memory.SharedMemory] = None
+        self._shm_frame_shape = None
+        self._shm_frame_nbytes = 0
+        self._reader_shm: Optional[shared_memory.SharedMemory] = None
+        
         if self.is_create_gif:
             # Create output directory if it doesn't exist
             os.makedirs("output", exist_ok=True)
             
             # Create queue and process
             self.queue = mp.Queue(maxsize=100)  # Limit queue size to prevent memory buildup
+            if self.use_shared_memory:
+                self.free_slot_queue = mp.Queue()
             self.process = mp.Process(target=self._gif_writer_process)
             self.process.start()
     
@@ -75,10 +93,15 @@ class CreateOutputGIF:
             gif_path = os.path.join("output", gif_filename)
         
         # Choose writer based on availability and preference
-        if self.use_fast_writer:
-            self._write_gif_with_pil(gif_path)
-        else:
-            self._write_gif_with_imageio(gif_path)
+        try:
+            if self.use_fast_writer:
+                self._write_gif_with_pil(gif_path)
+            else:
+                self._write_gif_with_imageio(gif_path)
+        finally:
+            if self._reader_shm is not None:
+                self._reader_shm.close()
+                self._reader_shm = None
     
     def _write_gif_with_pil(self, gif_path: str):
         """Fast GIF writing using PIL with optimization."""
@@ -219,6 +242,22 @@ class CreateOutputGIF:
                         return np.concatenate([decompressed, alpha], axis=-1)
                     return decompressed
             
+            elif frame_type == 'shm_attach':
+                # Sent once by the main process before the first shared memory frame
+                self._reader_shm = shared_memory.SharedMemory(name=frame_data['name'])
+                self._shm_frame_shape = frame_data['shape']
+                self._shm_frame_nbytes = int(np.prod(frame_data['shape'])) * np.float32().itemsize
+                return None
+            
+            elif frame_type == 'shm':
+                # Convert straight out of the slot, then hand the slot back to the main process
+                slot = frame_data['slot']
+                frame = np.ndarray(self._shm_frame_shape, dtype=np.float32, buffer=self._reader_shm.buf,
+                                   offset=slot * self._shm_frame_nbytes)
+                frame_uint8 = (frame * 255).astype(np.uint8)
+                self.free_slot_queue.put(slot)
+                return frame_uint8
+            
             elif frame_type == 'raw_uint8':
                 return frame_data['data']
             
@@ -256,6 +295,10 @@ class CreateOutputGIF:
                 print("Warning: GIF queue full, skipping frame to prevent memory buildup")
                 return
             
+            # Copy into shared memory when possible, leaving conversion to the writer process
+            if self.use_shared_memory and self._enqueue_frame_shared(frame):
+                return
+            
             # Compress frame for faster queue operations
             compressed_frame = self._compress_frame(frame)
             self.queue.put(compressed_frame, block=False)
@@ -263,6 +306,51 @@ class CreateOutputGIF:
             if "queue is full" not in str(e).lower():
                 print(f"Warning: Failed to enqueue frame: {e}")
     
+    def _enqueue_frame_shared(self, frame: np.ndarray) -> bool:
+        """
+        Copy a frame into a free shared memory slot and send the slot index to the writer process.
+        Never waits for the writer process: when every slot is still being read, the frame goes through
+        the compressed path instead, so painting is not throttled to the writer's speed.
+        
+        Args:
+            frame (np.ndarray): Normalized RGBA numpy array (float32)
+            
+        Returns:
+            bool: True if the frame was sent, False if it must go through the compressed path
+        """
+        if frame.dtype != np.float32:
+            return False
+        
+        if self._shm is None:
+            # First frame fixes the slot size
+            self._shm_frame_shape = frame.shape
+            self._shm_frame_nbytes = frame.nbytes
+            self._shm = shared_memory.SharedMemory(create=True, size=frame.nbytes * self.shared_memory_slots)
+            for slot in range(self.shared_memory_slots):
+                self.free_slot_queue.put(slot)
+            self.queue.put({'type': 'shm_attach', 'name': self._shm.name, 'shape': frame.shape})
+        elif frame.shape != self._shm_frame_shape:
+            return False
+        
+        try:
+            slot = self.free_slot_queue.get_nowait()
+        except Empty:
+            # Every slot is still waiting for the writer, send only this frame compressed
+            return False
+        
+        slot_view = np.ndarray(self._shm_frame_shape, dtype=np.float32, buffer=self._shm.buf,
+                               offset=slot * self._shm_frame_nbytes)
+        slot_view[...] = frame
+        self.queue.put({'type': 'shm', 'slot': slot})
+        return True
+    
+    def _release_shared_memory(self):
+        """Free the shared memory ring once the writer process has finished with it"""
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+    
     def _compress_frame(self, frame: np.ndarray) -> dict:
         """
         Compress frame for efficient queue transmission.
@@ -335,6 +423,7 @@ class CreateOutputGIF:
             # Wait for process to complete
             self.process.join()
             # print("GIF creation process ended cleanly")
+            self._release_shared_memory()
 
     def close(self):
         """
@@ -363,6 +452,8 @@ class CreateOutputGIF:
             
             self.process = None
             self.queue = None
+        
+        self._release_shared_memory()
             
     def __enter__(self):
         """Context manager entry"""
@@ -152,17 +152,50 @@ class CreateOutputImage:
             self.worker_process = mp.Process(target=self.worker, args=(self.queue, self.shm.name, self.output_rgba.shape, self.output_rgba.dtype, self.texture_dict, self.scale_factor, self.sentinel))
             self.worker_process.start()
         else:
-            # Synchronous mode: accumulate jobs in a list
-            self.jobs = []
+            # Synchronous mode: accumulate shapes in preallocated arrays (one row per shape),
+            # grown by doubling unless reserve() was called with the final shape count
+            self.num_shapes = 0
+            self.shape_rects = np.empty((256, 5), dtype=np.float64)
+            self.shape_texture_keys = np.empty(256, dtype=np.int64)
+            self.shape_rgbs = np.empty((256, 3), dtype=np.float32)
             self.output_rgba = np.ones((self.output_height, self.output_width, 4), dtype=np.float32)
             self.output_rgba[:, :, 0:3] *= self.average_rgb
             self.output_rgba[:, :, 3] = 1.0
 
+    def reserve(self, num_shapes):
+        """Size the synchronous shape arrays for num_shapes shapes up front"""
+        if not self.use_worker_process and num_shapes > self.shape_rects.shape[0]:
+            self._resize_shape_arrays(num_shapes)
+
+    def _resize_shape_arrays(self, capacity):
+        count = self.num_shapes
+        shape_rects = np.empty((capacity, 5), dtype=np.float64)
+        shape_texture_keys = np.empty(capacity, dtype=np.int64)
+        shape_rgbs = np.empty((capacity, 3), dtype=np.float32)
+        shape_rects[:count] = self.shape_rects[:count]
+        shape_texture_keys[:count] = self.shape_texture_keys[:count]
+        shape_rgbs[:count] = self.shape_rgbs[:count]
+        self.shape_rects, self.shape_texture_keys, self.shape_rgbs = shape_rects, shape_texture_keys, shape_rgbs
+
     def enqueue(self, rect_texture_rgb_dict):
         if self.use_worker_process:
             self.queue.put(rect_texture_rgb_dict)
         else:
-            self.jobs.append(rect_texture_rgb_dict)
+            self.enqueue_shape(rect_texture_rgb_dict["best_rect_list"], rect_texture_rgb_dict["texture_key"],
+                               rect_texture_rgb_dict["rgb"])
+
+    def enqueue_shape(self, best_rect_list, texture_key, rgb):
+        """Same as enqueue, without building a job dict in synchronous mode"""
+        if self.use_worker_process:
+            self.queue.put({"best_rect_list": best_rect_list, "texture_key": texture_key, "rgb": rgb})
+            return
+        index = self.num_shapes
+        if index == self.shape_rects.shape[0]:
+            self._resize_shape_arrays(2 * index)
+        self.shape_rects[index] = best_rect_list
+        self.shape_texture_keys[index] = texture_key
+        self.shape_rgbs[index] = rgb
+        self.num_shapes = index + 1
 
     def finish(self):
         if self.use_worker_process:
@@ -174,11 +207,12 @@ class CreateOutputImage:
             self.shm.unlink()
             return result
         else:
-            # Synchronous: process all jobs in this process
-            for job in self.jobs:
-                best_rect_list = job["best_rect_list"]
-                rgb = job["rgb"]
-                texture_key = job["texture_key"]
+            # Synchronous: process all shapes in this process
+            for index in range(self.num_shapes):
+                x, y, h, w, theta = self.shape_rects[index]
+                best_rect_list = [int(x), int(y), h, w, theta]
+                rgb = self.shape_rgbs[index]
+                texture_key = int(self.shape_texture_keys[index])
                 texture_greyscale_alpha = self.texture_dict[texture_key]["texture_greyscale_alpha"]
                 original_vertices = rectangle_to_polygon(*best_rect_list)
                 output_rect_vertices = (original_vertices * self.scale_factor).astype(np.int32)
@@ -18,4 +18,18 @@ def warmup_numba():
     draw_texture_on_canvas(texture_greyscale_alpha, current_rgba, scanline_x_intersects_array, poly_y_min, rgb_avg,
                            *rectangle)
     end = time.time()
-    print(f"Time taken for numba warmup: {end - start:.4f} seconds")
\ No newline at end of file
+    print(f"Time taken for numba warmup: {end - start:.4f} seconds")
+
+
+def warmup_painting_kernels():
+    """Compile the kernels used to score and commit shapes in the painter, without printing"""
+    rgb = np.ones(3, dtype=np.float32)
+    texture_greyscale_alpha = np.ones((10, 10, 2), dtype=np.float32)
+    current_rgba = np.ones((10, 10, 4), dtype=np.float32)
+    vertices = rectangle_to_polygon(5, 5, np.float32(4), np.float32(4), np.float32(0))
+    poly_y_min, y_max_clamped, scanline_x_intersects_array = get_y_index_bounds_and_scanline_x_intersects(vertices, 10, 10)
+    blend_texture_on_canvas(texture_greyscale_alpha, current_rgba, scanline_x_intersects_array, poly_y_min, rgb,
+                            5, 5, np.float32(4), np.float32(4), np.float32(0))
+    score_rectangle(current_rgba, texture_greyscale_alpha, current_rgba, 5, 5, np.float32(4), np.float32(4), np.float32(0))
+    score_rectangle_into(current_rgba, texture_greyscale_alpha, current_rgba, 5, 5, np.float32(4), np.float32(4), np.float32(0),
+                         np.empty((current_rgba.shape[0], 2), dtype=np.int32))
@@ -92,12 +92,14 @@ class PygameDisplayProcess:
 
             pygame.quit()
 
-    def update_display(self, img):
-        """Enqueues image, dropping old ones if queue is full"""
+    def update_display(self, img, copy=True):
+        """Enqueues image, dropping old ones if queue is full. Pass copy=False for arrays that are no longer modified"""
         if self.is_show_pygame_display and not self.closed_flag.value:
+            if copy:
+                img = img.copy()
             try:
                 # Try to put without blocking
-                self.queue.put_nowait(img.copy())
+                self.queue.put_nowait(img)
             except:
                 # Queue is full, clear it and put the new image
                 try:
@@ -106,7 +108,7 @@ class PygameDisplayProcess:
                 except:
                     pass
                 try:
-                    self.queue.put_nowait(img.copy())
+                    self.queue.put_nowait(img)
                 except:
                     pass  # If still fails, just skip this frame
 
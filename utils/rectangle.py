@@ -5,7 +5,8 @@ import matplotlib.pyplot as plt
 from utils.utilities import clamp_int
 
 
-def create_random_rectangle(canvas_height, canvas_width, texture_height, texture_width, vector_field, custom_rectangle_width=200):
+def create_random_rectangle(canvas_height, canvas_width, texture_height, texture_width, vector_field, custom_rectangle_width=200,
+                            rng=None):
     """
     Creates a random rectangle with its center located at a random integer pixel index within the canvas.
     The rectangle maintains the same aspect ratio as the given texture, with its width fixed at custom_rectangle_width pixels.
@@ -18,6 +19,7 @@ def create_random_rectangle(canvas_height, canvas_width, texture_height, texture
         texture_width (int): Width of the reference texture in pixels.
         vector_field (VectorField): A vector field that maps (x,y) coordinate to theta radians in range [-pi,pi]
         custom_rectangle_width (int): Optional parameter to specify the width of randomly generated rectangle
+        rng (np.random.Generator): Optional generator to sample from instead of the global np.random state
 
     Returns:
         rectangle (list): A list containing:
@@ -33,20 +35,25 @@ def create_random_rectangle(canvas_height, canvas_width, texture_height, texture
     aspect_ratio = texture_height / texture_width
     rect_height = rect_width * aspect_ratio
 
+    if rng is None:
+        rng_integers, rng_uniform = np.random.randint, np.random.uniform
+    else:
+        rng_integers, rng_uniform = rng.integers, rng.uniform
+
     # Random integer center positions (0 to size-1)
-    x = np.random.randint(0, canvas_width)
-    y = np.random.randint(0, canvas_height)
+    x = int(rng_integers(0, canvas_width))
+    y = int(rng_integers(0, canvas_height))
 
     if vector_field and vector_field.is_enabled:
         # Get theta from vector field
         theta = vector_field.get_vector_field_theta(x, y)
     else:
         # Random angle in radians between -π and π
-        theta = np.random.uniform(-np.pi, np.pi)
+        theta = rng_uniform(-np.pi, np.pi)
 
     return [x, y, rect_height, rect_width, theta]
 
-def get_mutated_rectangle_copy(rectangle, canvas_height, canvas_width, vector_field, is_scaling_allowed):
+def get_mutated_rectangle_copy(rectangle, canvas_height, canvas_width, vector_field, is_scaling_allowed, rng=None):
     """
     Takes in a rectangle and returns a mutated copy of it.
     One of three mutation cases is randomly applied with equal probability:
@@ -61,6 +68,7 @@ def get_mutated_rectangle_copy(rectangle, canvas_height, canvas_width, vector_fi
         canvas_width (int): Width of the canvas in pixels.
         vector_field (VectorField): A vector field that maps (x,y) coordinate to theta radians in range [-pi,pi]
         is_scaling_allowed (Boolean): Flag to determine if the height and width should be mutated
+        rng (np.random.Generator): Optional generator to sample from instead of the global np.random state
 
     Returns:
         mutated_rectangle (list): A mutated copy of the input rectangle.
@@ -78,12 +86,17 @@ def get_mutated_rectangle_copy(rectangle, canvas_height, canvas_width, vector_fi
     if is_scaling_allowed:
         mutation_operation_case.append(2)
 
-    case = np.random.choice(mutation_operation_case)
+    if rng is None:
+        rng_integers, rng_uniform = np.random.randint, np.random.uniform
+        case = np.random.choice(mutation_operation_case)
+    else:
+        rng_integers, rng_uniform = rng.integers, rng.uniform
+        case = mutation_operation_case[rng_integers(len(mutation_operation_case))]
         
     if case == 1:
         # Case 1: Mutate x and y
-        dx = np.random.randint(-100, 100)
-        dy = np.random.randint(-100, 100)
+        dx = rng_integers(-100, 100)
+        dy = rng_integers(-100, 100)
         mutated[0] = clamp_int(x + dx, 0, canvas_width - 1)
         mutated[1] = clamp_int(y + dy, 0, canvas_height - 1)
 
@@ -93,12 +106,12 @@ def get_mutated_rectangle_copy(rectangle, canvas_height, canvas_width, vector_fi
 
     elif case == 2:
         # Case 2: Scale height and width
-        scale = np.random.uniform(0.5, 1.5)
+        scale = rng_uniform(0.5, 1.5)
         mutated[2] = rect_height * scale
         mutated[3] = rect_width * scale
 
     elif case == 3: # Case 3: Do rotation
-        dtheta = np.random.uniform(-np.pi/4, np.pi/4)
+        dtheta = rng_uniform(-np.pi/4, np.pi/4)
         new_theta = theta + dtheta
         # Wrap angle to [-π, π]
         new_theta = (new_theta + np.pi) % (2 * np.pi) - np.pi
@@ -201,6 +214,26 @@ def get_y_index_bounds_and_scanline_x_intersects(vertices, canvas_height, canvas
         y_max (int): Maximum y integer coordinate of the polygon, bounded by canvas index
         x_intersects (np.ndarray): np.int32 NumPy array of size (y_max_clamped - y_min_clamped + 1, 2)
     """
+    return get_y_index_bounds_and_scanline_x_intersects_into(
+        vertices, canvas_height, canvas_width, np.empty((canvas_height, 2), dtype=np.int32))
+
+
+@nb.njit(cache=True)
+def get_y_index_bounds_and_scanline_x_intersects_into(vertices, canvas_height, canvas_width, x_intersects_buffer):
+    """
+    Same as get_y_index_bounds_and_scanline_x_intersects, but writes the x intersects into a caller owned
+    buffer so repeated calls (e.g. every hill climbing iteration) do not allocate.
+
+    Parameters:
+        vertices (np.ndarray): A 4x2 NumPy array of vertex coordinates of type np.int32
+        canvas_height (int): Pixel height of canvas
+        canvas_width (int): Pixel width of canvas
+        x_intersects_buffer (np.ndarray): np.int32 NumPy array of shape (at least canvas_height, 2)
+    Returns:
+        y_min (int): Minimum y integer coordinate of the polygon, bounded by canvas index
+        y_max (int): Maximum y integer coordinate of the polygon, bounded by canvas index
+        x_intersects (np.ndarray): View of the first (y_max_clamped - y_min_clamped + 1) rows of the buffer
+    """
     num_vertices = vertices.shape[0]
 
     # find y_min and y_max
@@ -223,7 +256,8 @@ def get_y_index_bounds_and_scanline_x_intersects(vertices, canvas_height, canvas
 
     # Initialize numpy array to hold x intersects pairs for all possible scanlines
     # Note that the scanline algorithm may not detect any intersects in corner cases, so denote missing or out of bounds x intersect left and right as (-1,-1)
-    x_intersects = np.full((num_scanlines, 2), -1, dtype=np.int32)
+    x_intersects = x_intersects_buffer[:num_scanlines]
+    x_intersects[:] = -1
     array_index = 0
     # For each scanline...
     for y_scanline_index in range(y_min_clamped, y_max_clamped + 1):
@@ -731,24 +765,293 @@ def draw_texture_on_canvas(texture_greyscale_alpha, current_rgba, scanline_x_int
 
 
 
-def get_score_avg_rgb_ymin_and_scanline_xintersect(rect_list, target_rgba, texture_greyscale_alpha, current_rgba):
+@nb.njit(cache=True, fastmath=True)
+def blend_texture_on_canvas(texture_greyscale_alpha, current_rgba, scanline_x_intersects_array, poly_y_min, rgb,
+                            rect_x_center, rect_y_center, rect_height, rect_width, rect_theta):
+    """
+    Fused version of draw_texture_on_canvas used to commit the best rectangle to the canvas.
+
+    The rotation and inverse scale are computed once per rectangle and the alpha blend is done per channel
+    in scalars, so no temporary arrays are allocated per pixel. Like score_rectangle it runs serially: it also
+    runs inside every multiprocessing worker, and a rectangle is too small to pay for a parallel launch.
+
+    Parameters:
+        texture_greyscale_alpha (np.ndarray):
+            Array of shape (H, W, 2) representing grayscale and alpha, dtype np.float32.
+
+        current_rgba (np.ndarray):
+            Normalized RGBA image of shape (H, W, 4), dtype np.float32.
+
+        scanline_x_intersects_array (np.ndarray):
+            np.int32 NumPy array of size (y_max_clamped - y_min_clamped + 1, 2)
+
+        poly_y_min (int):
+            index of clamped y index of polygon within boundary of canvas
+
+        rgb (np.ndarray):
+            np.float32 NumPy array denoting average rgb values for multiplying with greyscale channel
+
+        rect_x_center (int):
+            x coordinate/index of rectangle center
+
+        rect_y_center (int):
+            y coordinate/index of rectangle center
+
+        rect_height (np.float32):
+            height of rectangle in pixels
+
+        rect_width (np.float32):
+            width of rectangle in pixels
+
+        rect_theta (np.float32)
+            radian rotation of rectangle in range [-pi, pi]
+
+    Returns:
+        current_rgba (np.ndarray):
+            Normalized RGBA image of shape (H, W, 4), dtype np.float32. this array has been mutated and also returned
+    """
+
+    # Get height and width of texture
+    texture_height, texture_width = texture_greyscale_alpha.shape[0], texture_greyscale_alpha.shape[1]
+
+    # Rectangle-wide terms of transform_rect_texture_coordinate
+    cos_theta = np.cos(rect_theta)
+    sin_theta = np.sin(rect_theta)
+    rect_reverse_scale_x = texture_width / rect_width
+    rect_reverse_scale_y = texture_height / rect_height
+    half_texture_width = texture_width / 2
+    half_texture_height = texture_height / 2
+    red, green, blue = rgb[0], rgb[1], rgb[2]
+
+    for i in range(scanline_x_intersects_array.shape[0]):
+        # Get scanline x intersects
+        x_left = scanline_x_intersects_array[i, 0]
+        x_right = scanline_x_intersects_array[i, 1]
+        # skip out of bounds x intersects
+        if x_left == -1 or x_right == -1:
+            continue
+
+        # Get y index of scanline
+        y = i + poly_y_min
+        translated_y = y - rect_y_center
+
+        for x in range(x_left, x_right + 1):
+            # Get transformed coordinates in texture space (might be floating point)
+            translated_x = x - rect_x_center
+            new_x = np.float32((translated_x * cos_theta + translated_y * sin_theta) * rect_reverse_scale_x + half_texture_width)
+            new_y = np.float32((-translated_x * sin_theta + translated_y * cos_theta) * rect_reverse_scale_y + half_texture_height)
+
+            # Skip pixel if its corresponding transformed pixel is out of bounds
+            if new_x < 0 or new_y < 0 or new_x > texture_width - 2 or new_y > texture_height - 2:
+                continue
+
+            # Interpolated greyscale and alpha intensity of the texture
+            interpolated_greyscale = bi_linear_interpolation_in_texture_space(new_x, new_y, texture_greyscale_alpha, 0)
+            interpolated_alpha = bi_linear_interpolation_in_texture_space(new_x, new_y, texture_greyscale_alpha, 1)
+
+            # Straight alpha blend, same as alpha_blend but per channel
+            background_alpha = current_rgba[y, x, 3]
+            background_weight = background_alpha * (1 - interpolated_alpha)
+            resultant_alpha = interpolated_alpha + background_weight
+            if resultant_alpha == 0:
+                continue
+            foreground_weight = interpolated_greyscale * interpolated_alpha
+
+            current_rgba[y, x, 0] = (red * foreground_weight + current_rgba[y, x, 0] * background_weight) / resultant_alpha
+            current_rgba[y, x, 1] = (green * foreground_weight + current_rgba[y, x, 1] * background_weight) / resultant_alpha
+            current_rgba[y, x, 2] = (blue * foreground_weight + current_rgba[y, x, 2] * background_weight) / resultant_alpha
+            current_rgba[y, x, 3] = resultant_alpha
+
+    # current_rgba is mutated but returned also
+    return current_rgba
+
+
+
+@nb.njit(cache=True, fastmath=True)
+def score_rectangle(target_rgba, texture_greyscale_alpha, current_rgba,
+                    rect_x_center, rect_y_center, rect_height, rect_width, rect_theta):
+    """
+    score_rectangle_into with a freshly allocated scanline buffer, see score_rectangle_into
+    """
+    return score_rectangle_into(target_rgba, texture_greyscale_alpha, current_rgba,
+                                rect_x_center, rect_y_center, rect_height, rect_width, rect_theta,
+                                np.empty((current_rgba.shape[0], 2), dtype=np.int32))
+
+
+@nb.njit(cache=True, fastmath=True)
+def score_rectangle_into(target_rgba, texture_greyscale_alpha, current_rgba,
+                         rect_x_center, rect_y_center, rect_height, rect_width, rect_theta,
+                         x_intersects_buffer):
+    """
+    Fused equivalent of rectangle_to_polygon, get_y_index_bounds_and_scanline_x_intersects,
+    get_average_rgb_value and get_score_of_rectangle in a single compiled call.
+
+    This is the innermost step of hill climbing, so it avoids per-call dispatch of four kernels,
+    computes the rotation and inverse scale once per rectangle, and does the alpha blend and pixel
+    differences per channel in scalars instead of allocating small arrays for every pixel.
+
+    Rectangles are small, so the loops are kept serial; a parallel launch costs more than it saves here.
+
+    Parameters:
+        target_rgba (np.ndarray):
+            Normalized RGBA image of shape (H, W, 4), dtype np.float32.
+
+        texture_greyscale_alpha (np.ndarray):
+            Array of shape (H, W, 2) representing grayscale and alpha, dtype np.float32.
+
+        current_rgba (np.ndarray):
+            Normalized RGBA image of shape (H, W, 4), dtype np.float32.
+
+        rect_x_center (int):
+            x coordinate/index of rectangle center
+
+        rect_y_center (int):
+            y coordinate/index of rectangle center
+
+        rect_height (np.float32):
+            height of rectangle in pixels
+
+        rect_width (np.float32):
+            width of rectangle in pixels
+
+        rect_theta (np.float32)
+            radian rotation of rectangle in range [-pi, pi]
+
+        x_intersects_buffer (np.ndarray):
+            np.int32 scratch array of shape (at least H, 2) that receives the scanline x intersects
+
+    Returns:
+        score (float):
+            Total fitness score for the rectangle placement. Returns -1 for degenerate rectangles with
+            fewer than 4 pixels, and -inf when no pixel has texture alpha above 0.2, so a rectangle
+            without a colour (NaN average_rgb) never beats a real one.
+        average_rgb (np.ndarray):
+            Length 3 dtype np.float32 array containing normalized rgb values
+        poly_y_min (int):
+            index of clamped y index of polygon within boundary of canvas
+        scanline_x_intersects_array (np.ndarray):
+            View of x_intersects_buffer of size (y_max_clamped - y_min_clamped + 1, 2)
+    """
+    canvas_height, canvas_width = current_rgba.shape[0], current_rgba.shape[1]
+    vertices = rectangle_to_polygon(rect_x_center, rect_y_center, rect_height, rect_width, rect_theta)
+    poly_y_min, poly_y_max, scanline_x_intersects_array = get_y_index_bounds_and_scanline_x_intersects_into(
+        vertices, canvas_height, canvas_width, x_intersects_buffer)
+
+    # Get height and width of texture
+    texture_height, texture_width = texture_greyscale_alpha.shape[0], texture_greyscale_alpha.shape[1]
+
+    # Rectangle-wide terms of transform_rect_texture_coordinate
+    cos_theta = np.cos(rect_theta)
+    sin_theta = np.sin(rect_theta)
+    rect_reverse_scale_x = texture_width / rect_width
+    rect_reverse_scale_y = texture_height / rect_height
+    half_texture_width = texture_width / 2
+    half_texture_height = texture_height / 2
+
+    # 1) Average rgb of target pixels where the projected texture alpha exceeds 0.2
+    total_red, total_green, total_blue = 0.0, 0.0, 0.0
+    count_influential_pixels = 0
+    for i in range(scanline_x_intersects_array.shape[0]):
+        x_left = scanline_x_intersects_array[i, 0]
+        x_right = scanline_x_intersects_array[i, 1]
+        if x_left == -1 or x_right == -1:
+            continue
+        y = i + poly_y_min
+        translated_y = y - rect_y_center
+        for x in range(x_left, x_right + 1):
+            translated_x = x - rect_x_center
+            new_x = np.float32((translated_x * cos_theta + translated_y * sin_theta) * rect_reverse_scale_x + half_texture_width)
+            new_y = np.float32((-translated_x * sin_theta + translated_y * cos_theta) * rect_reverse_scale_y + half_texture_height)
+            if new_x < 0 or new_y < 0 or new_x > texture_width - 2 or new_y > texture_height - 2:
+                continue
+            if bi_linear_interpolation_in_texture_space(new_x, new_y, texture_greyscale_alpha, 1) > 0.2:
+                total_red += target_rgba[y, x, 0]
+                total_green += target_rgba[y, x, 1]
+                total_blue += target_rgba[y, x, 2]
+                count_influential_pixels += 1
+
+    average_rgb = np.empty(3, dtype=np.float32)
+    if count_influential_pixels == 0:
+        # No pixel is covered by the texture, so there is no colour to score with.
+        # -inf loses every comparison, as the NaN score of the unfused kernels did.
+        average_rgb[:] = np.nan
+        return -np.inf, average_rgb, poly_y_min, scanline_x_intersects_array
+    average_rgb[0] = total_red / count_influential_pixels
+    average_rgb[1] = total_green / count_influential_pixels
+    average_rgb[2] = total_blue / count_influential_pixels
+    red, green, blue = average_rgb[0], average_rgb[1], average_rgb[2]
+
+    # 2) Score = sum over pixels of (original difference - blended difference) to the target
+    total_score = 0.0
+    count_pixels = 0
+    for i in range(scanline_x_intersects_array.shape[0]):
+        x_left = scanline_x_intersects_array[i, 0]
+        x_right = scanline_x_intersects_array[i, 1]
+        if x_left == -1 or x_right == -1:
+            continue
+        y = i + poly_y_min
+        translated_y = y - rect_y_center
+        for x in range(x_left, x_right + 1):
+            translated_x = x - rect_x_center
+            new_x = np.float32((translated_x * cos_theta + translated_y * sin_theta) * rect_reverse_scale_x + half_texture_width)
+            new_y = np.float32((-translated_x * sin_theta + translated_y * cos_theta) * rect_reverse_scale_y + half_texture_height)
+            if new_x < 0 or new_y < 0 or new_x > texture_width - 2 or new_y > texture_height - 2:
+                continue
+            count_pixels += 1
+
+            interpolated_greyscale = bi_linear_interpolation_in_texture_space(new_x, new_y, texture_greyscale_alpha, 0)
+            interpolated_alpha = bi_linear_interpolation_in_texture_space(new_x, new_y, texture_greyscale_alpha, 1)
+
+            current_red, current_green, current_blue = current_rgba[y, x, 0], current_rgba[y, x, 1], current_rgba[y, x, 2]
+            target_red, target_green, target_blue = target_rgba[y, x, 0], target_rgba[y, x, 1], target_rgba[y, x, 2]
+
+            # i) Original root sum of squared differences between current and target rgb
+            original_pixel_difference = np.sqrt((current_red - target_red) ** 2 +
+                                                (current_green - target_green) ** 2 +
+                                                (current_blue - target_blue) ** 2)
+
+            # ii) Straight alpha blend of the textured pixel onto the current pixel, same as alpha_blend
+            background_weight = current_rgba[y, x, 3] * (1 - interpolated_alpha)
+            resultant_alpha = interpolated_alpha + background_weight
+            if resultant_alpha == 0:
+                blended_red, blended_green, blended_blue = current_red, current_green, current_blue
+            else:
+                foreground_weight = interpolated_greyscale * interpolated_alpha
+                blended_red = (red * foreground_weight + current_red * background_weight) / resultant_alpha
+                blended_green = (green * foreground_weight + current_green * background_weight) / resultant_alpha
+                blended_blue = (blue * foreground_weight + current_blue * background_weight) / resultant_alpha
+
+            # iii) New root sum of squared differences between blended and target rgb
+            new_pixel_difference = np.sqrt((blended_red - target_red) ** 2 +
+                                           (blended_green - target_green) ** 2 +
+                                           (blended_blue - target_blue) ** 2)
+
+            total_score += original_pixel_difference - new_pixel_difference
+
+    # penalize degenerate rectangles
+    if count_pixels < 4:
+        return -1.0, average_rgb, poly_y_min, scanline_x_intersects_array
+
+    return total_score, average_rgb, poly_y_min, scanline_x_intersects_array
+
+
+
+def get_score_avg_rgb_ymin_and_scanline_xintersect(rect_list, target_rgba, texture_greyscale_alpha, current_rgba,
+                                                   scanline_buffer=None):
     """
     Function is called in main loop to reduce clutter
 
     Returns score, average_rgb and scanline_x_intersects of a [x, y, h, w, theta] rect list 
+    If scanline_buffer (np.int32 array of shape (H, 2)) is given, the scanline x intersects are written
+    into it and returned as a view, otherwise a new array is allocated
     """
-    # 1) Find vertices of rectangle
+    # Polygon, scanlines, average rgb and score are computed in one compiled call
     x, y, h, w, theta = rect_list
-    h, w, theta = np.float32(h), np.float32(w), np.float32(theta)
-    rect_vertices = rectangle_to_polygon(x, y, h, w, theta)
-    # 2) Find x-intersects for every scanline and the miny of rectangle
-    canvas_height, canvas_width = current_rgba.shape[0], current_rgba.shape[1]
-    y_min, y_max, scanline_x_intersects_array = get_y_index_bounds_and_scanline_x_intersects(rect_vertices, canvas_height, canvas_width)
-    # 3) Find the average rgb value
-    average_rgb = get_average_rgb_value(target_rgba, texture_greyscale_alpha, scanline_x_intersects_array, y_min, *rect_list)
-    # 4) Score the rectangle
-    score = get_score_of_rectangle(target_rgba, texture_greyscale_alpha, current_rgba, scanline_x_intersects_array, y_min, average_rgb, *rect_list)
-    return score, average_rgb, y_min, scanline_x_intersects_array
+    if scanline_buffer is None:
+        return score_rectangle(target_rgba, texture_greyscale_alpha, current_rgba,
+                               x, y, np.float32(h), np.float32(w), np.float32(theta))
+    return score_rectangle_into(target_rgba, texture_greyscale_alpha, current_rgba,
+                                x, y, np.float32(h), np.float32(w), np.float32(theta), scanline_buffer)
 
 # Draws the best rect list onto canvas
 def update_canvas_with_best_rect(rect_list, target_rgba, texture_greyscale_alpha, current_rgba):
@@ -550,10 +550,12 @@ def get_approximate_fps_if_reduced(full_path_to_gif, max_number_of_extracted_fra
     if max_number_of_extracted_frames <= 1:
         raise ValueError("max_number_of_extracted_frames must be greater than 1.")
 
-    if not os.path.exists(full_path_to_gif):
-        raise FileNotFoundError(f"GIF file not found: {full_path_to_gif}")
+    try:
+        gif = Image.open(full_path_to_gif)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"GIF file not found: {full_path_to_gif}") from None
 
-    with Image.open(full_path_to_gif) as gif:
+    with gif:
         # Count total frames in GIF
         total_frames = 0
         try: